@@ -51,6 +51,8 @@ with open(API_DIR.joinpath("fastplotlib.rst"), "w") as f:
 
         ".. autofunction:: fastplotlib.pause_events\n\n"
         
+        ".. autofunction:: fastplotlib.batch_update\n\n"
+        
         ".. autofunction:: fastplotlib.enumerate_adapters\n\n"
         
         ".. autofunction:: fastplotlib.select_adapter\n\n"
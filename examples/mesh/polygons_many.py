@@ -0,0 +1,51 @@
+"""
+Many polygons
+=============
+
+Draw thousands of cell outlines, such as the regions of interest from a segmentation, with a single
+PolygonsGraphic. Click a cell to hide it, the polygons are not triangulated again.
+"""
+
+# test_example = false
+# sphinx_gallery_pygfx_docs = 'screenshot'
+
+import fastplotlib as fpl
+import numpy as np
+
+rng = np.random.default_rng(0)
+
+
+def make_cell(center, radius: float, n_points: int = 40) -> np.ndarray:
+    # irregular, non-convex blob
+    theta = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    r = radius * (1 + 0.25 * np.sin(3 * theta + rng.uniform(0, 2 * np.pi)))
+    r *= rng.uniform(0.85, 1.0, n_points)
+
+    return np.column_stack([r * np.cos(theta), r * np.sin(theta)]) + center
+
+
+# 100 x 50 grid of cells
+centers = (
+    np.stack(np.meshgrid(np.arange(100), np.arange(50)), axis=-1).reshape(-1, 2) * 10
+)
+cells = [make_cell(c, rng.uniform(2, 4.5)) for c in centers]
+
+figure = fpl.Figure(size=(700, 560))
+
+polygons = figure[0, 0].add_polygons(cells, colors="random")
+
+
+@polygons.add_event_handler("click")
+def hide_cell(ev):
+    index = polygons.get_polygon_index(ev.pick_info["face_index"])
+    polygons.visibility[index] = False
+
+
+figure.show()
+
+
+# NOTE: fpl.loop.run() should not be used for interactive sessions
+# See the "JupyterLab and IPython" section in the user guide
+if __name__ == "__main__":
+    print(__doc__)
+    fpl.loop.run()
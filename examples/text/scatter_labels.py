@@ -0,0 +1,48 @@
+"""
+Labels for many points
+======================
+
+Label every point of a large scatter plot with a single LabelsGraphic. Labels that overlap other labels
+are hidden, zoom in to see more labels.
+"""
+
+# test_example = false
+# sphinx_gallery_pygfx_docs = 'screenshot'
+
+import numpy as np
+import fastplotlib as fpl
+
+n_clusters = 10
+n_points = 2_000
+
+rng = np.random.default_rng(0)
+
+# points in clusters
+centers = rng.uniform(-100, 100, size=(n_clusters, 2))
+cluster_ids = rng.integers(0, n_clusters, size=n_points)
+data = centers[cluster_ids] + rng.normal(scale=10, size=(n_points, 2))
+
+figure = fpl.Figure(size=(700, 560))
+
+scatter = figure[0, 0].add_scatter(
+    data, sizes=4, cmap="tab10", cmap_transform=cluster_ids
+)
+
+# one label per point, colored by the cluster
+labels = figure[0, 0].add_labels(
+    data,
+    text=[f"cluster {c}: {i}" for i, c in enumerate(cluster_ids)],
+    font_sizes=12,
+    colors=scatter.colors.value,
+    anchor="bottom-left",
+    culling="overlap",
+)
+
+figure.show()
+
+
+# NOTE: fpl.loop.run() should not be used for interactive sessions
+# See the "JupyterLab and IPython" section in the user guide
+if __name__ == "__main__":
+    print(__doc__)
+    fpl.loop.run()
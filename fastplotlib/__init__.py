@@ -1,42 +1,100 @@
-from pathlib import Path
+import sys
+import importlib
 
 from ._version import __version__, version_info
 
-# this must be the first import for auto-canvas detection
-from .utils import loop  # noqa
-from .graphics import *
-from .graphics.features import GraphicFeatureEvent
-from .graphics.selectors import *
-from .graphics.utils import pause_events
-from .legends import *
-from .tools import *
-
-from .layouts import IMGUI
-
-if IMGUI:
-    # default to imgui figure if imgui_bundle is installed
-    from .layouts import ImguiFigure as Figure
-else:
-    from .layouts import Figure
-
-from .widgets import ImageWidget
-from .utils import config, enumerate_adapters, select_adapter, print_wgpu_report
-
-
-if len(enumerate_adapters()) < 1:
-    from warnings import warn
-
-    warn(
-        f"WGPU could not enumerate any adapters, fastplotlib will not work.\n"
-        f"This is caused by one of the following:\n"
-        f"1. You do not have a hardware GPU installed and you do not have "
-        f"software rendering (ex. lavapipe) installed either\n"
-        f"2. Your GPU drivers are not installed or something is wrong with your GPU driver installation, "
-        f"re-installing the latest drivers from your hardware vendor (probably Nvidia or AMD) may help.\n"
-        f"3. You are missing system libraries that are required for WGPU to access GPU(s), this is "
-        f"common in cloud computing environments.\n"
-        f"These two links can help you troubleshoot:\n"
-        f"https://wgpu-py.readthedocs.io/en/stable/start.html#platform-requirements\n"
-        f"https://fastplotlib.readthedocs.io/en/latest/user_guide/gpu.html\n",
-        RuntimeWarning,
-    )
+# public names are imported lazily on first attribute access so that `import fastplotlib` is cheap,
+# the graphics, layouts, widgets etc. and the gui backend are only imported when they are used
+
+# submodules whose entire __all__ is public, i.e. `from .graphics import *`
+_star_modules = [
+    ".graphics",
+    ".graphics.selectors",
+    ".legends",
+    ".tools",
+    ".widgets",
+]
+
+# submodules that only some names are imported from
+_lazy_names = {
+    # name of submodule: names imported from it
+    ".utils.gui": ["loop"],
+    ".graphics.features": ["GraphicFeatureEvent"],
+    ".graphics.utils": ["pause_events", "batch_update"],
+    ".layouts": ["IMGUI"],
+    ".utils": ["config", "enumerate_adapters", "select_adapter", "print_wgpu_report"],
+}
+
+_submodules = ["graphics", "layouts", "legends", "tools", "ui", "utils", "widgets"]
+
+
+def _find_submodule(name: str) -> str | None:
+    """submodule that a public name is imported from, star modules are imported in order until it is found"""
+    for module, names in _lazy_names.items():
+        if name in names:
+            return module
+
+    for module in _star_modules:
+        if name in importlib.import_module(module, __name__).__all__:
+            return module
+
+    return None
+
+
+def _get_all() -> list[str]:
+    names = ["Figure"]
+
+    for names_list in _lazy_names.values():
+        names += names_list
+
+    for module in _star_modules:
+        names += importlib.import_module(module, __name__).__all__
+
+    return names
+
+
+def _get_figure_class():
+    from .layouts import IMGUI
+
+    if IMGUI:
+        # default to imgui figure if imgui_bundle is installed
+        from .layouts import ImguiFigure as Figure
+    else:
+        from .layouts import Figure
+
+    return Figure
+
+
+def __getattr__(name: str):
+    if name == "Figure":
+        value = _get_figure_class()
+
+    elif name == "__all__":
+        value = _get_all()
+
+    elif name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    elif name.startswith("_"):
+        # private and dunder lookups, ex. from IPython, should not import the submodules
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    else:
+        module = _find_submodule(name)
+        if module is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module, __name__), name)
+
+    # cache so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals().keys(), *__getattr__("__all__"), *_submodules})
+
+
+if "ipykernel" in sys.modules:
+    # in notebooks the gui backend is selected at import, this displays the available adapters
+    from .utils import gui  # noqa
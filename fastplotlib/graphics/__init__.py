@@ -5,7 +5,9 @@ from .image import ImageGraphic
 from .image_volume import ImageVolumeGraphic
 from ._vectors import VectorsGraphic
 from .mesh import MeshGraphic, SurfaceGraphic, PolygonGraphic
+from .polygons import PolygonsGraphic
 from .text import TextGraphic
+from .labels import LabelsGraphic
 from .line_collection import LineCollection, LineStack
 
 
@@ -19,7 +21,9 @@ __all__ = [
     "MeshGraphic",
     "SurfaceGraphic",
     "PolygonGraphic",
+    "PolygonsGraphic",
     "TextGraphic",
+    "LabelsGraphic",
     "LineCollection",
     "LineStack",
 ]
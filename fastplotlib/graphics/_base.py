@@ -1,5 +1,6 @@
 from __future__ import annotations
 from collections import defaultdict
+from contextlib import contextmanager
 from functools import partial
 from typing import Any, Literal, TypeAlias, Callable
 import weakref
@@ -18,6 +19,7 @@ else:
 import pygfx
 
 from .features import (
+    GraphicFeature,
     BufferManager,
     Deleted,
     Name,
@@ -29,6 +31,7 @@ from .features import (
     Visible,
 )
 from ._axes import Axes
+from ._memory import MemoryItem, total_usage, usage_by_name, world_object_items
 
 HexStr: TypeAlias = str
 WorldObjectID: TypeAlias = int
@@ -274,6 +277,88 @@ class Graphic:
     def block_events(self, value: bool):
         self._block_events = value
 
+    def _fpl_get_features(self) -> list[GraphicFeature]:
+        """all feature instances of this graphic in its current mode"""
+        features = list()
+        for name in self._features.keys():
+            feature = getattr(self, f"_{name}", None)
+            if isinstance(feature, GraphicFeature):
+                features.append(feature)
+
+        return features
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager for batching feature updates.
+
+        GPU uploads of buffer ranges and feature events are deferred until the context manager exits.
+        Overlapping ranges are merged into single uploads and each feature that changed emits one
+        combined event.
+
+        Examples
+        --------
+
+        .. code-block:: py
+
+            with scatter.batch_update():
+                scatter.data[:, 1] = new_ys
+                scatter.colors = new_colors
+                scatter.sizes = new_sizes
+
+            # one upload and one event per feature happens here
+
+        """
+        features = self._fpl_get_features()
+
+        for feature in features:
+            feature._fpl_begin_batch()
+
+        try:
+            yield
+        finally:
+            for feature in features:
+                feature._fpl_end_batch()
+
+    def _fpl_memory_items(self) -> dict[str, list[MemoryItem]]:
+        """memory items of each feature, and of the world object for buffers that are not managed by a feature"""
+        items = defaultdict(list)
+
+        for name in self._features.keys():
+            feature = getattr(self, f"_{name}", None)
+            if isinstance(feature, GraphicFeature):
+                items[name] += feature._fpl_memory_items()
+
+        items["world_object"] += world_object_items(WORLD_OBJECTS[self._fpl_address])
+
+        return items
+
+    def memory_usage(self) -> dict[str, dict[str, int]]:
+        """
+        Host and GPU memory used by this graphic, in bytes, broken down by feature.
+
+        Each feature maps to a dict with the keys:
+
+            * ``"host"``: host arrays that are owned by the graphic, such as the isolated copy of the data
+            * ``"gpu"``: GPU buffers and textures that are owned by the graphic
+            * ``"shared_host"``: host arrays that are shared, such as user arrays used with ``isolated_buffer=False``
+              or memmaps
+            * ``"shared_gpu"``: GPU resources that are shared with other graphics, such as colormap textures
+
+        Each array or resource is counted once, by the first feature that uses it. Buffers that are not managed
+        by a feature are listed under ``"world_object"``, and the sum of all features is under ``"total"``.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            {feature_name: {"host": nbytes, "gpu": nbytes, "shared_host": nbytes, "shared_gpu": nbytes}}
+
+        """
+        usage = usage_by_name(self._fpl_memory_items())
+        usage["total"] = total_usage(usage.values())
+
+        return usage
+
     @property
     def world_object(self) -> pygfx.WorldObject:
         """Associated pygfx WorldObject. Always returns a proxy, real object cannot be accessed directly."""
@@ -295,6 +295,23 @@ class GraphicCollection(Graphic, CollectionProperties):
     def clear_event_handlers(self):
         self[:].clear_event_handlers()
 
+    def _fpl_get_features(self) -> list:
+        features = super()._fpl_get_features()
+
+        for g in self:
+            features.extend(g._fpl_get_features())
+
+        return features
+
+    def _fpl_memory_items(self) -> dict:
+        items = super()._fpl_memory_items()
+
+        for g in self:
+            for name, graphic_items in g._fpl_memory_items().items():
+                items[name] += graphic_items
+
+        return items
+
     def _fpl_add_plot_area_hook(self, plot_area):
         super()._fpl_add_plot_area_hook(plot_area)
 
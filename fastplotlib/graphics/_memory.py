@@ -0,0 +1,190 @@
+from typing import Container, Iterable, NamedTuple
+
+import numpy as np
+import pygfx
+
+from ..utils.functions import _CMAP_TEXTURES
+
+MEMORY_KEYS = ("host", "gpu", "shared_host", "shared_gpu")
+
+
+class MemoryItem(NamedTuple):
+    """a host array or GPU resource used by a graphic"""
+
+    # identifies the array or resource, items with the same key are the same memory
+    key: int
+
+    # "host" or "gpu"
+    kind: str
+
+    nbytes: int
+
+    # True if the memory is shared with the user or with other graphics, i.e. it is not owned by the graphic
+    shared: bool
+
+
+def _array_root(array: np.ndarray) -> np.ndarray:
+    """the array that owns the memory of a view"""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+
+    return array
+
+
+def _gpu_nbytes(resource: pygfx.Resource) -> int:
+    nbytes = resource.nbytes
+
+    if isinstance(resource, pygfx.Texture) and resource.format.startswith("3x"):
+        # RGB textures are padded to RGBA when they are uploaded
+        nbytes = nbytes // 3 * 4
+
+    return nbytes
+
+
+def _is_shared_resource(resource: pygfx.Resource) -> bool:
+    """resources from the process-wide caches are shared by all graphics that use them"""
+    return any(resource is t for t in _CMAP_TEXTURES.values())
+
+
+def array_items(array: np.ndarray, shared: bool = False) -> list[MemoryItem]:
+    """item for the host memory of an array, views are counted as the array that owns the memory"""
+    if not isinstance(array, np.ndarray) or array.dtype == object:
+        return list()
+
+    root = _array_root(array)
+
+    if not root.flags.owndata:
+        # wraps memory owned by another object, such as a memmap or a buffer
+        shared = True
+
+    return [MemoryItem(id(root), "host", root.nbytes, shared)]
+
+
+def resource_items(resource: pygfx.Resource, shared: bool = False) -> list[MemoryItem]:
+    """items for a pygfx Buffer or Texture, its GPU memory and the host array that it is uploaded from"""
+    shared = shared or _is_shared_resource(resource)
+
+    items = [MemoryItem(id(resource), "gpu", _gpu_nbytes(resource), shared)]
+
+    data = resource.data
+    if isinstance(data, memoryview):
+        data = data.obj
+
+    items += array_items(data, shared)
+
+    return items
+
+
+def collect_items(values: Iterable, shared: bool = False) -> list[MemoryItem]:
+    """items for all the arrays and resources in ``values``, including object arrays of resources"""
+    items = list()
+
+    for value in values:
+        if isinstance(value, pygfx.TextureMap):
+            value = value.texture
+
+        if isinstance(value, pygfx.Resource):
+            items += resource_items(value, shared)
+
+        elif isinstance(value, np.ndarray):
+            if value.dtype == object:
+                # ex: TextureArray buffer
+                items += collect_items(value.ravel(), shared)
+            else:
+                items += array_items(value, shared)
+
+    return items
+
+
+def world_object_items(world_object: pygfx.WorldObject) -> list[MemoryItem]:
+    """items for the geometry buffers and material textures of a world object and its children"""
+    items = list()
+
+    for wo in world_object.iter():
+        values = list()
+
+        if wo.geometry is not None:
+            values += [getattr(wo.geometry, name) for name in wo.geometry.keys()]
+
+        if wo.material is not None:
+            values.append(getattr(wo.material, "map", None))
+
+        items += collect_items(values)
+
+    return items
+
+
+def summarize(items: Iterable[MemoryItem]) -> dict[str, int]:
+    """total bytes of each kind, each array or resource is counted once"""
+    usage = dict.fromkeys(MEMORY_KEYS, 0)
+
+    seen = set()
+    for item in items:
+        if item.key in seen:
+            continue
+        seen.add(item.key)
+
+        kind = f"shared_{item.kind}" if item.shared else item.kind
+        usage[kind] += item.nbytes
+
+    return usage
+
+
+def usage_by_name(
+    items: dict[str, list[MemoryItem]],
+    seen: set[int] = None,
+    shared_keys: Container[int] = (),
+) -> dict[str, dict[str, int]]:
+    """
+    summarized usage of each name in ``items``, each item is counted by the first name that uses it,
+    "world_object" is last since it only claims what is not managed by a feature.
+
+    Items in ``seen`` are skipped and ``seen`` is updated in place. Items with a key in ``shared_keys``
+    are counted as shared.
+    """
+    if seen is None:
+        seen = set()
+
+    names = [name for name in items.keys() if name != "world_object"]
+    if "world_object" in items.keys():
+        names.append("world_object")
+
+    usage = dict()
+    for name in names:
+        name_items = list()
+        for item in items[name]:
+            if item.key in seen:
+                continue
+
+            if item.key in shared_keys:
+                item = item._replace(shared=True)
+
+            name_items.append(item)
+
+        seen.update(item.key for item in name_items)
+
+        summary = summarize(name_items)
+        if any(summary.values()):
+            usage[name] = summary
+
+    return usage
+
+
+def total_usage(usages: Iterable[dict[str, int]]) -> dict[str, int]:
+    """sum of usage dicts"""
+    total = dict.fromkeys(MEMORY_KEYS, 0)
+
+    for usage in usages:
+        for key in MEMORY_KEYS:
+            total[key] += usage[key]
+
+    return total
+
+
+def format_bytes(nbytes: int) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if nbytes < 1024 or unit == "GB":
+            break
+        nbytes /= 1024
+
+    return f"{nbytes:.1f} {unit}" if unit != "B" else f"{nbytes} B"
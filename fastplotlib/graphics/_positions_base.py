@@ -1,4 +1,4 @@
-from typing import Any, Sequence
+from typing import Any, Literal, Sequence
 
 import numpy as np
 
@@ -9,6 +9,7 @@ from .features import (
     VertexColors,
     UniformColor,
     VertexCmap,
+    VertexCmapTexture,
     SizeSpace,
 )
 
@@ -26,8 +27,8 @@ class PositionsGraphic(Graphic):
         self._data[:] = value
 
     @property
-    def colors(self) -> VertexColors | pygfx.Color:
-        """Get or set the colors"""
+    def colors(self) -> VertexColors | pygfx.Color | None:
+        """Get or set the colors, ``None`` if the ``cmap_mode`` is 'texture'"""
         if isinstance(self._colors, VertexColors):
             return self._colors
 
@@ -42,8 +43,23 @@ class PositionsGraphic(Graphic):
         elif isinstance(self._colors, UniformColor):
             self._colors.set_value(self, value)
 
+        else:
+            raise AttributeError(
+                "colors cannot be set when `cmap_mode` is 'texture', set the `cmap` or `cmap.transform` instead"
+            )
+
     @property
-    def cmap(self) -> VertexCmap:
+    def cmap_mode(self) -> str:
+        """
+        How the cmap is applied, cannot be changed after the graphic is created.
+
+        * "vertex": cmap colors are computed on the CPU and stored in the per-vertex RGBA colors buffer
+        * "texture": one float per vertex is stored and the cmap is sampled from a 1D texture on the GPU
+        """
+        return self._cmap_mode
+
+    @property
+    def cmap(self) -> VertexCmap | VertexCmapTexture:
         """
         Control the cmap or cmap transform
 
@@ -78,6 +94,7 @@ class PositionsGraphic(Graphic):
         uniform_color: bool = False,
         cmap: str | VertexCmap = None,
         cmap_transform: np.ndarray = None,
+        cmap_mode: Literal["vertex", "texture"] = "vertex",
         isolated_buffer: bool = True,
         size_space: str = "screen",
         *args,
@@ -91,7 +108,39 @@ class PositionsGraphic(Graphic):
         if cmap_transform is not None and cmap is None:
             raise ValueError("must pass `cmap` if passing `cmap_transform`")
 
-        if cmap is not None:
+        if cmap_mode not in ("vertex", "texture"):
+            raise ValueError(
+                f"`cmap_mode` must be one of: 'vertex' or 'texture', you have passed: {cmap_mode}"
+            )
+
+        self._cmap_mode = cmap_mode
+
+        if cmap_mode == "texture":
+            # cmap is sampled from a texture on the GPU, there are no per-vertex colors
+            if uniform_color:
+                raise TypeError(
+                    "Cannot use `cmap_mode='texture'` if uniform_color=True"
+                )
+
+            if isinstance(cmap, VertexCmapTexture):
+                # use existing cmap instance
+                self._cmap = cmap
+            elif isinstance(cmap, str):
+                self._cmap = VertexCmapTexture(
+                    cmap,
+                    transform=cmap_transform,
+                    n_datapoints=self._data.value.shape[0],
+                    isolated_buffer=isolated_buffer,
+                )
+            else:
+                raise TypeError(
+                    "must pass a <str> `cmap` name or an existing `VertexCmapTexture` instance "
+                    "if `cmap_mode` is 'texture'"
+                )
+
+            self._colors = None
+
+        elif cmap is not None:
             # if a cmap is specified it overrides colors argument
             if uniform_color:
                 raise TypeError("Cannot use cmap if uniform_color=True")
@@ -85,7 +85,7 @@ class VectorsGraphic(Graphic):
             )
 
         self._positions = VectorPositions(positions)
-        self._directions = VectorDirections(directions)
+        self._directions = VectorDirections(directions, positions=self._positions)
 
         if vector_shape_options is not None:
             required = {"cone_radius", "cone_height", "stalk_radius", "stalk_height"}
@@ -134,21 +134,9 @@ class VectorsGraphic(Graphic):
 
         world_object = pygfx.InstancedMesh(geometry, material, n_vectors)
 
-        magnitudes = np.linalg.norm(self.directions[:], axis=1, ord=2)
-
-        for i in range(n_vectors):
-            # get quaternion to rotate vector to new direction
-            rotation = la.quat_from_vecs(
-                self._directions.init_direction, self._directions[i]
-            )
-            # get the new transform
-            transform = la.mat_compose(
-                self._positions.value[i], rotation, magnitudes[i]
-            )
-            # set the buffer
-            world_object.instance_buffer.data["matrix"][i] = transform.T
-
-        world_object.instance_buffer.update_full()
+        # the features manage the instance transforms, this also sets the initial transforms
+        self._positions._fpl_set_instance_buffer(world_object.instance_buffer)
+        self._directions._fpl_set_instance_buffer(world_object.instance_buffer)
 
         self._set_world_object(world_object)
 
@@ -4,6 +4,7 @@ from ._positions import (
     SizeSpace,
     VertexPositions,
     VertexCmap,
+    VertexCmapTexture,
 )
 from ._mesh import (
     MeshIndices,
@@ -14,6 +15,7 @@ from ._mesh import (
     surface_data_to_mesh,
     triangulate_polygon,
 )
+from ._normals import VertexNormals, compute_vertex_normals
 from ._line import Thickness
 from ._scatter import (
     VertexMarkers,
@@ -50,6 +52,7 @@ from ._vectors import (
     VectorPositions,
     VectorDirections,
 )
+from ._polygons import PolygonColors, PolygonVisibility
 
 from ._base import (
     GraphicFeature,
@@ -64,6 +67,7 @@ from ._text import (
     TextFaceColor,
     TextOutlineColor,
     TextOutlineThickness,
+    LabelsText,
 )
 
 from ._selection_features import (
@@ -80,9 +84,11 @@ __all__ = [
     "SizeSpace",
     "VertexPositions",
     "VertexCmap",
+    "VertexCmapTexture",
     "MeshIndices",
     "MeshCmap",
     "SurfaceData",
+    "VertexNormals",
     "Thickness",
     "VertexMarkers",
     "UniformMarker",
@@ -108,11 +114,14 @@ __all__ = [
     "VolumeSlicePlane",
     "VectorPositions",
     "VectorDirections",
+    "PolygonColors",
+    "PolygonVisibility",
     "TextData",
     "FontSize",
     "TextFaceColor",
     "TextOutlineColor",
     "TextOutlineThickness",
+    "LabelsText",
     "LinearSelectionFeature",
     "LinearRegionSelectionFeature",
     "RectangleSelectionFeature",
@@ -8,6 +8,8 @@ from rendercanvas.base import log_exception
 
 import pygfx
 
+from .._memory import MemoryItem, collect_items
+
 
 def to_gpu_supported_dtype(array):
     """
@@ -49,6 +51,9 @@ class GraphicFeatureEvent(pygfx.Event):
 
 
 class GraphicFeature:
+    # True if the user's array is used as the buffer instead of a copy
+    _shared_buffer: bool = False
+
     def __init__(self, property_name: str, **kwargs):
         self._property_name = property_name
         self._event_handlers = list()
@@ -57,6 +62,10 @@ class GraphicFeature:
         # used by @block_reentrance decorator to block re-entrance into set_value functions
         self._reentrant_block: bool = False
 
+        # used by batch updates, events are deferred while the depth is > 0
+        self._batch_depth: int = 0
+        self._batched_events: list[GraphicFeatureEvent] = list()
+
     @property
     def value(self):
         """Graphic Feature value, must be implemented in subclass"""
@@ -66,6 +75,16 @@ class GraphicFeature:
         """Graphic Feature value setter, must be implemented in subclass"""
         raise NotImplementedError
 
+    def _fpl_memory_items(self) -> list[MemoryItem]:
+        """host arrays and GPU buffers and textures held by this feature"""
+        items = list()
+
+        if self._shared_buffer:
+            # the user's array, counted first so that it is marked as shared
+            items += collect_items([self.value], shared=True)
+
+        return items + collect_items(self.__dict__.values())
+
     def block_events(self, val: bool):
         """
         Block all events from this feature
@@ -121,10 +140,39 @@ class GraphicFeature:
         """Clear all event handlers"""
         self._event_handlers.clear()
 
+    def _fpl_begin_batch(self):
+        """Start deferring events, batches can be nested"""
+        self._batch_depth += 1
+
+    def _fpl_end_batch(self):
+        """End a batch, pending work is flushed when the outermost batch ends"""
+        if self._batch_depth < 1:
+            raise RuntimeError("`_fpl_end_batch()` called without a matching begin")
+
+        self._batch_depth -= 1
+
+        if self._batch_depth == 0:
+            self._flush_batch()
+
+    def _flush_batch(self):
+        events = self._batched_events
+        self._batched_events = list()
+
+        if len(events) < 1:
+            return
+
+        # the last event represents the final state of the feature
+        self._call_event_handlers(events[-1])
+
     def _call_event_handlers(self, event_data: GraphicFeatureEvent):
         if self._block_events:
             return
 
+        if self._batch_depth > 0:
+            # dispatched once when the batch exits
+            self._batched_events.append(event_data)
+            return
+
         for func in self._event_handlers:
             with log_exception(
                 f"Error during handling {self.__class__.__name__} event"
@@ -140,9 +188,18 @@ class BufferManager(GraphicFeature):
         data: NDArray | pygfx.Buffer,
         buffer_type: Literal["buffer", "texture", "texture-array"] = "buffer",
         isolated_buffer: bool = True,
+        owns_buffer: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
+
+        # the user's array is used as the buffer unless it is copied, or ``data`` was allocated by the
+        # subclass (``owns_buffer``), or it is a pygfx.Buffer managed by another BufferManager,
+        # example: VertexCmap manages VertexColors
+        self._shared_buffer = not (
+            isolated_buffer or owns_buffer or isinstance(data, pygfx.Resource)
+        )
+
         if isolated_buffer and not isinstance(data, pygfx.Resource):
             # useful if data is read-only, example: memmaps
             bdata = np.zeros(data.shape, dtype=data.dtype)
@@ -164,6 +221,9 @@ class BufferManager(GraphicFeature):
 
         self._event_handlers: list[callable] = list()
 
+        # (offset, size) ranges marked for upload during a batch update
+        self._pending_ranges: list[tuple[int, int]] = list()
+
     @property
     def value(self) -> np.ndarray:
         """numpy array object representing the data managed by this buffer"""
@@ -291,13 +351,73 @@ class BufferManager(GraphicFeature):
 
         if isinstance(key, slice):
             if key == slice(None):
+                if self._batch_depth > 0:
+                    self._pending_ranges.append((0, upper_bound))
+                    return
                 # directly update full, don't need to figure out chunks
                 self.buffer.update_full()
                 return
 
-        offset, size = self._parse_offset_size(key, upper_bound)
+        parsed = self._parse_offset_size(key, upper_bound)
+        if parsed is None:
+            # empty fancy index, nothing to upload
+            return
+
+        offset, size = parsed
+
+        if self._batch_depth > 0:
+            # defer upload until the batch exits
+            self._pending_ranges.append((int(offset), int(size)))
+            return
+
         self.buffer.update_range(offset=offset, size=size)
 
+    def _merge_pending_ranges(self) -> list[tuple[int, int]]:
+        """merge overlapping or adjacent pending (offset, size) ranges"""
+        merged = list()
+        for offset, size in sorted(self._pending_ranges):
+            stop = offset + size
+            if len(merged) > 0 and offset <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([offset, stop])
+
+        return [(start, stop - start) for start, stop in merged]
+
+    def _flush_batch(self):
+        ranges = self._merge_pending_ranges()
+        self._pending_ranges.clear()
+
+        upper_bound = self.value.shape[0]
+
+        for offset, size in ranges:
+            if offset == 0 and size >= upper_bound:
+                self.buffer.update_full()
+            else:
+                self.buffer.update_range(offset=offset, size=size)
+
+        events = self._batched_events
+
+        if len(events) < 2 or len(ranges) < 1:
+            # nothing to combine, emits the last event if there is one
+            super()._flush_batch()
+            return
+
+        self._batched_events = list()
+
+        # one event that covers every range which changed during the batch
+        key = slice(ranges[0][0], ranges[-1][0] + ranges[-1][1])
+        event_info = {
+            "key": key,
+            "value": self.value[key],
+        }
+
+        if "user_value" in events[-1].info:
+            event_info["user_value"] = event_info["value"]
+
+        event = GraphicFeatureEvent(events[-1].type, info=event_info)
+        self._call_event_handlers(event)
+
     def _emit_event(self, type: str, key, value):
         if len(self._event_handlers) < 1:
             return
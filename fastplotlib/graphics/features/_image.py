@@ -7,10 +7,7 @@ import numpy as np
 import pygfx
 from ._base import GraphicFeature, GraphicFeatureEvent, block_reentrance
 
-from ...utils import (
-    make_colors,
-    get_cmap_texture,
-)
+from ...utils import get_cmap_texture
 
 
 class TextureArray(GraphicFeature):
@@ -36,11 +33,17 @@ class TextureArray(GraphicFeature):
     def __init__(self, data, isolated_buffer: bool = True, property_name: str = "data"):
         super().__init__(property_name=property_name)
 
+        user_data = data
         data = self._fix_data(data)
 
         shared = pygfx.renderers.wgpu.get_shared()
         self._texture_limit_2d = shared.device.limits["max-texture-dimension-2d"]
 
+        # _fix_data() can copy the user's array, in which case the buffer is not shared with the user
+        self._shared_buffer = not isolated_buffer and np.may_share_memory(
+            data, user_data
+        )
+
         if isolated_buffer:
             # useful if data is read-only, example: memmaps
             self._value = np.zeros(data.shape, dtype=data.dtype)
@@ -243,9 +246,9 @@ class ImageCmap(GraphicFeature):
 
     @block_reentrance
     def set_value(self, graphic, value: str):
-        new_colors = make_colors(256, value)
-        graphic._material.map.texture.data[:] = new_colors
-        graphic._material.map.texture.update_range((0, 0, 0), size=(256, 1, 1))
+        # cmap textures are shared between graphics, swap the texture instead of writing into it
+        self.texture = get_cmap_texture(value)
+        graphic._material.map.texture = self.texture
 
         self._value = value
         event = GraphicFeatureEvent(type=self._property_name, info={"value": value})
@@ -11,7 +11,7 @@ from ._base import (
 )
 
 from ._positions import VertexPositions
-from ...utils.functions import get_cmap
+from ...utils.functions import get_cmap, get_cmap_texture
 from ...utils.triangulation import triangulate
 
 
@@ -24,7 +24,12 @@ def resolve_cmap_mesh(cmap) -> pygfx.TextureMap | None:
         pygfx_cmap = cmap
     elif isinstance(cmap, pygfx.Texture):
         pygfx_cmap = pygfx.TextureMap(cmap)
-    elif isinstance(cmap, (str, dict)):
+    elif isinstance(cmap, str):
+        # shared cmap texture
+        pygfx_cmap = pygfx.TextureMap(
+            get_cmap_texture(cmap), filter="nearest", wrap="clamp"
+        )
+    elif isinstance(cmap, dict):
         pygfx_cmap = pygfx.cm.create_colormap(get_cmap(cmap))
     else:
         map = np.asarray(cmap)
@@ -162,6 +167,11 @@ def surface_data_to_mesh(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return positions, indices
 
 
+def _changed_rows(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """indices of the rows of the surface grid that differ between two data arrays of the same shape"""
+    return np.flatnonzero((old != new).reshape(old.shape[0], -1).any(axis=1))
+
+
 class SurfaceData(GraphicFeature):
     event_info_spec = [
         {
@@ -172,7 +182,8 @@ class SurfaceData(GraphicFeature):
     ]
 
     def __init__(self, value: np.ndarray | Sequence, property_name: str = "data"):
-        self._value = np.asarray(value, dtype=np.float32)
+        # copy, used to find the rows that changed when new data is set
+        self._value = np.array(value, dtype=np.float32)
         super().__init__(property_name=property_name)
 
     @property
@@ -181,31 +192,88 @@ class SurfaceData(GraphicFeature):
 
     @block_reentrance
     def set_value(self, graphic, value: np.ndarray):
-        positions, indices = surface_data_to_mesh(value)
+        value = np.asarray(value, dtype=np.float32)
 
-        graphic.positions = positions
-        graphic.indices = indices
+        if value.shape != self._value.shape:
+            # new grid, new topology
+            positions, indices = surface_data_to_mesh(value)
 
-        # if cmap is a 1D texture we need to set the texcoords again using new z values
-        if graphic.world_object.material.map is not None:
-            if graphic.world_object.material.map.texture.dim == 1:
-                mapcoords = positions[:, 2]
+            graphic.positions = positions
+            graphic.indices = indices
 
-                if graphic.clim is None:
-                    clim = mapcoords.min(), mapcoords.max()
+            self._set_mapcoords(graphic, positions[:, 2], 0)
+
+            self._value = np.array(value)
+
+        else:
+            # same grid, the indices are reused and only the rows of the grid that changed are uploaded
+            if value is self._value:
+                # modified in place, ex: graphic.data[5:10] = 0; graphic.data = graphic.data
+                rows = np.arange(value.shape[0])
+            else:
+                rows = _changed_rows(self._value, value)
+
+            if rows.size > 0:
+                w = value.shape[1]
+                start, stop = rows[0] * w, (rows[-1] + 1) * w
+                region = value[rows[0] : rows[-1] + 1]
+
+                if value.ndim == 2:
+                    # only the z column
+                    graphic.positions[start:stop, 2] = region.ravel()
+                    z = region.ravel()
                 else:
-                    clim = graphic.clim
-                mapcoords = (mapcoords - clim[0]) / (clim[1] - clim[0])
-                graphic.mapcoords = mapcoords
+                    graphic.positions[start:stop] = region.reshape(-1, 3)
+                    z = region[..., 2].ravel()
 
-        self._value = value
+                self._set_mapcoords(graphic, z, start)
+
+                self._value[rows[0] : rows[-1] + 1] = region
 
         event = GraphicFeatureEvent(type=self._property_name, info={"value": value})
         self._call_event_handlers(event)
 
+    def _set_mapcoords(self, graphic, z: np.ndarray, offset: int):
+        """set the mapcoords of the vertices ``offset:offset + z.size`` if the cmap is a 1D texture"""
+        # if cmap is a 1D texture we need to set the texcoords again using new z values
+        if graphic.world_object.material.map is None:
+            return
+
+        if graphic.world_object.material.map.texture.dim != 1:
+            return
+
+        if graphic.clim is None or graphic.mapcoords is None:
+            # clim is the range of the full data, set all mapcoords
+            mapcoords = graphic.positions.value[:, 2]
+            if graphic.clim is None:
+                clim = mapcoords.min(), mapcoords.max()
+            else:
+                clim = graphic.clim
+            graphic.mapcoords = (mapcoords - clim[0]) / (clim[1] - clim[0])
+            return
+
+        clim = graphic.clim
+        buffer: pygfx.Buffer = graphic._mapcoords
+
+        if buffer.nitems != graphic.positions.value.shape[0]:
+            # number of vertices changed
+            mapcoords = graphic.positions.value[:, 2]
+            graphic.mapcoords = (mapcoords - clim[0]) / (clim[1] - clim[0])
+            return
+
+        buffer.data[offset : offset + z.size] = (z - clim[0]) / (clim[1] - clim[0])
+        buffer.update_range(offset, z.size)
+
+
+def triangulate_polygon(
+    data: np.ndarray | Sequence, reuse_indices: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    vertices of shape [n_vertices , 2] -> positions, indices
 
-def triangulate_polygon(data: np.ndarray | Sequence):
-    """vertices of shape [n_vertices , 2] -> positions, indices"""
+    If ``reuse_indices`` from a previous triangulation are still valid for the new vertices they are
+    returned as is, useful when only the vertex positions of a polygon change.
+    """
     data = np.asarray(data, dtype=np.float32)
 
     err_msg = (
@@ -218,15 +286,62 @@ def triangulate_polygon(data: np.ndarray | Sequence):
         raise ValueError(err_msg)
 
     if len(data) >= 3:
-        indices = triangulate(data)
+        indices = triangulate(data, reuse=reuse_indices)
+        if indices.ndim == 1:
+            indices = indices.reshape(-1, 3)
     else:
-        indices = np.arange((0, 3), np.int32)
+        indices = np.zeros((0, 3), np.int32)
 
     data = np.column_stack([data, np.zeros(data.shape[0], dtype=np.float32)])
 
     return data, indices
 
 
+def update_polygon_buffers(
+    geometry: pygfx.Geometry,
+    positions: np.ndarray,
+    indices: np.ndarray,
+    indices_changed: bool = True,
+):
+    """
+    Set the positions and indices of a polygon geometry, the buffers are resized by factors of 2
+    so that they are not recreated each time the number of vertices changes.
+    """
+    # Need larger (or smaller) buffer? Scale up/down with factors of 2.
+    need_position_size = 2 ** int(np.ceil(np.log2(max(8, len(positions)))))
+    if need_position_size != geometry.positions.nitems:
+        arr = np.zeros((need_position_size, 3), np.float32)
+        geometry.positions = pygfx.Buffer(arr)
+        indices_changed = True
+    need_indices_size = 2 ** int(np.ceil(np.log2(max(8, len(indices)))))
+    if need_indices_size != geometry.indices.nitems:
+        arr = np.zeros((need_indices_size, 3), np.int32)
+        geometry.indices = pygfx.Buffer(arr)
+        indices_changed = True
+
+    n_positions = geometry.positions.draw_range[1]
+
+    geometry.positions.data[: len(positions)] = positions
+    if len(positions) == n_positions:
+        # same number of vertices, only upload the vertices
+        geometry.positions.update_range(0, len(positions))
+    else:
+        geometry.positions.data[len(positions) :] = (
+            positions[-1] if len(positions) else (0, 0, 0)
+        )
+        geometry.positions.draw_range = 0, len(positions)
+        geometry.positions.update_full()
+
+    if not indices_changed:
+        # triangulation was reused
+        return
+
+    geometry.indices.data[: len(indices)] = indices
+    geometry.indices.data[len(indices) :] = 0
+    geometry.indices.draw_range = 0, len(indices)
+    geometry.indices.update_full()
+
+
 class PolygonData(GraphicFeature):
     event_info_spec = [
         {
@@ -236,8 +351,15 @@ class PolygonData(GraphicFeature):
         },
     ]
 
-    def __init__(self, value: np.ndarray, property_name: str = "data"):
+    def __init__(
+        self,
+        value: np.ndarray,
+        indices: np.ndarray | None = None,
+        property_name: str = "data",
+    ):
         self._value = np.asarray(value, dtype=np.float32)
+        # indices of the current triangulation, reused when possible
+        self._indices = indices
         super().__init__(property_name=property_name)
 
     @property
@@ -248,31 +370,18 @@ class PolygonData(GraphicFeature):
     def set_value(self, graphic, value: np.ndarray | Sequence):
         value = np.asarray(value, dtype=np.float32)
 
-        positions, indices = triangulate_polygon(value)
-
-        geometry = graphic.world_object.geometry
+        # reuse the triangulation if the polygon topology has not changed, ex: vertices were only moved
+        positions, indices = triangulate_polygon(value, reuse_indices=self._indices)
 
-        # Need larger (or smaller) buffer? Scale up/down with factors of 2.
-        need_position_size = 2 ** int(np.ceil(np.log2(max(8, len(positions)))))
-        if need_position_size != geometry.positions.nitems:
-            arr = np.zeros((need_position_size, 3), np.float32)
-            geometry.positions = pygfx.Buffer(arr)
-        need_indices_size = 2 ** int(np.ceil(np.log2(max(8, len(indices)))))
-        if need_indices_size != geometry.indices.nitems:
-            arr = np.zeros((need_indices_size, 3), np.int32)
-            geometry.indices = pygfx.Buffer(arr)
-
-        geometry.positions.data[: len(positions)] = positions
-        geometry.positions.data[len(positions) :] = (
-            positions[-1] if len(positions) else (0, 0, 0)
+        update_polygon_buffers(
+            graphic.world_object.geometry,
+            positions,
+            indices,
+            indices_changed=indices is not self._indices,
         )
-        geometry.positions.draw_range = 0, len(positions)
-        geometry.positions.update_full()
 
-        geometry.indices.data[: len(indices)] = indices
-        geometry.indices.data[len(indices) :] = 0
-        geometry.indices.draw_range = 0, len(indices)
-        geometry.indices.update_full()
+        self._value = positions
+        self._indices = indices
 
         # send event
         if len(self._event_handlers) < 1:
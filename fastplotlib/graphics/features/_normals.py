@@ -0,0 +1,303 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from ._base import BufferManager, GraphicFeatureEvent
+from ._positions import VertexPositions
+
+
+def _triangles(indices: np.ndarray) -> np.ndarray:
+    """[n_faces, 3] or [n_faces, 4] mesh indices -> [n_triangles, 3], quads are split into 2 triangles"""
+    if indices.shape[1] == 4:
+        return np.concatenate([indices[:, [0, 1, 2]], indices[:, [0, 2, 3]]])
+
+    return indices
+
+
+def _face_normals(positions: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """unnormalized face normals, the length is proportional to the area so that larger faces weigh more"""
+    # float64 for the summation of the face normals
+    p0 = positions[triangles[:, 0], :3].astype(np.float64)
+    e1 = positions[triangles[:, 1], :3] - p0
+    e2 = positions[triangles[:, 2], :3] - p0
+
+    # cross product, faster than np.cross for many small vectors
+    normals = np.empty_like(e1)
+    normals[:, 0] = e1[:, 1] * e2[:, 2] - e1[:, 2] * e2[:, 1]
+    normals[:, 1] = e1[:, 2] * e2[:, 0] - e1[:, 0] * e2[:, 2]
+    normals[:, 2] = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+
+    return normals
+
+
+def _normalize(normals: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    norms[norms == 0] = (
+        1.0  # vertices that are not part of any face, or degenerate faces
+    )
+    return (normals / norms).astype(np.float32)
+
+
+def compute_vertex_normals(positions: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Compute the area weighted vertex normals of a mesh, vectorized over all faces.
+
+    Parameters
+    ----------
+    positions: np.ndarray
+        [n_vertices, 3] vertex positions
+
+    indices: np.ndarray
+        [n_faces, 3] triangles or [n_faces, 4] quads
+
+    Returns
+    -------
+    np.ndarray
+        [n_vertices, 3] unit vertex normals
+
+    """
+    positions = np.asarray(positions)
+    triangles = _triangles(np.asarray(indices))
+
+    face_normals = _face_normals(positions, triangles)
+
+    # scatter-add the face normals to the vertices, one bincount per component is much faster than np.add.at
+    normals = np.zeros((positions.shape[0], 3))
+    for corner in range(3):
+        for i in range(3):
+            normals[:, i] += np.bincount(
+                triangles[:, corner],
+                weights=face_normals[:, i],
+                minlength=positions.shape[0],
+            )
+
+    return _normalize(normals)
+
+
+class _VertexFaces:
+    """
+    Vertex to face adjacency of a mesh, used to recompute the normals of only the vertices around
+    the vertices that moved.
+
+    The (vertex, triangle) incidences are sorted by vertex, the triangles of vertex ``i`` are
+    ``triangles[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self, triangles: np.ndarray, n_vertices: int):
+        self.triangles = triangles
+
+        vertex_ids = triangles.ravel()
+        order = np.argsort(vertex_ids, kind="stable")
+
+        self.vertex_triangles = order // 3
+        self.offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(vertex_ids, minlength=n_vertices))]
+        )
+
+    def _gather(self, vertices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """triangles of each vertex, concatenated, and the number of triangles of each vertex"""
+        starts = self.offsets[vertices]
+        counts = self.offsets[vertices + 1] - starts
+
+        # concatenated ranges starts[i]:starts[i] + counts[i]
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        return self.vertex_triangles[np.repeat(starts, counts) + within], counts
+
+    def affected_vertices(self, vertices: np.ndarray) -> np.ndarray:
+        """vertices whose normals depend on the positions of the given vertices"""
+        triangles, _ = self._gather(vertices)
+        return np.unique(self.triangles[triangles].ravel())
+
+    def normals(self, positions: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+        """unit normals of the given vertices"""
+        triangles, counts = self._gather(vertices)
+
+        normals = np.zeros((vertices.size, 3))
+        has_faces = counts > 0
+
+        if triangles.size > 0:
+            face_normals = _face_normals(positions, self.triangles[triangles])
+
+            # sum the face normals of each vertex, the triangles of a vertex are contiguous
+            starts = (np.cumsum(counts) - counts)[has_faces]
+            normals[has_faces] = np.add.reduceat(face_normals, starts, axis=0)
+
+        return _normalize(normals)
+
+
+class VertexNormals(BufferManager):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice",
+            "description": "range of vertices whose normals were recomputed",
+        },
+        {
+            "dict key": "value",
+            "type": "np.ndarray",
+            "description": "new vertex normals",
+        },
+    ]
+
+    # meshes with at least this many vertices compute their normals in a worker thread
+    worker_threshold: int = 1_000_000
+
+    # recompute all normals if more than this fraction of the vertices moved
+    full_update_fraction: float = 0.25
+
+    def __init__(
+        self,
+        positions: VertexPositions,
+        indices: BufferManager,
+        property_name: str = "normals",
+    ):
+        """
+        Manages the vertex normals of a mesh, recomputed from the vertex positions and indices.
+
+        The normals are updated automatically when the ``positions`` or ``indices`` features change. If only
+        some vertices moved, only the normals of the vertices around them are recomputed and uploaded.
+        The normals of large meshes are computed in a worker thread and applied before the next render.
+        """
+        self._positions = positions
+        self._indices = indices
+
+        self._adjacency: _VertexFaces | None = None
+
+        # pending computations in the worker thread, applied in order
+        self._pending: list[Future] = list()
+
+        # created on first use, one worker so that updates are applied in order
+        self._executor: ThreadPoolExecutor | None = None
+
+        # True if the worker thread can be used, i.e. the graphic applies pending normals before rendering
+        self._use_worker = False
+
+        super().__init__(
+            compute_vertex_normals(positions.value, indices.value),
+            isolated_buffer=False,
+            owns_buffer=True,
+            property_name=property_name,
+        )
+
+        positions.add_event_handler(self._positions_changed)
+        indices.add_event_handler(self._indices_changed)
+
+    def _get_adjacency(self) -> _VertexFaces:
+        if self._adjacency is None:
+            self._adjacency = _VertexFaces(
+                _triangles(self._indices.value), self._positions.value.shape[0]
+            )
+
+        return self._adjacency
+
+    def _indices_changed(self, ev: GraphicFeatureEvent):
+        # new topology
+        self._adjacency = None
+        self.update()
+
+    def _positions_changed(self, ev: GraphicFeatureEvent):
+        n_vertices = self._positions.value.shape[0]
+
+        key = ev.info["key"]
+        if isinstance(key, tuple):
+            key = key[0]
+
+        if isinstance(key, slice) and key == slice(None):
+            self.update()
+            return
+
+        parsed = self._parse_offset_size(key, n_vertices)
+        if parsed is None:
+            return
+
+        offset, size = parsed
+        self.update(int(offset), int(offset + size))
+
+    def update(self, start: int = 0, stop: int | None = None):
+        """
+        Recompute the normals after the positions of the vertices ``start:stop`` changed.
+
+        Called automatically when the positions or indices change.
+        """
+        n_vertices = self._positions.value.shape[0]
+        if stop is None:
+            stop = n_vertices
+
+        full = (stop - start) > self.full_update_fraction * n_vertices
+
+        if self._use_worker and n_vertices >= self.worker_threshold:
+            # copy, the positions can change again before the worker is done
+            positions = self._positions.value.copy()
+            indices = self._indices.value
+            adjacency = None if full else self._get_adjacency()
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="fpl-normals"
+                )
+
+            future = self._executor.submit(
+                self._compute, positions, indices, adjacency, start, stop
+            )
+            self._pending.append(future)
+            return
+
+        adjacency = None if full else self._get_adjacency()
+
+        self._apply(
+            *self._compute(
+                self._positions.value, self._indices.value, adjacency, start, stop
+            )
+        )
+
+    @staticmethod
+    def _compute(
+        positions: np.ndarray,
+        indices: np.ndarray,
+        adjacency: _VertexFaces | None,
+        start: int,
+        stop: int,
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """returns the vertices whose normals changed, or None for all vertices, and their normals"""
+        if adjacency is None:
+            return None, compute_vertex_normals(positions, indices)
+
+        vertices = adjacency.affected_vertices(np.arange(start, stop))
+        return vertices, adjacency.normals(positions, vertices)
+
+    def _apply(self, vertices: np.ndarray | None, normals: np.ndarray):
+        if vertices is None:
+            self.buffer.data[:] = normals
+            key = slice(None)
+        else:
+            if vertices.size == 0:
+                return
+
+            self.buffer.data[vertices] = normals
+            key = slice(int(vertices.min()), int(vertices.max()) + 1)
+
+        self._update_range(key)
+        self._emit_event(self._property_name, key, self.buffer.data[key])
+
+    def _fpl_apply_pending(self):
+        """apply the normals that were computed in the worker thread, called before rendering"""
+        while len(self._pending) > 0 and self._pending[0].done():
+            self._apply(*self._pending.pop(0).result())
+
+    def wait(self):
+        """wait for the normals that are computed in the worker thread and apply them"""
+        while len(self._pending) > 0:
+            self._apply(*self._pending.pop(0).result())
+
+    def _fpl_shutdown(self):
+        """stop the worker thread and discard pending normals, called when the graphic is deleted"""
+        self._use_worker = False
+        self._pending.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __len__(self):
+        return len(self.buffer.data)
@@ -0,0 +1,236 @@
+from typing import Sequence
+
+import numpy as np
+import pygfx
+
+from ._base import (
+    GraphicFeature,
+    GraphicFeatureEvent,
+    block_reentrance,
+)
+from .utils import parse_colors
+
+
+def _parse_polygons_key(key, n_polygons: int) -> np.ndarray:
+    """get the indices of the polygons that are modified by the key"""
+    if isinstance(key, tuple):
+        # only the first dimension is needed to determine which polygons are modified
+        key = key[0]
+
+    return np.arange(n_polygons)[key].reshape(-1)
+
+
+def _polygons_span(indices: np.ndarray, offsets: np.ndarray) -> tuple[int, int]:
+    """
+    (start, stop) of the contiguous range of vertices or faces that contains the given polygons,
+    ``offsets`` are the vertex or face offsets of all polygons
+    """
+    return int(offsets[indices.min()]), int(offsets[indices.max() + 1])
+
+
+def _parse_polygon_colors(colors, n_polygons: int) -> np.ndarray:
+    """parse colors to an [n_polygons, 4] RGBA array"""
+    colors = parse_colors(colors, n_polygons)
+
+    if colors.shape[1] == 3:
+        # ex: random colors
+        colors = np.column_stack([colors, np.ones(n_polygons, dtype=np.float32)])
+
+    return colors
+
+
+def _upload_span(buffer: pygfx.Buffer, start: int, stop: int):
+    if stop - start == buffer.nitems:
+        buffer.update_full()
+    elif stop > start:
+        buffer.update_range(start, stop - start)
+
+
+class PolygonColors(GraphicFeature):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which polygon colors were indexed/sliced",
+        },
+        {
+            "dict key": "value",
+            "type": "np.ndarray",
+            "description": "new polygon colors",
+        },
+    ]
+
+    def __init__(
+        self,
+        colors: str | np.ndarray | Sequence[float] | Sequence[str],
+        vertex_offsets: np.ndarray,
+        property_name: str = "colors",
+    ):
+        """
+        Manages the color of each polygon of a :class:`.PolygonsGraphic`.
+
+        The polygons are packed into one mesh with per vertex colors, setting the colors of some polygons
+        writes them to the vertices of these polygons and only uploads the modified range of vertices.
+        """
+        n_polygons = len(vertex_offsets) - 1
+
+        self._value = _parse_polygon_colors(colors, n_polygons)
+        self._vertex_offsets = vertex_offsets
+
+        # polygon of each vertex
+        self._vertex_polygon_ids = np.repeat(
+            np.arange(n_polygons), np.diff(vertex_offsets)
+        )
+
+        self._buffer = pygfx.Buffer(self._value[self._vertex_polygon_ids])
+
+        super().__init__(property_name=property_name)
+
+    @property
+    def value(self) -> np.ndarray:
+        """[n_polygons, 4] RGBA array"""
+        return self._value
+
+    @property
+    def buffer(self) -> pygfx.Buffer:
+        """per vertex colors buffer"""
+        return self._buffer
+
+    def __getitem__(self, item):
+        return self.value[item]
+
+    @block_reentrance
+    def __setitem__(self, key, value):
+        indices = _parse_polygons_key(key, self._value.shape[0])
+
+        if isinstance(key, tuple):
+            # directly setting RGBA components
+            self._value[key] = value
+        else:
+            self._value[key] = _parse_polygon_colors(value, indices.size)
+
+        if indices.size > 0:
+            start, stop = _polygons_span(indices, self._vertex_offsets)
+            self._buffer.data[start:stop] = self._value[
+                self._vertex_polygon_ids[start:stop]
+            ]
+            _upload_span(self._buffer, start, stop)
+
+        event = GraphicFeatureEvent(
+            type=self._property_name, info={"key": key, "value": value}
+        )
+        self._call_event_handlers(event)
+
+    def set_value(self, graphic, value):
+        self[:] = value
+
+
+class PolygonVisibility(GraphicFeature):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which polygon visibility was indexed/sliced",
+        },
+        {
+            "dict key": "value",
+            "type": "np.ndarray or bool",
+            "description": "new polygon visibility",
+        },
+    ]
+
+    def __init__(
+        self,
+        visibility: bool | np.ndarray | Sequence[bool],
+        faces: np.ndarray,
+        face_offsets: np.ndarray,
+        outline: pygfx.Buffer | None = None,
+        outline_offsets: np.ndarray | None = None,
+        property_name: str = "visibility",
+    ):
+        """
+        Manages the visibility of each polygon of a :class:`.PolygonsGraphic`.
+
+        Hidden polygons are not removed from the mesh, their faces are replaced by degenerate faces which are
+        not rendered. The faces of the triangulation are kept so that showing a polygon again does not
+        require triangulating it.
+
+        If the graphic has an outline, ``outline`` is the positions buffer of the outline line and
+        ``outline_offsets`` are the offsets of the outline vertices of each polygon. The outline vertices
+        of hidden polygons are set to NaN.
+        """
+        n_polygons = len(face_offsets) - 1
+
+        self._value = np.ones(n_polygons, dtype=bool)
+        self._value[:] = visibility
+
+        self._faces = faces
+        self._face_offsets = face_offsets
+
+        # polygon of each face
+        self._face_polygon_ids = np.repeat(np.arange(n_polygons), np.diff(face_offsets))
+
+        self._buffer = pygfx.Buffer(self._get_faces(0, len(faces)))
+
+        self._outline = outline
+        self._outline_offsets = outline_offsets
+
+        if outline is not None:
+            # outline positions of all polygons, used to show a polygon again
+            self._outline_positions = outline.data.copy()
+
+            # polygon of each outline vertex
+            self._outline_polygon_ids = np.repeat(
+                np.arange(n_polygons), np.diff(outline_offsets)
+            )
+
+            self._outline.data[:] = self._get_outline(0, outline.nitems)
+
+        super().__init__(property_name=property_name)
+
+    @property
+    def value(self) -> np.ndarray:
+        """[n_polygons] bool array"""
+        return self._value
+
+    @property
+    def buffer(self) -> pygfx.Buffer:
+        """mesh indices buffer"""
+        return self._buffer
+
+    def _get_faces(self, start: int, stop: int) -> np.ndarray:
+        """faces in the given range, the faces of hidden polygons are degenerate"""
+        shown = self._value[self._face_polygon_ids[start:stop]]
+        return np.where(shown[:, None], self._faces[start:stop], 0).astype(np.int32)
+
+    def _get_outline(self, start: int, stop: int) -> np.ndarray:
+        """outline positions in the given range, the positions of hidden polygons are NaN"""
+        shown = self._value[self._outline_polygon_ids[start:stop]]
+        return np.where(shown[:, None], self._outline_positions[start:stop], np.nan)
+
+    def __getitem__(self, item):
+        return self.value[item]
+
+    @block_reentrance
+    def __setitem__(self, key, value):
+        indices = _parse_polygons_key(key, self._value.shape[0])
+
+        self._value[key] = value
+
+        if indices.size > 0:
+            start, stop = _polygons_span(indices, self._face_offsets)
+            self._buffer.data[start:stop] = self._get_faces(start, stop)
+            _upload_span(self._buffer, start, stop)
+
+            if self._outline is not None:
+                start, stop = _polygons_span(indices, self._outline_offsets)
+                self._outline.data[start:stop] = self._get_outline(start, stop)
+                _upload_span(self._outline, start, stop)
+
+        event = GraphicFeatureEvent(
+            type=self._property_name, info={"key": key, "value": value}
+        )
+        self._call_event_handlers(event)
+
+    def set_value(self, graphic, value):
+        self[:] = value
@@ -5,7 +5,9 @@ import pygfx
 
 from ...utils import (
     parse_cmap_values,
+    get_cmap_texture,
 )
+from ...utils.functions import _get_colormap
 from ._base import (
     GraphicFeature,
     BufferManager,
@@ -402,3 +404,164 @@ class VertexCmap(BufferManager):
 
     def __repr__(self):
         return f"{self.__class__.__name__} | cmap: {self.name}\ntransform: {self.transform}"
+
+
+class VertexCmapTexture(BufferManager):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice",
+            "description": "always the full slice, the cmap is applied to all vertices",
+        },
+        {
+            "dict key": "value",
+            "type": "str",
+            "description": "new cmap name",
+        },
+    ]
+
+    def __init__(
+        self,
+        cmap_name: str,
+        transform: np.ndarray | None,
+        n_datapoints: int,
+        isolated_buffer: bool = True,
+        property_name: str = "cmap",
+    ):
+        """
+        Colormap that is sampled from a 1D texture on the GPU. Manages a buffer with one
+        float32 scalar per vertex, the cmap transform, which is used as the texture coordinate.
+
+        Changing the cmap only swaps the 1D cmap texture, and changing the transform only uploads
+        4 bytes per vertex. The transform is normalized to the cmap range using the ``TextureMap``
+        transform, i.e. on the GPU.
+        """
+        if not isinstance(cmap_name, str):
+            raise TypeError(
+                f"cmap name must be of type <str>, you have passed: {cmap_name} of type: {type(cmap_name)}"
+            )
+
+        if transform is None:
+            # evenly spaced colors, same as VertexCmap without a transform
+            transform = np.arange(n_datapoints)
+
+        transform = self._validate_transform(cmap_name, transform, n_datapoints)
+
+        super().__init__(
+            data=transform.astype(np.float32, copy=False),
+            isolated_buffer=isolated_buffer,
+            property_name=property_name,
+        )
+
+        self._cmap_name = cmap_name
+
+        self._texture_map = pygfx.TextureMap(
+            get_cmap_texture(cmap_name),
+            filter="nearest",
+            wrap="clamp-to-edge",
+        )
+
+        self._update_texture_map_transform()
+
+    def _validate_transform(
+        self, cmap_name: str, transform: np.ndarray | list, n_datapoints: int
+    ) -> np.ndarray:
+        transform = np.asarray(transform)
+
+        if transform.shape != (n_datapoints,):
+            raise ValueError(
+                f"len(cmap_values) != len(data): {len(transform)} != {n_datapoints}"
+            )
+
+        if _get_colormap(cmap_name).interpolation == "nearest":
+            # same requirement as parse_cmap_values
+            if not np.issubdtype(transform.dtype, np.integer):
+                raise TypeError(
+                    f"<int> `cmap_transform` values should be used with qualitative colormaps, "
+                    f"the dtype you have passed is {transform.dtype}"
+                )
+
+        return transform
+
+    def _update_texture_map_transform(self):
+        """set the TextureMap offset and scale that map the transform values to texture coordinates"""
+        n_texels = self._texture_map.texture.size[0]
+
+        if _get_colormap(self._cmap_name).interpolation == "nearest":
+            # qualitative cmap, the transform values are used directly as indices to the colors
+            scale = 1 / n_texels
+            offset = 0.5 / n_texels
+        else:
+            # normalize between min - max of the transform, same as parse_cmap_values
+            vmin, vmax = float(self.value.min()), float(self.value.max())
+
+            if vmin == vmax:
+                scale = 0.0
+                offset = 0.5 / n_texels
+            else:
+                scale = (n_texels - 1) / (n_texels * (vmax - vmin))
+                offset = (0.5 - vmin * (n_texels - 1) / (vmax - vmin)) / n_texels
+
+        # writes the transform to the uniform buffer of the TextureMap, setting scale and offset does not
+        self._texture_map.update_matrix_components(
+            offset=(offset, 0.0), scale=(scale, 1.0)
+        )
+
+    @property
+    def texture_map(self) -> pygfx.TextureMap:
+        """TextureMap that is sampled by the material"""
+        return self._texture_map
+
+    @block_reentrance
+    def __setitem__(self, key: slice, cmap_name: str):
+        if not (isinstance(key, slice) and key == slice(None)):
+            raise TypeError(
+                "A cmap sampled from a texture applies to all vertices, "
+                "slicing is not supported. Use `graphic.cmap = <cmap_name>`."
+            )
+
+        if not isinstance(cmap_name, str):
+            raise TypeError(
+                f"cmap name must be of type <str>, you have passed: {cmap_name} of type: {type(cmap_name)}"
+            )
+
+        if _get_colormap(cmap_name).interpolation == "nearest":
+            # the stored transform is float32, check that the values can be used as indices
+            if not np.all(np.mod(self.value, 1) == 0):
+                raise TypeError(
+                    f"<int> `cmap_transform` values should be used with qualitative colormaps, "
+                    f"set an <int> transform before setting the qualitative cmap: {cmap_name}"
+                )
+
+        self._cmap_name = cmap_name
+
+        # only the shared cmap texture is swapped, nothing is uploaded per-vertex
+        self._texture_map.texture = get_cmap_texture(cmap_name)
+        self._update_texture_map_transform()
+
+        self._emit_event(self._property_name, key, cmap_name)
+
+    @property
+    def name(self) -> str:
+        return self._cmap_name
+
+    @property
+    def transform(self) -> np.ndarray:
+        """Get or set the cmap transform. Maps values from the transform array to the cmap colors"""
+        return self.value
+
+    @transform.setter
+    def transform(self, values: np.ndarray | list[float | int]):
+        values = self._validate_transform(self._cmap_name, values, self.value.shape[0])
+
+        self.buffer.data[:] = values
+        self._update_range(slice(None))
+        self._update_texture_map_transform()
+
+        self._emit_event("cmap.transform", slice(None), values)
+
+    def __len__(self):
+        return len(self.buffer.data)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} | cmap: {self.name}\ntransform: {self.transform}"
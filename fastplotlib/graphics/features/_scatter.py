@@ -48,56 +48,85 @@ marker_names = {
 }
 
 
-def user_input_to_marker(name):
+# maps the human-readable marker name to the integers stored in the buffer
+marker_int_mapping = dict(pygfx.MarkerInt.__members__)
+
+
+# lookup tables indexed by the integers stored in the buffer, used to
+# validate integer marker codes and decode the buffer to marker names
+def init_marker_int_lookup(markers_mapping):
+    size = max(markers_mapping.values()) + 1
+    max_len = max(map(len, markers_mapping.keys()))
+
+    names = np.zeros(size, dtype=f"<U{max_len}")
+    valid = np.zeros(size, dtype=bool)
+
+    for name, marker_int in markers_mapping.items():
+        names[marker_int] = name
+        valid[marker_int] = True
+
+    return names, valid
+
+
+marker_int_to_name, valid_marker_ints = init_marker_int_lookup(marker_int_mapping)
+
+
+def user_input_to_marker(name) -> str:
+    if isinstance(name, (bool, np.bool_)):
+        raise TypeError(
+            f"markers must be a string or an integer marker code, not {name!r}"
+        )
+
+    if isinstance(name, (int, np.integer)):
+        # integer marker code, example: pygfx.MarkerInt.circle
+        if not (0 <= name < valid_marker_ints.size and valid_marker_ints[name]):
+            raise ValueError(
+                f"integer markers must be one of: {dict(pygfx.MarkerInt.__members__)}, not {name!r}"
+            )
+
+        return str(marker_int_to_name[name])
+
     resolved_name = marker_names.get(name, name).lower()
     if resolved_name not in pygfx.MarkerShape:
         raise ValueError(
-            f"markers must be a string in: {list(pygfx.MarkerShape) + list(marker_names.keys())}, not {name!r}"
+            f"markers must be a string in: {list(pygfx.MarkerShape) + list(marker_names.keys())}, "
+            f"or an integer code from pygfx.MarkerInt, not {name!r}"
         )
 
     return resolved_name
 
 
-def validate_user_markers_array(markers):
-    # make sure all markers are valid
-    # need to validate before converting to ints because
-    # we can't use control flow in the vectorized function
-    unique_values = np.unique(markers)
-    for m in unique_values:
-        user_input_to_marker(m)
-
+def user_input_to_marker_int(name) -> int:
+    return marker_int_mapping[user_input_to_marker(name)]
 
-# fast vectorized function to convert array of user markers to the standardized strings
-# TODO: can probably use search-sorted for this too
-vectorized_user_markers_to_std_markers = np.vectorize(marker_names.get, otypes=["<U14"])
-
-# maps the human-readable marker name to the integers stored in the buffer
-marker_int_mapping = dict(pygfx.MarkerInt.__members__)
 
+def user_markers_to_int_array(markers) -> np.ndarray[np.int32]:
+    """validate an array of marker strings or integer marker codes and map it to an array of marker ints"""
+    markers = np.asarray(markers)
 
-# search sorted is the fastest way to map an array of str -> array of int
-# see: https://github.com/pygfx/pygfx/issues/1215
-# Prepare for searchsorted
-def init_searchsorted(markers_mapping):
-    keys = np.array(list(markers_mapping.keys()))
-    vals = np.array(list(markers_mapping.values()))
+    if markers.dtype == bool:
+        raise TypeError("markers must be strings or integer marker codes, not bool")
 
-    order = np.argsort(keys)
-    keys = keys[order]
-    vals = vals[order]
+    if np.issubdtype(markers.dtype, np.integer):
+        # integer codes are used directly after validation, fast path for bulk updates
+        if markers.size > 0 and not (
+            markers.min() >= 0
+            and markers.max() < valid_marker_ints.size
+            and valid_marker_ints[markers].all()
+        ):
+            for m in np.unique(markers):
+                # raises for the first invalid marker code
+                user_input_to_marker(m)
 
-    return keys, vals
+        return markers.astype(np.int32, copy=False)
 
+    # there are only a few distinct markers, map each of them once
+    unique_markers, inverse = np.unique(markers, return_inverse=True)
+    unique_ints = np.array(
+        [user_input_to_marker_int(m) for m in unique_markers], dtype=np.int32
+    )
 
-marker_int_searchsorted_keys, marker_int_searchsorted_vals = init_searchsorted(
-    marker_int_mapping
-)
-
-
-def searchsorted_markers_to_int_array(markers_str_array: np.ndarray[str]):
-    # Vectorized lookup
-    indices = np.searchsorted(marker_int_searchsorted_keys, markers_str_array)
-    return marker_int_searchsorted_vals[indices]
+    return unique_ints[inverse.reshape(markers.shape)]
 
 
 class VertexMarkers(BufferManager):
@@ -109,62 +138,45 @@ class VertexMarkers(BufferManager):
         },
         {
             "dict key": "value",
-            "type": "str | np.ndarray[str]",
+            "type": "str | int | np.ndarray[str | int]",
             "description": "new marker values for points that were changed",
         },
     ]
 
     def __init__(
         self,
-        markers: str | Sequence[str] | np.ndarray,
+        markers: str | int | Sequence[str | int] | np.ndarray,
         n_datapoints: int,
         property_name: str = "markers",
     ):
         """
         Manages the markers buffer for the scatter points. Supports fancy indexing.
-        """
-
-        # first validate then allocate buffers
-
-        if isinstance(markers, str):
-            markers = user_input_to_marker(markers)
 
-        elif isinstance(markers, (tuple, list, np.ndarray)):
-            validate_user_markers_array(markers)
+        The int32 buffer is the only storage of the markers, marker names are decoded from it on access.
+        Markers can be given as strings or as integer codes from ``pygfx.MarkerInt``.
+        """
 
-        # allocate buffers
         markers_int_array = np.zeros(n_datapoints, dtype=np.int32)
 
-        marker_str_length = max(map(len, list(pygfx.MarkerShape)))
-
-        self._markers_readable_array = np.empty(
-            n_datapoints, dtype=f"<U{marker_str_length}"
-        )
-
-        if isinstance(markers, str):
+        if isinstance(markers, (str, int, np.integer)):
             # all markers in the array are identical, so set the entire array
-            self._markers_readable_array[:] = markers
-            markers_int_array[:] = marker_int_mapping[markers]
+            markers_int_array[:] = user_input_to_marker_int(markers)
 
         elif isinstance(markers, (np.ndarray, tuple, list)):
             # distinct marker for each point
-            # first vectorized map from user marker strings to "standard" marker strings
-            self._markers_readable_array = vectorized_user_markers_to_std_markers(
-                markers
-            )
-            # map standard marker strings to integer array
-            markers_int_array[:] = searchsorted_markers_to_int_array(
-                self._markers_readable_array
-            )
+            markers_int_array[:] = user_markers_to_int_array(markers)
 
         super().__init__(
-            markers_int_array, isolated_buffer=False, property_name=property_name
+            markers_int_array,
+            isolated_buffer=False,
+            owns_buffer=True,
+            property_name=property_name,
         )
 
     @property
     def value(self) -> np.ndarray[str]:
-        """numpy array of per-vertex marker shapes in human-readable form"""
-        return self._markers_readable_array
+        """numpy array of per-vertex marker shapes in human-readable form, decoded from the int32 buffer"""
+        return marker_int_to_name[self.value_int]
 
     @property
     def value_int(self) -> np.ndarray[np.int32]:
@@ -172,11 +184,9 @@ class VertexMarkers(BufferManager):
         return self.buffer.data
 
     def _set_markers_arrays(self, key, value, n_markers):
-        if isinstance(value, str):
+        if isinstance(value, (str, int, np.integer)):
             # set markers at these indices to this value
-            m = user_input_to_marker(value)
-            self._markers_readable_array[key] = m
-            self.value_int[key] = marker_int_mapping[m]
+            self.value_int[key] = user_input_to_marker_int(value)
 
         elif isinstance(value, (np.ndarray, list, tuple)):
             if n_markers != len(value):
@@ -186,44 +196,34 @@ class VertexMarkers(BufferManager):
                     f"provided {len(value)} new marker values. You must provide 1 or {n_markers} values."
                 )
 
-            validate_user_markers_array(value)
-
-            new_markers_human_readable = vectorized_user_markers_to_std_markers(value)
-            new_markers_int = searchsorted_markers_to_int_array(
-                new_markers_human_readable
-            )
-
-            self._markers_readable_array[key] = new_markers_human_readable
-            self.value_int[key] = new_markers_int
+            self.value_int[key] = user_markers_to_int_array(value)
         else:
             raise TypeError(
-                "new markers value must be a str, Sequence or np.ndarray of new marker values"
+                "new markers value must be a str, int, Sequence or np.ndarray of new marker values"
             )
 
     @block_reentrance
     def __setitem__(
         self,
         key: int | slice | list[int | bool] | np.ndarray[int | bool],
-        value: str | Sequence[str] | np.ndarray[str],
+        value: str | int | Sequence[str | int] | np.ndarray,
     ):
         if isinstance(key, int):
-            if key >= self.value.size:
-                raise IndexError(f"index : {key} out of bounds: {self.value.size}")
+            if key >= self.value_int.size:
+                raise IndexError(f"index : {key} out of bounds: {self.value_int.size}")
 
-            if not isinstance(value, str):
+            if not isinstance(value, (str, int, np.integer)):
                 # only a single marker should be provided if changing one at one index
                 raise TypeError(
-                    f"you must provide a <str> marker value if providing a single <int> index, "
+                    f"you must provide a <str> or <int> marker value if providing a single <int> index, "
                     f"you have passed index: {key} and value: {value}"
                 )
 
-            m = user_input_to_marker(value)
-            self._markers_readable_array[key] = m
-            self.value_int[key] = marker_int_mapping[m]
+            self.value_int[key] = user_input_to_marker_int(value)
 
         elif isinstance(key, slice):
             # find the number of new markers by converting slice to range and then parse markers
-            start, stop, step = key.indices(self.value.size)
+            start, stop, step = key.indices(self.value_int.size)
 
             n_markers = len(range(start, stop, step))
             self._set_markers_arrays(key, value, n_markers)
@@ -286,7 +286,7 @@ class UniformMarker(GraphicFeature):
         },
     ]
 
-    def __init__(self, marker: str, property_name: str = "markers"):
+    def __init__(self, marker: str | int, property_name: str = "markers"):
         """Manages evented uniform buffer for scatter marker"""
 
         self._value = user_input_to_marker(marker)
@@ -297,7 +297,7 @@ class UniformMarker(GraphicFeature):
         return self._value
 
     @block_reentrance
-    def set_value(self, graphic, value: str):
+    def set_value(self, graphic, value: str | int):
         value = user_input_to_marker(value)
         graphic.world_object.material.marker = value
         self._value = value
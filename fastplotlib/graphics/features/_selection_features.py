@@ -6,6 +6,7 @@ import pygfx as gfx
 from ...utils import mesh_masks
 from ._base import GraphicFeature, GraphicFeatureEvent, block_reentrance
 from ...utils.triangulation import triangulate
+from ._mesh import update_polygon_buffers
 
 
 class LinearSelectionFeature(GraphicFeature):
@@ -376,6 +377,9 @@ class PolygonSelectionFeature(GraphicFeature):
         self._limits = limits
         self._value = np.asarray(value).reshape(-1, 3).astype(float)
 
+        # indices of the current triangulation, reused when possible
+        self._indices = np.zeros((0, 3), np.int32)
+
     @property
     def value(self) -> np.ndarray[float]:
         """
@@ -410,31 +414,21 @@ class PolygonSelectionFeature(GraphicFeature):
         self._value = value
 
         if len(value) >= 3:
-            indices = triangulate(value)
+            # reuse the triangulation if only the vertices moved
+            indices = triangulate(value, reuse=self._indices)
+            if indices.ndim == 1:
+                indices = indices.reshape(-1, 3)
         else:
             indices = np.zeros((0, 3), np.int32)
 
-        geometry = selector.geometry
-
-        # Need larger (or smaller) buffer? Scale up/down with factors of 2.
-        need_position_size = 2 ** int(np.ceil(np.log2(max(8, len(value)))))
-        if need_position_size != geometry.positions.nitems:
-            arr = np.zeros((need_position_size, 3), np.float32)
-            geometry.positions = gfx.Buffer(arr)
-        need_indices_size = 2 ** int(np.ceil(np.log2(max(8, len(indices)))))
-        if need_indices_size != geometry.indices.nitems:
-            arr = np.zeros((need_indices_size, 3), np.int32)
-            geometry.indices = gfx.Buffer(arr)
-
-        geometry.positions.data[: len(value)] = value
-        geometry.positions.data[len(value) :] = value[-1] if len(value) else (0, 0, 0)
-        geometry.positions.draw_range = 0, len(value)
-        geometry.positions.update_full()
-
-        geometry.indices.data[: len(indices)] = indices
-        geometry.indices.data[len(indices) :] = 0
-        geometry.indices.draw_range = 0, len(indices)
-        geometry.indices.update_full()
+        update_polygon_buffers(
+            selector.geometry,
+            value,
+            indices,
+            indices_changed=indices is not self._indices,
+        )
+
+        self._indices = indices
 
         # send event
         if len(self._event_handlers) < 1:
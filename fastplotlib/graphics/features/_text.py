@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import numpy as np
 
 import pygfx
@@ -135,3 +137,89 @@ class TextOutlineThickness(GraphicFeature):
 
         event = GraphicFeatureEvent(type=self._property_name, info={"value": value})
         self._call_event_handlers(event)
+
+
+class LabelsText(GraphicFeature):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which the labels were indexed/sliced",
+        },
+        {
+            "dict key": "value",
+            "type": "np.ndarray[str]",
+            "description": "new text of the labels that were changed",
+        },
+    ]
+
+    def __init__(
+        self,
+        text: Sequence[str] | np.ndarray,
+        text_object: pygfx.MultiText,
+        property_name: str = "text",
+    ):
+        """
+        Manages the text of each label of a :class:`LabelsGraphic`, each label is one text block
+        of a single ``pygfx.MultiText`` object.
+        """
+        # object array so that setting longer strings does not truncate them
+        self._value = np.empty(len(text), dtype=object)
+        self._value[:] = [str(t) for t in text]
+
+        # number of characters in each label, used to estimate the extent of labels
+        self._n_chars = np.array([len(t) for t in self._value], dtype=np.int64)
+        # incremented when the text changes
+        self._rev = 0
+
+        self._text_object = text_object
+        self._text_object.set_text_block_count(self._value.size)
+
+        for i, t in enumerate(self._value):
+            self._text_object.get_text_block(i).set_text(t)
+
+        super().__init__(property_name=property_name)
+
+    @property
+    def value(self) -> np.ndarray:
+        """array of label strings, do not modify in-place"""
+        return self._value
+
+    def __getitem__(self, item):
+        return self._value[item]
+
+    def __len__(self):
+        return self._value.size
+
+    @block_reentrance
+    def __setitem__(self, key, value: str | Sequence[str]):
+        indices = np.arange(self._value.size)[key].reshape(-1)
+
+        new = np.empty(indices.size, dtype=object)
+        if isinstance(value, str):
+            new[:] = value
+        else:
+            new[:] = [str(t) for t in value]
+
+        # only re-layout the labels whose text changed
+        changed = self._value[indices] != new
+        for i, t in zip(indices[changed], new[changed]):
+            self._text_object.get_text_block(i).set_text(t)
+
+        self._value[indices] = new
+        self._n_chars[indices] = [len(t) for t in new]
+        self._rev += 1
+
+        event = GraphicFeatureEvent(
+            type=self._property_name, info={"key": key, "value": new}
+        )
+        self._call_event_handlers(event)
+
+    def set_value(self, graphic, value: Sequence[str]):
+        if len(value) != self._value.size:
+            raise ValueError(
+                f"number of labels in passed value != number of labels in graphic: "
+                f"{len(value)} != {self._value.size}"
+            )
+
+        self[:] = value
@@ -1,5 +1,6 @@
 import numpy as np
 import pylinalg as la
+import pygfx
 
 from ._base import (
     GraphicFeature,
@@ -8,10 +9,122 @@ from ._base import (
 )
 
 
-# it doesn't make sense to modify just a portion of a vector field, I can't think of a use case.
-# so we only allow setting the entire buffer, but allow getting portions of it
+def get_vector_transforms(
+    positions: np.ndarray, directions: np.ndarray, init_direction: np.ndarray
+) -> np.ndarray:
+    """
+    Get the transform matrices for vectors, vectorized over all vectors.
+
+    Parameters
+    ----------
+    positions: np.ndarray
+        [n, 3] vector positions
+
+    directions: np.ndarray
+        [n, 3] vector directions, the magnitude of a direction determines the scale of the vector
+
+    init_direction: np.ndarray
+        [3] direction of the vector mesh before it is transformed
+
+    Returns
+    -------
+    np.ndarray
+        [n, 4, 4] transposed transform matrices, as stored in the instance buffer
+
+    """
+    # rotation axis and angle to rotate init_direction onto each direction
+    axis = np.cross(init_direction, directions)
+    axis_norms = np.linalg.norm(axis, axis=1, ord=2)
+    angles = np.arctan2(axis_norms, directions @ init_direction)
+
+    # if the direction is parallel to init_direction the axis is 0, the rotation is either
+    # none (angle is 0) or 180 degrees around any axis that is orthogonal to init_direction
+    parallel = axis_norms == 0
+    axis[parallel] = 1
+
+    rotations = la.quat_from_axis_angle(axis, angles)
+
+    flipped = parallel & (angles > 0)
+    if flipped.any():
+        # same orthogonal axis as pylinalg.quat_from_vecs
+        rotations[flipped] = la.quat_from_vecs(init_direction, -init_direction)
+
+    # [n, 4, 4] rotation matrices, then scale by the magnitudes and translate
+    transforms = la.mat_from_quat(rotations)
+    transforms[:, :3, :3] *= np.linalg.norm(directions, axis=1, ord=2)[:, None, None]
+    transforms[:, :3, 3] = positions
+
+    return transforms.transpose(0, 2, 1)
+
+
+def _parse_vectors_key(key, n_vectors: int) -> np.ndarray:
+    """get the indices of the vectors that are modified by the key"""
+    if isinstance(key, tuple):
+        # only the first dimension is needed to determine which vectors are modified
+        key = key[0]
+
+    return np.arange(n_vectors)[key].reshape(-1)
+
+
+def _upload_vectors(buffer: pygfx.Buffer, indices: np.ndarray):
+    """mark the range of instance transforms that contains the given indices for upload"""
+    if indices.size == 0:
+        return
+
+    if indices.size == buffer.nitems:
+        buffer.update_full()
+    else:
+        offset = int(indices.min())
+        buffer.update_range(offset, int(indices.max()) + 1 - offset)
+
+
+def _parse_vectors(vectors, name: str, isolated_buffer: bool) -> np.ndarray:
+    if isolated_buffer:
+        vectors = np.array(vectors, dtype=np.float32)
+    else:
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+    if vectors.ndim != 2:
+        raise ValueError(f"vector field {name} must be of shape [n, 2] or [n, 3]")
+
+    if vectors.shape[1] == 2:
+        vectors = np.column_stack(
+            [
+                vectors[:, 0],
+                vectors[:, 1],
+                np.zeros(vectors.shape[0], dtype=np.float32),
+            ]
+        )
+
+    elif vectors.shape[1] == 3:
+        pass
+
+    else:
+        raise ValueError(f"vector field {name} must be of shape [n, 2] or [n, 3]")
+
+    return vectors
+
+
+def _set_vectors(array: np.ndarray, key, value) -> np.ndarray:
+    """set values in the [n, 3] array, 2D values only set the x and y components"""
+    value = np.asarray(value, dtype=np.float32)
+
+    if not isinstance(key, tuple) and value.ndim > 0 and value.shape[-1] == 2:
+        # assume 2d
+        array[key, :-1] = value
+    else:
+        array[key] = value
+
+    return value
+
+
 class VectorPositions(GraphicFeature):
     event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which vector positions were indexed/sliced",
+        },
         {
             "dict key": "value",
             "type": "np.ndarray",
@@ -29,30 +142,10 @@ class VectorPositions(GraphicFeature):
         Manages vector field positions by managing the translation elements of the mesh instance transform matrix buffer
         """
 
-        positions = np.asarray(positions, dtype=np.float32)
-        if positions.ndim != 2:
-            raise ValueError(
-                f"vector field positions must be of shape [n, 2] or [n, 3]"
-            )
-
-        if positions.shape[1] == 2:
-            positions = np.column_stack(
-                [
-                    positions[:, 0],
-                    positions[:, 1],
-                    np.zeros(positions.shape[0], dtype=np.float32),
-                ]
-            )
-
-        elif positions.shape[1] == 3:
-            pass
+        self._positions = _parse_vectors(positions, "positions", isolated_buffer)
 
-        else:
-            raise ValueError(
-                f"vector field positions must be of shape [n, 2] or [n, 3]"
-            )
-
-        self._positions = positions
+        # set by the graphic once the world object is created
+        self._instance_buffer: pygfx.Buffer | None = None
 
         super().__init__(property_name=property_name)
 
@@ -63,40 +156,40 @@ class VectorPositions(GraphicFeature):
     def __getitem__(self, item):
         return self.value[item]
 
-    def __setitem__(self, key, value):
-        raise NotImplementedError(
-            "cannot set individual slices of vector positions, must set all positions"
-        )
+    def _fpl_set_instance_buffer(self, buffer: pygfx.Buffer):
+        self._instance_buffer = buffer
 
     @block_reentrance
+    def __setitem__(self, key, value):
+        value = _set_vectors(self._positions, key, value)
+
+        indices = _parse_vectors_key(key, self._positions.shape[0])
+
+        # only need to update the translation vector, transforms are stored transposed
+        self._instance_buffer.data["matrix"][indices, 3, 0:3] = self._positions[indices]
+        _upload_vectors(self._instance_buffer, indices)
+
+        event = GraphicFeatureEvent(type="positions", info={"key": key, "value": value})
+        self._call_event_handlers(event)
+
     def set_value(self, graphic, value: np.ndarray):
+        value = np.asarray(value)
         if value.shape[0] != self._positions.shape[0]:
             raise ValueError(
                 f"number of vector positions in passed array != number of vectors in graphic: "
                 f"{value.shape[0]} != {self._positions.shape[0]}"
             )
 
-        if value.shape[1] == 2:
-            # assume 2d
-            self._positions[:, :-1] = value
-
-        else:
-            self._positions[:] = value
-
-        for i in range(self._positions.shape[0]):
-            # only need to update the translation vector
-            graphic.world_object.instance_buffer.data["matrix"][i][3, 0:3] = (
-                self._positions[i]
-            )
-
-        graphic.world_object.instance_buffer.update_full()
-
-        event = GraphicFeatureEvent(type="positions", info={"value": value})
-        self._call_event_handlers(event)
+        self[:] = value
 
 
 class VectorDirections(GraphicFeature):
     event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which vector directions were indexed/sliced",
+        },
         {
             "dict key": "value",
             "type": "np.ndarray",
@@ -111,35 +204,20 @@ class VectorDirections(GraphicFeature):
     def __init__(
         self,
         directions: np.ndarray,
+        positions: VectorPositions,
         isolated_buffer: bool = True,
         property_name: str = "directions",
     ):
-        """Manages vector field positions by managing the mesh instance buffer's full transform matrix"""
-
-        directions = np.asarray(directions, dtype=np.float32)
-        if directions.ndim != 2:
-            raise ValueError(
-                f"vector field directions must be of shape [n, 2] or [n, 3]"
-            )
-
-        if directions.shape[1] == 2:
-            directions = np.column_stack(
-                [
-                    directions[:, 0],
-                    directions[:, 1],
-                    np.zeros(directions.shape[0], dtype=np.float32),
-                ]
-            )
-
-        elif directions.shape[1] == 3:
-            pass
+        """
+        Manages vector field directions by managing the mesh instance buffer's full transform matrix.
+        The transforms are composed from the directions and the ``positions``.
+        """
 
-        else:
-            raise ValueError(
-                f"vector field directions must be of shape [n, 2] or [n, 3]"
-            )
+        self._directions = _parse_vectors(directions, "directions", isolated_buffer)
+        self._positions = positions
 
-        self._directions = directions
+        # set by the graphic once the world object is created
+        self._instance_buffer: pygfx.Buffer | None = None
 
         super().__init__(property_name=property_name)
 
@@ -150,38 +228,36 @@ class VectorDirections(GraphicFeature):
     def __getitem__(self, item):
         return self.value[item]
 
-    def __setitem__(self, key, value):
-        raise NotImplementedError(
-            "cannot set individual slices of vector directions, must set all directions"
+    def _fpl_set_instance_buffer(self, buffer: pygfx.Buffer):
+        """set the instance buffer and write the transforms for all vectors"""
+        self._instance_buffer = buffer
+        self._update_transforms(np.arange(self._directions.shape[0]))
+
+    def _update_transforms(self, indices: np.ndarray):
+        self._instance_buffer.data["matrix"][indices] = get_vector_transforms(
+            self._positions.value[indices],
+            self._directions[indices],
+            self.init_direction,
         )
+        _upload_vectors(self._instance_buffer, indices)
 
     @block_reentrance
+    def __setitem__(self, key, value):
+        value = _set_vectors(self._directions, key, value)
+
+        self._update_transforms(_parse_vectors_key(key, self._directions.shape[0]))
+
+        event = GraphicFeatureEvent(
+            type="directions", info={"key": key, "value": value}
+        )
+        self._call_event_handlers(event)
+
     def set_value(self, graphic, value: np.ndarray):
+        value = np.asarray(value)
         if value.shape[0] != self._directions.shape[0]:
             raise ValueError(
                 f"number of vector directions in passed array != number of vectors in graphic: "
                 f"{value.shape[0]} != {self._directions.shape[0]}"
             )
 
-        if value.shape[1] == 2:
-            # assume 2d
-            self._directions[:, :-1] = value
-
-        else:
-            self._directions[:] = value
-
-        # vector determines the size of the vector
-        magnitudes = np.linalg.norm(self._directions, axis=1, ord=2)
-
-        for i in range(self._directions.shape[0]):
-            # get quaternion to rotate vector to new direction
-            rotation = la.quat_from_vecs(self.init_direction, self._directions[i])
-            # get the new transform
-            transform = la.mat_compose(graphic.positions[i], rotation, magnitudes[i])
-            # set the buffer
-            graphic.world_object.instance_buffer.data["matrix"][i] = transform.T
-
-        graphic.world_object.instance_buffer.update_full()
-
-        event = GraphicFeatureEvent(type="directions", info={"value": value})
-        self._call_event_handlers(event)
+        self[:] = value
@@ -16,9 +16,14 @@ VOLUME_RENDER_MODES = {
 
 class TextureArrayVolume(GraphicFeature):
     """
-    Manages an array of Textures representing chunks of an image. Chunk size is the GPU's max texture limit.
+    Manages an array of Textures representing chunks of an image. Chunk size is the GPU's max texture limit,
+    or ``brick_size`` if the volume is bricked.
 
-    Creates and manages multiple pygfx.Texture objects.
+    Creates and manages multiple pygfx.Texture objects. The min and max of each chunk are kept so that
+    chunks which cannot contribute to the rendered image can be skipped.
+
+    The textures of bricks overlap their neighbors by one voxel, so that linear interpolation is continuous
+    across the borders of the bricks.
     """
 
     event_info_spec = [
@@ -34,15 +39,39 @@ class TextureArrayVolume(GraphicFeature):
         },
     ]
 
-    def __init__(self, data, isolated_buffer: bool = True):
+    def __init__(
+        self,
+        data,
+        isolated_buffer: bool = True,
+        brick_size: int | None = None,
+        empty_threshold: float | None = None,
+    ):
         super().__init__(property_name="data")
 
+        user_data = data
         data = self._fix_data(data)
 
         shared = pygfx.renderers.wgpu.get_shared()
 
         self._texture_size_limit = shared.device.limits["max-texture-dimension-3d"]
 
+        if brick_size is not None:
+            if brick_size < 1:
+                raise ValueError(
+                    f"`brick_size` must be a positive int, you passed: {brick_size}"
+                )
+            brick_size = int(brick_size)
+            # chunks and their apron can't be larger than the texture limit
+            self._texture_size_limit = min(brick_size, self._texture_size_limit - 2)
+
+        self._brick_size = brick_size
+        self._empty_threshold = empty_threshold
+
+        # _fix_data() can copy the user's array, in which case the buffer is not shared with the user
+        self._shared_buffer = not isolated_buffer and np.may_share_memory(
+            data, user_data
+        )
+
         if isolated_buffer:
             # useful if data is read-only, example: memmaps
             self._value = np.zeros(data.shape, dtype=data.dtype)
@@ -77,14 +106,16 @@ class TextureArrayVolume(GraphicFeature):
         # buffer will be an array of textures
         self._buffer: np.ndarray[pygfx.Texture] = np.empty(shape=shape, dtype=object)
 
+        # min and max value of each chunk
+        self._brick_min = np.zeros(shape, dtype=np.float32)
+        self._brick_max = np.zeros(shape, dtype=np.float32)
+
         self._iter = None
 
         # iterate through each chunk of passed `data`
-        # create a pygfx.Texture from this chunk
+        # create a pygfx.Texture from this chunk, empty chunks are not uploaded
         for _, buffer_index, data_slice in self:
-            texture = pygfx.Texture(self.value[data_slice], dim=3)
-
-            self.buffer[buffer_index] = texture
+            self._update_brick(buffer_index, data_slice)
 
     @property
     def value(self) -> np.ndarray:
@@ -99,6 +130,48 @@ class TextureArrayVolume(GraphicFeature):
         """array of buffers that are mapped to the GPU"""
         return self._buffer
 
+    @property
+    def brick_size(self) -> int | None:
+        """size of the bricks along each dimension, ``None`` if the volume is chunked only at the texture limit"""
+        return self._brick_size
+
+    @property
+    def empty_threshold(self) -> float | None:
+        """chunks whose max value is at or below this threshold are empty, they are not uploaded to the GPU"""
+        return self._empty_threshold
+
+    @property
+    def brick_min(self) -> np.ndarray:
+        """min value of each chunk, same shape as ``buffer``"""
+        return self._brick_min
+
+    @property
+    def brick_max(self) -> np.ndarray:
+        """max value of each chunk, same shape as ``buffer``"""
+        return self._brick_max
+
+    @property
+    def empty(self) -> np.ndarray:
+        """bool array, ``True`` for chunks that are not uploaded to the GPU, same shape as ``buffer``"""
+        if self.empty_threshold is None:
+            return np.zeros(self.buffer.shape, dtype=bool)
+
+        return self.brick_max <= self.empty_threshold
+
+    @property
+    def apron(self) -> int:
+        """number of voxels by which the texture of a brick overlaps its neighbors, 1 if bricked, otherwise 0"""
+        return 0 if self._brick_size is None else 1
+
+    def texture_slice(
+        self, data_slice: tuple[slice, slice, slice]
+    ) -> tuple[slice, slice, slice]:
+        """slice of the big data array in the texture of the chunk with the given data slice, including the apron"""
+        return tuple(
+            slice(max(0, s.start - self.apron), min(n, s.stop + self.apron))
+            for s, n in zip(data_slice, self.value.shape)
+        )
+
     @property
     def row_indices(self) -> np.ndarray:
         """
@@ -151,7 +224,7 @@ class TextureArrayVolume(GraphicFeature):
         Returns
         -------
         Texture, tuple[int, int], tuple[slice, slice]
-            | Texture: pygfx.Texture
+            | Texture: pygfx.Texture, ``None`` if the chunk is empty
             | tuple[int, int]: chunk index, i.e corresponding index of ``self.buffer`` array
             | tuple[slice, slice]: data slice of big array in this chunk and Texture
         """
@@ -182,6 +255,72 @@ class TextureArrayVolume(GraphicFeature):
 
         return texture, chunk_index, data_slice
 
+    def _update_brick(self, chunk_index: tuple[int, int, int], data_slice):
+        """update the min, max and texture of a chunk, creates the texture if the chunk is no longer empty"""
+        chunk = self.value[data_slice]
+
+        self._brick_min[chunk_index] = np.nanmin(chunk)
+        self._brick_max[chunk_index] = np.nanmax(chunk)
+
+        texture = self.buffer[chunk_index]
+
+        if texture is not None:
+            if self.apron > 0:
+                texture.data[:] = self.value[self.texture_slice(data_slice)]
+            texture.update_range((0, 0, 0), texture.size)
+
+        elif (
+            self.empty_threshold is None
+            or self._brick_max[chunk_index] > self.empty_threshold
+        ):
+            if self.apron > 0:
+                # copy, the texture overlaps its neighbors and is not a view of the data
+                chunk = self.value[self.texture_slice(data_slice)].copy()
+            self.buffer[chunk_index] = pygfx.Texture(chunk, dim=3)
+
+    def _chunks_in_key(self, key) -> list[tuple[int, int, int]]:
+        """indices of the chunks that intersect with the given key, all chunks if the key is not simple slicing"""
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        all_chunks = list(np.ndindex(*self.buffer.shape))
+
+        for k in key:
+            if isinstance(k, (bool, np.bool_)) or not isinstance(
+                k, (int, np.integer, slice)
+            ):
+                # ellipsis, None, fancy indexing and bool masks do not map key entries to dims by position
+                return all_chunks
+
+        ranges = list()
+        for dim in range(3):
+            n = self.value.shape[dim]
+            k = key[dim] if dim < len(key) else slice(None)
+
+            if isinstance(k, (int, np.integer)):
+                start = int(k) % n
+                stop = start + 1
+            elif k.step in (None, 1):
+                start, stop, _ = k.indices(n)
+            else:
+                # strided slices
+                start, stop = 0, n
+
+            if stop <= start:
+                return list()
+
+            # the textures of neighboring bricks include these voxels in their apron
+            start, stop = max(0, start - self.apron), min(n, stop + self.apron)
+
+            ranges.append(
+                range(
+                    start // self._texture_size_limit,
+                    ceil(stop / self._texture_size_limit),
+                )
+            )
+
+        return list(product(*ranges))
+
     def __getitem__(self, item):
         return self.value[item]
 
@@ -189,8 +328,13 @@ class TextureArrayVolume(GraphicFeature):
     def __setitem__(self, key, value):
         self.value[key] = value
 
-        for texture in self.buffer.ravel():
-            texture.update_range((0, 0, 0), texture.size)
+        chunk_size = self._texture_size_limit
+        for chunk_index in self._chunks_in_key(key):
+            data_slice = tuple(
+                slice(i * chunk_size, min(n, (i + 1) * chunk_size))
+                for i, n in zip(chunk_index, self.value.shape)
+            )
+            self._update_brick(chunk_index, data_slice)
 
         event = GraphicFeatureEvent(
             self._property_name, info={"key": key, "value": value}
@@ -201,6 +345,20 @@ class TextureArrayVolume(GraphicFeature):
         return self.buffer.size
 
 
+# bricks are separate tiles, each tile only ray-marches its own texture and writes the depth at its own max.
+# Composing the tiles by max blending, without depth writes, gives the max along the whole ray. The apron of
+# the bricks is drawn by both neighbors, which has no effect with max blending.
+MIP_BRICKS_ALPHA_CONFIG = {
+    "method": "blended",
+    "color_op": "max",
+    "color_src": "one",
+    "color_dst": "one",
+    "alpha_op": "max",
+    "alpha_src": "one",
+    "alpha_dst": "one",
+}
+
+
 def create_volume_material_kwargs(graphic, mode: str):
     kwargs = {
         "clim": (graphic.vmin, graphic.vmax),
@@ -209,6 +367,10 @@ def create_volume_material_kwargs(graphic, mode: str):
         "pick_write": True,
     }
 
+    if mode == "mip" and graphic.data.brick_size is not None:
+        kwargs["alpha_config"] = MIP_BRICKS_ALPHA_CONFIG
+        kwargs["depth_write"] = False
+
     if mode == "iso":
         more_kwargs = {
             attr: getattr(graphic, attr)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pygfx
 import numpy as np
 
@@ -5,6 +7,87 @@ from ._base import to_gpu_supported_dtype
 from ...utils import make_pygfx_colors
 
 
+@lru_cache(maxsize=1024)
+def _color_str_to_rgba(color: str) -> tuple[float, float, float, float]:
+    """parse a single color str, cached since the same few color names are usually parsed many times"""
+    return pygfx.Color(color).rgba
+
+
+def _factorize_str_array(
+    colors: np.ndarray, max_masked: int = 8
+) -> tuple[list[str], np.ndarray]:
+    """
+    Get the unique values and inverse indices of a 1D str array.
+
+    Colors are usually categorical with only a few unique values, equality masks are much faster
+    than sorting large str arrays in that case. Sorting with ``np.unique`` is only used for any values
+    that remain after ``max_masked`` unique values have been found.
+    """
+    unique = list()
+    inverse = np.empty(colors.shape[0], dtype=np.intp)
+    unassigned = np.ones(colors.shape[0], dtype=bool)
+
+    for _ in range(max_masked):
+        # first element that has not been assigned yet
+        ix = np.argmax(unassigned)
+        if not unassigned[ix]:
+            return unique, inverse
+
+        value = colors[ix]
+        mask = colors == value
+        inverse[mask] = len(unique)
+        unassigned &= ~mask
+        unique.append(value.item())
+
+    if unassigned.any():
+        remaining, remaining_inverse = np.unique(
+            colors[unassigned], return_inverse=True
+        )
+        inverse[unassigned] = remaining_inverse.ravel() + len(unique)
+        unique.extend(remaining.tolist())
+
+    return unique, inverse
+
+
+def parse_color_strings(colors: np.ndarray | list[str] | tuple[str]) -> np.ndarray:
+    """
+    Parse a sequence of color strings into an RGBA array.
+
+    Each unique color string is parsed only once, the RGBA values are then broadcast to
+    every element using the inverse indices of the unique strings.
+
+    Parameters
+    ----------
+    colors: np.ndarray | list[str] | tuple[str]
+        array of str, or a list or tuple of str
+
+    Returns
+    -------
+    np.ndarray
+        float32 array of shape [n_colors, 4]
+
+    """
+    if isinstance(colors, np.ndarray):
+        unique, inverse = _factorize_str_array(colors)
+    else:
+        # factorize using a dict, faster than creating a numpy str array from a list
+        lookup = dict()
+        inverse = np.fromiter(
+            (lookup.setdefault(c, len(lookup)) for c in colors),
+            dtype=np.intp,
+            count=len(colors),
+        )
+        unique = list(lookup.keys())
+
+    # small LUT of the unique colors
+    lut = np.array(
+        [_color_str_to_rgba(c.decode() if isinstance(c, bytes) else c) for c in unique],
+        dtype=np.float32,
+    ).reshape(-1, 4)
+
+    return lut[inverse.ravel()]
+
+
 def parse_colors(
     colors: str | np.ndarray | list[str] | tuple[str], n_colors: int | None
 ):
@@ -21,11 +104,17 @@ def parse_colors(
     """
 
     # if provided as a numpy array of str
-    if isinstance(colors, np.ndarray):
-        if colors.dtype.kind in ["U", "S"]:
-            colors = colors.tolist()
+    if isinstance(colors, np.ndarray) and colors.dtype.kind in ["U", "S"]:
+        if not (colors.ndim == 1 and colors.size == n_colors):
+            raise ValueError(
+                f"Valid str array color arguments must be a 1D array "
+                f"where the length of the array is the same as the number of datapoints."
+            )
+
+        data = parse_color_strings(colors)
+
     # if the color is provided as a numpy array
-    if isinstance(colors, np.ndarray):
+    elif isinstance(colors, np.ndarray):
         if colors.shape == (3,):  # single RGB array
             data = np.repeat(np.array([colors]), n_colors, axis=0)
         elif colors.shape == (4,):  # single RGBA array
@@ -55,7 +144,7 @@ def parse_colors(
                     f"where the length of the iterable is the same as the number of datapoints."
                 )
 
-            data = np.vstack([np.array(pygfx.Color(c)) for c in colors])
+            data = parse_color_strings(colors)
 
         # if it's a single RGB/RGBA array as a tuple/list
         elif len(colors) in (3, 4):
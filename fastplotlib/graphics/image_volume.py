@@ -114,6 +114,8 @@ class ImageVolumeGraphic(Graphic):
         emissive: str | tuple | np.ndarray = (0, 0, 0),
         shininess: int = 30,
         isolated_buffer: bool = True,
+        brick_size: int = None,
+        empty_threshold: float = None,
         **kwargs,
     ):
         """
@@ -175,6 +177,22 @@ class ImageVolumeGraphic(Graphic):
             data arrays are ready-only such as memmaps. If False, the input array is itself used as the
             buffer - useful if the array is large.
 
+        brick_size: int, optional
+            Split the volume into bricks of this size along each dimension, for example 64. Bricks that cannot
+            contribute to the rendered image are skipped when rendering: bricks whose max is below ``threshold``
+            in "iso" mode, bricks whose max is below ``vmin`` in "mip" mode and bricks whose min is above
+            ``vmax`` in "minip" mode. Useful for sparse volumes that are mostly background. By default the
+            volume is only split at the GPU's max texture size.
+
+            The bricks overlap by one voxel so that there are no seams between them. In "mip" mode the bricks
+            are composed with max blending, the color of each pixel is the per-channel max of the colors of
+            the bricks along the ray. This is the exact MIP for colormaps whose channels increase with the
+            value, such as "gray", and on a black background.
+
+        empty_threshold: float, optional
+            Bricks whose max value is at or below this threshold are empty, they are not uploaded to the GPU
+            and never rendered. Usually the background level of the volume, used with ``brick_size``.
+
         kwargs
             additional keyword arguments passed to :class:`.Graphic`
 
@@ -196,7 +214,12 @@ class ImageVolumeGraphic(Graphic):
         else:
             # create new texture array to manage buffer
             # texture array that manages the textures on the GPU that represent this image volume
-            self._data = TextureArrayVolume(data, isolated_buffer=isolated_buffer)
+            self._data = TextureArrayVolume(
+                data,
+                isolated_buffer=isolated_buffer,
+                brick_size=brick_size,
+                empty_threshold=empty_threshold,
+            )
 
         if (vmin is None) or (vmax is None):
             _vmin, _vmax = quick_min_max(self.data.value)
@@ -237,9 +260,38 @@ class ImageVolumeGraphic(Graphic):
 
         self._mode = VolumeRenderMode(mode)
 
+        # tile for each texture chunk, None for empty chunks
+        self._tiles = np.empty(self._data.buffer.shape, dtype=object)
+
+        self._set_world_object(world_object)
+
+        if "alpha_config" in material_kwargs:
+            # _set_world_object() sets the alpha_mode of the material, bricked MIP volumes use max blending
+            self._material.alpha_config = material_kwargs["alpha_config"]
+
+        self._update_tiles()
+
+        # skip tiles that can't contribute to the rendered image when the data or the render parameters change
+        for feature in [
+            self._data,
+            self._mode,
+            self._threshold,
+            self._vmin,
+            self._vmax,
+        ]:
+            feature.add_event_handler(self._update_tiles)
+
+    def _update_tiles(self, *args):
+        """create tiles for chunks that have a texture, show only the tiles that contribute to the rendered image"""
         # iterate through each texture chunk and create
         # a _VolumeTile, offset the tile using the data indices
         for texture, chunk_index, data_slice in self._data:
+            if texture is None or self._tiles[chunk_index] is not None:
+                continue
+
+            # the texture of a brick includes the apron that overlaps its neighbors
+            data_slice = self._data.texture_slice(data_slice)
+
             # create a _VolumeTile using the texture for this chunk
             vol = _VolumeTile(
                 geometry=pygfx.Geometry(grid=texture),
@@ -259,9 +311,36 @@ class ImageVolumeGraphic(Graphic):
             vol.world.x = data_col_start
             vol.world.y = data_row_start
 
-            world_object.add(vol)
+            self.world_object.add(vol)
+            self._tiles[chunk_index] = vol
 
-        self._set_world_object(world_object)
+        visible = self.visible_bricks
+        for chunk_index, vol in np.ndenumerate(self._tiles):
+            if vol is not None:
+                vol.visible = bool(visible[chunk_index])
+
+    @property
+    def visible_bricks(self) -> np.ndarray:
+        """
+        bool array, ``True`` for the bricks that are rendered. Empty bricks are never rendered, bricks that
+        cannot contribute to the rendered image in the current mode are skipped.
+        """
+        visible = ~self._data.empty
+
+        if self._data.brick_size is None:
+            # only bricked volumes are culled, bricks below vmin are not drawn with the lowest cmap color
+            return visible
+
+        match self.mode:
+            case "iso":
+                # no surface in bricks whose values are all below the threshold
+                visible &= self._data.brick_max >= self.threshold
+            case "mip":
+                visible &= self._data.brick_max > self.vmin
+            case "minip":
+                visible &= self._data.brick_min < self.vmax
+
+        return visible
 
     @property
     def data(self) -> TextureArrayVolume:
@@ -0,0 +1,477 @@
+from typing import Literal, Sequence
+
+import numpy as np
+import pylinalg as la
+
+import pygfx
+from pygfx.renderers.wgpu import register_wgpu_render_function, Binding
+from pygfx.renderers.wgpu.shaders.textshader import TextShader
+
+try:
+    # private, the size that glyphs are shaped at
+    from pygfx.utils.text._shaper import REF_GLYPH_SIZE
+except ImportError:
+    REF_GLYPH_SIZE = None
+
+from ..utils.enums import RenderQueue
+from ..utils.gpu import SUPPORTED_PYGFX_VERSION
+from ._base import Graphic
+from .features import (
+    VertexPositions,
+    VertexColors,
+    VertexPointSizes,
+    LabelsText,
+    TextOutlineColor,
+    TextOutlineThickness,
+)
+
+# approximate advance of one character and height of one line of text relative to the font size,
+# only used to estimate the screen space extent of labels for culling
+CHAR_WIDTH = 0.6
+LINE_HEIGHT = 1.2
+
+# horizontal and vertical offset of the label box relative to the anchor, in units of the box size
+ANCHOR_OFFSETS = {
+    "left": 0.0,
+    "center": -0.5,
+    "right": -1.0,
+    "top": -1.0,
+    "middle": -0.5,
+    "baseline": -0.25,
+    "bottom": 0.0,
+}
+
+
+def _pygfx_internals_error(what: str) -> RuntimeError:
+    return RuntimeError(
+        f"LabelsGraphic could not {what}, the pygfx text internals that it relies on have changed. "
+        f"LabelsGraphic is supported with pygfx {SUPPORTED_PYGFX_VERSION}, you have pygfx {pygfx.__version__}"
+    )
+
+
+def _patch_wgsl(code: str, old: str, new: str) -> str:
+    """replace ``old`` with ``new`` in pygfx shader code, raises if ``old`` is not found"""
+    if old not in code:
+        raise _pygfx_internals_error("patch the pygfx text shader")
+
+    return code.replace(old, new)
+
+
+class LabelsMultiText(pygfx.MultiText):
+    """
+    ``MultiText`` with per text block colors, font sizes and visibility.
+
+    Each label is one text block, the glyphs of all labels are in a single glyph buffer that
+    is backed by the shared glyph atlas, so all labels are rendered in one draw call.
+    """
+
+    pass
+
+
+@register_wgpu_render_function(LabelsMultiText, pygfx.TextMaterial)
+class LabelsMultiTextShader(TextShader):
+    """
+    Text shader that reads the color, font size and visibility of each text block from
+    storage buffers instead of using the uniform material color and object font size.
+    """
+
+    def get_bindings(self, wobject, shared):
+        bindings = super().get_bindings(wobject, shared)
+
+        geometry = wobject.geometry
+        sbuffer = "buffer/read_only_storage"
+
+        extra = [
+            Binding("s_colors", sbuffer, geometry.colors, "VERTEX"),
+            Binding("s_sizes", sbuffer, geometry.sizes, "VERTEX"),
+            Binding("s_visibility", sbuffer, geometry.visibility, "VERTEX"),
+        ]
+
+        for binding in extra:
+            index = len(bindings[0])
+            bindings[0][index] = binding
+            self.define_binding(0, index, binding)
+
+        return bindings
+
+    def get_code(self):
+        code = super().get_code()
+
+        # scale glyphs by the font size of the block, the text object's font size is
+        # REF_GLYPH_SIZE. Hidden blocks get a font size of 0 which creates degenerate quads.
+        code = _patch_wgsl(
+            code,
+            "let glyph_pos = vec2<f32>(glyph_data.x, glyph_data.y);\n"
+            "    let font_size = f32(glyph_data.s);",
+            "let block_scale = load_s_sizes(block_index) * load_s_visibility(block_index) / f32(REF_GLYPH_SIZE);\n"
+            "    let glyph_pos = vec2<f32>(glyph_data.x, glyph_data.y) * block_scale;\n"
+            "    let font_size = f32(glyph_data.s) * block_scale;",
+        )
+
+        # per block color
+        code = _patch_wgsl(
+            code,
+            "varyings.weight_offset = f32(weight_offset);",
+            "varyings.weight_offset = f32(weight_offset);\n"
+            "    varyings.color = vec4<f32>(load_s_colors(block_index));",
+        )
+        code = _patch_wgsl(
+            code, "let base_srgb = u_material.color;", "let base_srgb = varyings.color;"
+        )
+
+        return code
+
+
+class LabelsGraphic(Graphic):
+    _features = {
+        "positions": VertexPositions,
+        "text": LabelsText,
+        "font_sizes": VertexPointSizes,
+        "colors": VertexColors,
+        "outline_color": TextOutlineColor,
+        "outline_thickness": TextOutlineThickness,
+    }
+
+    _fpl_support_tooltip = False
+
+    def __init__(
+        self,
+        positions: np.ndarray | Sequence[float],
+        text: Sequence[str] | np.ndarray,
+        font_sizes: float | int | np.ndarray | Sequence[float] = 14,
+        colors: str | np.ndarray | Sequence[float] | Sequence[str] = "w",
+        outline_color: str | np.ndarray | list[float] | tuple[float] = "w",
+        outline_thickness: float = 0.0,
+        screen_space: bool = True,
+        anchor: str = "middle-center",
+        culling: Literal["offscreen", "overlap"] | None = None,
+        isolated_buffer: bool = True,
+        **kwargs,
+    ):
+        """
+        Create a graphic that draws many text labels, such as annotations for a large number of points.
+
+        All labels are drawn by a single text object with one glyph buffer, the positions, text,
+        font sizes and colors of the labels are stored in arrays and support slicing.
+
+        Parameters
+        ----------
+        positions: np.ndarray | Sequence[float]
+            positions of the labels, array-like, shape must be [n, 2] or [n, 3] where n is the number of labels
+
+        text: Sequence[str] | np.ndarray
+            text of each label, must have n elements
+
+        font_sizes: float | int | np.ndarray | Sequence[float], default 14
+            font size of each label, or a single font size for all labels
+
+        colors: str | np.ndarray | Sequence[float] | Sequence[str], default "w"
+            color of each label, or a single color for all labels
+
+        outline_color: str, array, list, tuple, default "w"
+            str or RGBA array to set the outline color of all labels
+
+        outline_thickness: float, default 0
+            relative outline thickness, value between 0.0 - 0.5
+
+        screen_space: bool = True
+            if True, font sizes are in screen space, if False the font sizes are in data space
+
+        anchor: str, default "middle-center"
+            position of the origin of each label, a string representing the vertical and horizontal
+            anchors, separated by a dash
+
+            * Vertical values: "top", "middle", "baseline", "bottom"
+            * Horizontal values: "left", "center", "right"
+
+        culling: "offscreen", "overlap" or None, default None
+            hide labels before each render, see :attr:`culling`
+
+        isolated_buffer: bool, default True
+            If True, initialize a buffer with the same shape as the input positions and then set the data,
+            useful if the input positions are not float32 or if you do not want the graphic to share the
+            array with the input.
+
+        **kwargs
+            passed to :class:`.Graphic`
+
+        """
+
+        if REF_GLYPH_SIZE is None:
+            raise _pygfx_internals_error("import the reference glyph size")
+
+        super().__init__(**kwargs)
+
+        positions = np.asarray(positions)
+        if positions.ndim != 2 or positions.shape[1] not in (2, 3):
+            raise ValueError("label positions must be of shape [n, 2] or [n, 3]")
+
+        n_labels = positions.shape[0]
+
+        if len(text) != n_labels:
+            raise ValueError(
+                f"number of labels in `text` != number of positions: {len(text)} != {n_labels}"
+            )
+
+        self._positions = VertexPositions(
+            positions, isolated_buffer=isolated_buffer, property_name="positions"
+        )
+        self._font_sizes = VertexPointSizes(
+            font_sizes, n_datapoints=n_labels, property_name="font_sizes"
+        )
+        self._colors = VertexColors(colors, n_colors=n_labels)
+        self._outline_color = TextOutlineColor(outline_color)
+        self._outline_thickness = TextOutlineThickness(outline_thickness)
+
+        # 1.0 if the label is shown, 0.0 if it is culled
+        self._visibility = pygfx.Buffer(np.ones(n_labels, dtype=np.float32))
+
+        geometry = pygfx.Geometry(
+            colors=self._colors.buffer,
+            sizes=self._font_sizes.buffer,
+            visibility=self._visibility,
+        )
+
+        # same material settings as TextGraphic
+        world_object = LabelsMultiText(
+            geometry=geometry,
+            material=pygfx.TextMaterial(
+                alpha_mode="auto",
+                render_queue=RenderQueue.auto + 50,
+                aa=True,
+                outline_color=self._outline_color.value,
+                outline_thickness=self._outline_thickness.value,
+                pick_write=True,
+            ),
+            # glyphs are scaled by the per-label font size in the shader
+            font_size=REF_GLYPH_SIZE,
+            screen_space=screen_space,
+            anchor=anchor,
+        )
+
+        # the text object uses the position of each text block to place the labels
+        world_object.geometry.positions = self._positions.buffer
+
+        self._text = LabelsText(text, world_object)
+
+        self._screen_space = screen_space
+        self._anchor = world_object.anchor
+
+        self._culling = None
+        self.culling = culling
+        # state used to determine whether culling needs to be recomputed
+        self._culling_state = None
+        self._culled_positions = None
+        self._culled_font_sizes = None
+
+        self._set_world_object(world_object)
+
+    @property
+    def world_object(self) -> LabelsMultiText:
+        """Text world object"""
+        return super(LabelsGraphic, self).world_object
+
+    @property
+    def positions(self) -> VertexPositions:
+        """Get or set the label positions"""
+        return self._positions
+
+    @positions.setter
+    def positions(self, value):
+        self._positions[:] = value
+
+    @property
+    def text(self) -> LabelsText:
+        """Get or set the text of the labels"""
+        return self._text
+
+    @text.setter
+    def text(self, value: Sequence[str]):
+        self._text.set_value(self, value)
+
+    @property
+    def font_sizes(self) -> VertexPointSizes:
+        """Get or set the font size of the labels"""
+        return self._font_sizes
+
+    @font_sizes.setter
+    def font_sizes(self, value: float | int | np.ndarray | Sequence[float]):
+        self._font_sizes[:] = value
+
+    @property
+    def colors(self) -> VertexColors:
+        """Get or set the colors of the labels"""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value: str | np.ndarray | Sequence[float] | Sequence[str]):
+        self._colors[:] = value
+
+    @property
+    def outline_thickness(self) -> float:
+        """Get or set the outline thickness"""
+        return self._outline_thickness.value
+
+    @outline_thickness.setter
+    def outline_thickness(self, thickness: float):
+        self._outline_thickness.set_value(self, thickness)
+
+    @property
+    def outline_color(self) -> pygfx.Color:
+        """Get or set the outline color"""
+        return self._outline_color.value
+
+    @outline_color.setter
+    def outline_color(self, color: str | np.ndarray | list[float] | tuple[float]):
+        self._outline_color.set_value(self, color)
+
+    @property
+    def culling(self) -> str | None:
+        """
+        Get or set how labels are culled before each render, the font size and character count
+        are used to estimate the screen space extent of each label.
+
+        * ``None``: all labels are shown
+        * ``"offscreen"``: hide labels that are outside the viewport
+        * ``"overlap"``: also hide labels that overlap another label. Labels are placed on a grid of
+          cells the size of a typical label, one label per cell is shown and labels with a lower
+          index have priority.
+        """
+        return self._culling
+
+    @culling.setter
+    def culling(self, value: Literal["offscreen", "overlap"] | None):
+        if value not in (None, "offscreen", "overlap"):
+            raise ValueError(
+                f"`culling` must be one of: None, 'offscreen', or 'overlap', you have passed: {value}"
+            )
+
+        self._culling = value
+        self._culling_state = None
+
+        if value is None:
+            self._set_visibility(np.ones(self._visibility.nitems, dtype=bool))
+
+    @property
+    def visible_labels(self) -> np.ndarray:
+        """bool array, ``True`` for labels that are not culled, read-only"""
+        visible = self._visibility.data > 0
+        visible.flags.writeable = False
+        return visible
+
+    def _set_visibility(self, visible: np.ndarray):
+        visible = visible.astype(np.float32)
+        if np.array_equal(self._visibility.data, visible):
+            return
+
+        self._visibility.data[:] = visible
+        self._visibility.update_full()
+
+    def _get_screen_boxes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Estimate the screen space extent of each label
+
+        Returns
+        -------
+        np.ndarray, np.ndarray, np.ndarray
+            [n, 2] lower left corner, [n, 2] size in logical pixels, and [n] bool, ``True`` if the
+            label is in front of the camera
+
+        """
+        camera = self._plot_area.camera
+        width, height = self._plot_area.viewport.logical_size
+        screen_size = np.array([width, height])
+
+        world_pos = la.vec_transform(
+            self._positions.value, self.world_object.world.matrix
+        )
+        ndc = la.vec_transform(world_pos, camera.camera_matrix)
+
+        # ndc to logical pixels
+        anchors = (ndc[:, :2] + 1) / 2 * screen_size
+        in_depth = (ndc[:, 2] >= 0) & (ndc[:, 2] <= 1)
+
+        font_sizes = self._font_sizes.value
+        if not self._screen_space:
+            # font size is in world units, project a world unit along x to get pixels per unit
+            ndc_x = la.vec_transform(world_pos + [1, 0, 0], camera.camera_matrix)
+            scale = np.linalg.norm(
+                (ndc_x[:, :2] - ndc[:, :2]) / 2 * screen_size, axis=1
+            )
+            font_sizes = font_sizes * scale
+
+        n_chars = self._text._n_chars
+        sizes = np.column_stack(
+            [n_chars * font_sizes * CHAR_WIDTH, font_sizes * LINE_HEIGHT]
+        )
+
+        vertical, horizontal = self._anchor.split("-")
+        offsets = np.array([ANCHOR_OFFSETS[horizontal], ANCHOR_OFFSETS[vertical]])
+
+        return anchors + offsets * sizes, sizes, in_depth
+
+    def _update_culling(self):
+        if self._culling is None:
+            return
+
+        state = (
+            self._culling,
+            self._plot_area.camera.camera_matrix.tobytes(),
+            self.world_object.world.matrix.tobytes(),
+            tuple(self._plot_area.viewport.logical_size),
+            self._text._rev,
+        )
+
+        # buffer revs do not change when the data is modified, so compare with the data of the last update
+        positions, font_sizes = self._positions.value, self._font_sizes.value
+
+        if (
+            state == self._culling_state
+            and np.array_equal(positions, self._culled_positions)
+            and np.array_equal(font_sizes, self._culled_font_sizes)
+        ):
+            # nothing that affects culling has changed since the last render
+            return
+
+        self._culling_state = state
+        self._culled_positions = positions.copy()
+        self._culled_font_sizes = font_sizes.copy()
+
+        corners, sizes, in_depth = self._get_screen_boxes()
+        screen_size = np.array(self._plot_area.viewport.logical_size)
+
+        # label box intersects the viewport
+        visible = (
+            in_depth
+            & np.all(corners + sizes >= 0, axis=1)
+            & np.all(corners <= screen_size, axis=1)
+        )
+
+        if self._culling == "overlap":
+            candidates = np.flatnonzero(visible)
+
+            if candidates.size > 0:
+                # one label per cell, cells are the size of a typical label
+                cell_size = np.maximum(np.median(sizes[candidates], axis=0), 1)
+                centers = corners[candidates] + sizes[candidates] / 2
+                cells = np.floor(centers / cell_size).astype(np.int64)
+
+                # cells are within the viewport (+1 on each side for boxes that are partially visible)
+                n_cols = int(np.ceil(screen_size[0] / cell_size[0])) + 3
+                cell_ids = (cells[:, 1] + 1) * n_cols + (cells[:, 0] + 1)
+
+                # candidates are sorted, so the first label in each cell has the lowest index
+                _, first = np.unique(cell_ids, return_index=True)
+
+                visible[:] = False
+                visible[candidates[first]] = True
+
+        self._set_visibility(visible)
+
+    def _fpl_add_plot_area_hook(self, plot_area):
+        super()._fpl_add_plot_area_hook(plot_area)
+        self._plot_area.add_animations(self._update_culling)
+
+    def _fpl_prepare_del(self):
+        self._plot_area.remove_animation(self._update_culling)
+        super()._fpl_prepare_del()
@@ -17,6 +17,7 @@ from .features import (
     VertexColors,
     UniformColor,
     VertexCmap,
+    VertexCmapTexture,
     SizeSpace,
 )
 from ..utils import quick_min_max
@@ -25,8 +26,8 @@ from ..utils import quick_min_max
 class LineGraphic(PositionsGraphic):
     _features = {
         "data": VertexPositions,
-        "colors": (VertexColors, UniformColor),
-        "cmap": (VertexCmap, None),  # none if UniformColor
+        "colors": (VertexColors, UniformColor, None),  # none if VertexCmapTexture
+        "cmap": (VertexCmap, VertexCmapTexture, None),  # none if UniformColor
         "thickness": Thickness,
         "size_space": SizeSpace,
     }
@@ -39,6 +40,7 @@ class LineGraphic(PositionsGraphic):
         uniform_color: bool = False,
         cmap: str = None,
         cmap_transform: np.ndarray | Sequence = None,
+        cmap_mode: Literal["vertex", "texture"] = "vertex",
         isolated_buffer: bool = True,
         size_space: str = "screen",
         **kwargs,
@@ -73,6 +75,12 @@ class LineGraphic(PositionsGraphic):
         cmap_transform: 1D array-like of numerical values, optional
             if provided, these values are used to map the colors from the cmap
 
+        cmap_mode: str, default "vertex"
+            | "vertex": cmap colors are computed on the CPU and written to the per-vertex RGBA colors buffer
+            | "texture": only the ``cmap_transform`` value of each vertex is stored, the cmap is sampled from a 1D
+            texture on the GPU. Switching the cmap does not upload any per-vertex data and uses 4x less memory
+            than the colors buffer. Colors cannot be set per-vertex in this mode.
+
         size_space: str, default "screen"
             coordinate space in which the thickness is expressed ("screen", "world", "model")
 
@@ -87,6 +95,7 @@ class LineGraphic(PositionsGraphic):
             uniform_color=uniform_color,
             cmap=cmap,
             cmap_transform=cmap_transform,
+            cmap_mode=cmap_mode,
             isolated_buffer=isolated_buffer,
             size_space=size_space,
             **kwargs,
@@ -113,6 +122,20 @@ class LineGraphic(PositionsGraphic):
                 thickness_space=self.size_space,
                 depth_compare="<=",
             )
+        elif cmap_mode == "texture":
+            # sample the cmap texture using the per-vertex transform values
+            material = MaterialCls(
+                aa=aa,
+                thickness=self.thickness,
+                color_mode="vertex_map",
+                map=self._cmap.texture_map,
+                pick_write=True,
+                thickness_space=self.size_space,
+                depth_compare="<=",
+            )
+            geometry = pygfx.Geometry(
+                positions=self._data.buffer, texcoords=self._cmap.buffer
+            )
         else:
             material = MaterialCls(
                 aa=aa,
@@ -17,6 +17,7 @@ from .features import (
     VolumeSlicePlane,
     PolygonData,
     triangulate_polygon,
+    VertexNormals,
 )
 
 
@@ -28,6 +29,9 @@ class MeshGraphic(Graphic):
         "cmap": MeshCmap,
     }
 
+    # compute vertex normals for the phong lighting model, and update them when the positions change
+    _fpl_vertex_normals: bool = True
+
     def __init__(
         self,
         positions: Any,
@@ -97,7 +101,7 @@ class MeshGraphic(Graphic):
                 positions, isolated_buffer=isolated_buffer, property_name="positions"
             )
 
-        if isinstance(positions, MeshIndices):
+        if isinstance(indices, MeshIndices):
             self._indices = indices
         else:
             self._indices = MeshIndices(
@@ -147,6 +151,13 @@ class MeshGraphic(Graphic):
             raise ValueError(f"mode must be one of: {valid_modes}\nYou passed: {mode}")
         self._mode = mode
 
+        if mode == "phong" and self._fpl_vertex_normals:
+            self._normals = VertexNormals(self._positions, self._indices)
+            geometry.normals = self._normals.buffer
+        else:
+            # not used for lighting
+            self._normals = None
+
         material_cls = getattr(pygfx, f"Mesh{mode.capitalize()}Material")
 
         if mode == "slice":
@@ -211,6 +222,18 @@ class MeshGraphic(Graphic):
     def indices(self, mew_indices):
         self._indices[:] = mew_indices
 
+    @property
+    def normals(self) -> np.ndarray | None:
+        """
+        Get the vertex normals, only computed for the ``"phong"`` render mode.
+        The normals are recomputed automatically when the positions or indices change.
+        """
+        if self._normals is None:
+            return None
+
+        self._normals.wait()
+        return self._normals.value
+
     @property
     def mapcoords(self) -> np.ndarray | None:
         """get or set the mapcoords"""
@@ -312,6 +335,22 @@ class MeshGraphic(Graphic):
 
         return info
 
+    def _fpl_add_plot_area_hook(self, plot_area):
+        super()._fpl_add_plot_area_hook(plot_area)
+
+        if self._normals is not None:
+            # normals of large meshes can be computed in a worker thread, they are applied before rendering
+            self._normals._use_worker = True
+            self._plot_area.add_animations(self._apply_normals)
+
+    def _apply_normals(self):
+        self._normals._fpl_apply_pending()
+
+    def _fpl_prepare_del(self):
+        if self._normals is not None:
+            self._normals._fpl_shutdown()
+        super()._fpl_prepare_del()
+
 
 class SurfaceGraphic(MeshGraphic):
     _features = {
@@ -409,6 +448,9 @@ class PolygonGraphic(MeshGraphic):
         "cmap": MeshCmap,
     }
 
+    # the polygon buffers are resized when the data changes, polygons are flat so the normals are constant
+    _fpl_vertex_normals = False
+
     def __init__(
         self,
         data: np.ndarray,
@@ -457,7 +499,7 @@ class PolygonGraphic(MeshGraphic):
 
         positions, indices = triangulate_polygon(data)
 
-        self._data = PolygonData(positions)
+        self._data = PolygonData(positions, indices)
 
         super().__init__(
             positions,
@@ -0,0 +1,208 @@
+from typing import Sequence
+
+import numpy as np
+
+import pygfx
+
+from ._base import Graphic
+from .features import PolygonColors, PolygonVisibility
+from ..utils.triangulation import triangulate_polygons
+
+
+class PolygonsGraphic(Graphic):
+    _features = {
+        "colors": PolygonColors,
+        "visibility": PolygonVisibility,
+    }
+
+    def __init__(
+        self,
+        data: Sequence[np.ndarray],
+        colors: str | np.ndarray | Sequence[float] | Sequence[str] = "w",
+        visibility: bool | np.ndarray | Sequence[bool] = True,
+        outline_thickness: float = 0.0,
+        outline_color: str | Sequence[float] = "w",
+        **kwargs,
+    ):
+        """
+        Create a graphic that draws many filled polygons, such as regions of interest or segmentation masks.
+
+        All polygons are triangulated together and packed into a single mesh, each polygon is a contiguous
+        range of the vertices and faces of the mesh. The colors and visibility of the polygons can be set
+        for many polygons at once without triangulating the polygons again.
+
+        If ``outline_thickness`` is greater than zero the outlines of all polygons are drawn with a single line,
+        the outlines of the polygons are separated by NaN vertices. The outline is not pickable, and it is
+        only shown for visible polygons.
+
+        Parameters
+        ----------
+        data: Sequence[np.ndarray]
+            the vertices of each polygon, each polygon must be array-like of shape [n_vertices, 2] or
+            [n_vertices, 3]. Polygons are triangulated in the 'xy' plane.
+
+        colors: str | np.ndarray | Sequence[float] | Sequence[str], default "w"
+            color of each polygon, or a single color for all polygons
+
+        visibility: bool | np.ndarray | Sequence[bool], default True
+            visibility of each polygon, or a single bool for all polygons
+
+        outline_thickness: float, default 0.0
+            thickness of the outline of the polygons in screen pixels, no outline is drawn if 0
+
+        outline_color: str | Sequence[float], default "w"
+            color of the outline of all polygons
+
+        **kwargs
+            passed to :class:`.Graphic`
+
+        """
+
+        super().__init__(**kwargs)
+
+        polygons = [np.asarray(p, dtype=np.float32) for p in data]
+
+        if len(polygons) == 0:
+            raise ValueError("`data` must contain at least one polygon")
+
+        for p in polygons:
+            if p.ndim != 2 or p.shape[1] not in (2, 3):
+                raise ValueError(
+                    f"polygon vertex data must be of shape [n_vertices, 2] or [n_vertices, 3], "
+                    f"you passed an array of shape: {p.shape}"
+                )
+
+        faces, face_offsets = triangulate_polygons(polygons)
+
+        if faces.shape[0] == 0:
+            raise ValueError("polygons must have at least 3 vertices")
+
+        sizes = np.array([p.shape[0] for p in polygons])
+        self._vertex_offsets = np.concatenate([[0], np.cumsum(sizes)])
+        self._face_offsets = face_offsets
+
+        positions = np.zeros((self._vertex_offsets[-1], 3), dtype=np.float32)
+        for p, start in zip(polygons, self._vertex_offsets[:-1]):
+            positions[start : start + p.shape[0], : p.shape[1]] = p
+
+        self._positions = pygfx.Buffer(positions)
+
+        if outline_thickness > 0:
+            outline_positions, outline_offsets = self._make_outline(positions)
+            outline_buffer = pygfx.Buffer(outline_positions)
+        else:
+            outline_buffer, outline_offsets = None, None
+
+        self._colors = PolygonColors(colors, self._vertex_offsets)
+        self._visibility = PolygonVisibility(
+            visibility, faces, face_offsets, outline_buffer, outline_offsets
+        )
+
+        geometry = pygfx.Geometry(
+            positions=self._positions,
+            indices=self._visibility.buffer,
+            colors=self._colors.buffer,
+        )
+
+        material = pygfx.MeshBasicMaterial(color_mode="vertex", pick_write=True)
+
+        world_object = pygfx.Mesh(geometry=geometry, material=material)
+
+        if outline_buffer is not None:
+            # child of the mesh, it follows the visibility and transform of the graphic
+            self._outline = pygfx.Line(
+                geometry=pygfx.Geometry(positions=outline_buffer),
+                material=pygfx.LineMaterial(
+                    thickness=outline_thickness,
+                    color=outline_color,
+                    opacity=self.alpha,
+                    alpha_mode=self.alpha_mode,
+                    pick_write=False,
+                ),
+            )
+            world_object.add(self._outline)
+            self.add_event_handler(self._update_outline, "alpha", "alpha_mode")
+        else:
+            self._outline = None
+
+        self._set_world_object(world_object)
+
+    def _make_outline(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        positions of the outline line, the vertices of each polygon followed by its first vertex and a NaN
+        separator, and the offsets of the outline vertices of each polygon
+        """
+        n_polygons = self._vertex_offsets.size - 1
+        sizes = np.diff(self._vertex_offsets)
+
+        outline_offsets = np.concatenate([[0], np.cumsum(sizes + 2)])
+        outline = np.full((outline_offsets[-1], 3), np.nan, dtype=np.float32)
+
+        # every polygon adds 2 vertices before the next polygon
+        polygon_ids = np.repeat(np.arange(n_polygons), sizes)
+        outline[np.arange(positions.shape[0]) + 2 * polygon_ids] = positions
+
+        # close each polygon
+        closed = np.flatnonzero(sizes > 0)
+        outline[outline_offsets[closed + 1] - 2] = positions[
+            self._vertex_offsets[closed]
+        ]
+
+        return outline, outline_offsets
+
+    def _update_outline(self, ev):
+        # the outline is a child of the mesh, the graphic alpha is only set on the mesh material
+        if ev.type == "alpha":
+            self._outline.material.opacity = ev.info["value"]
+        else:
+            self._outline.material.alpha_mode = ev.info["value"]
+
+    @property
+    def n_polygons(self) -> int:
+        """number of polygons"""
+        return self._vertex_offsets.size - 1
+
+    @property
+    def data(self) -> list[np.ndarray]:
+        """the [n_vertices, 3] vertices of each polygon, read-only"""
+        positions = self._positions.data
+        return [
+            positions[start:stop]
+            for start, stop in zip(self._vertex_offsets[:-1], self._vertex_offsets[1:])
+        ]
+
+    @property
+    def vertex_offsets(self) -> np.ndarray:
+        """the vertices of polygon ``i`` are in the range ``vertex_offsets[i]:vertex_offsets[i + 1]`` of the mesh vertices"""
+        return self._vertex_offsets
+
+    @property
+    def face_offsets(self) -> np.ndarray:
+        """the faces of polygon ``i`` are in the range ``face_offsets[i]:face_offsets[i + 1]`` of the mesh faces"""
+        return self._face_offsets
+
+    @property
+    def colors(self) -> PolygonColors:
+        """Get or set the color of each polygon"""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value: str | np.ndarray | Sequence[float] | Sequence[str]):
+        self._colors.set_value(self, value)
+
+    @property
+    def visibility(self) -> PolygonVisibility:
+        """Get or set the visibility of each polygon"""
+        return self._visibility
+
+    @visibility.setter
+    def visibility(self, value: bool | np.ndarray | Sequence[bool]):
+        self._visibility.set_value(self, value)
+
+    def get_polygon_index(self, face_index: int) -> int:
+        """get the index of the polygon that a mesh face belongs to, ex: the ``face_index`` from pick info"""
+        return int(np.searchsorted(self._face_offsets, face_index, side="right") - 1)
+
+    def format_pick_info(self, pick_info: dict) -> str:
+        index = self.get_polygon_index(pick_info["face_index"])
+        return f"polygon: {index}"
@@ -12,6 +12,7 @@ from .features import (
     VertexColors,
     UniformColor,
     VertexCmap,
+    VertexCmapTexture,
     VertexMarkers,
     UniformMarker,
     UniformEdgeColor,
@@ -26,8 +27,8 @@ class ScatterGraphic(PositionsGraphic):
     _features = {
         "data": VertexPositions,
         "sizes": (VertexPointSizes, UniformSize),
-        "colors": (VertexColors, UniformColor),
-        "cmap": (VertexCmap, None),
+        "colors": (VertexColors, UniformColor, None),
+        "cmap": (VertexCmap, VertexCmapTexture, None),
         "markers": (VertexMarkers, UniformMarker, None),
         "edge_colors": (UniformEdgeColor, VertexColors, None),
         "edge_width": (EdgeWidth, None),
@@ -43,8 +44,9 @@ class ScatterGraphic(PositionsGraphic):
         uniform_color: bool = False,
         cmap: str = None,
         cmap_transform: np.ndarray = None,
+        cmap_mode: Literal["vertex", "texture"] = "vertex",
         mode: Literal["markers", "simple", "gaussian", "image"] = "markers",
-        markers: str | np.ndarray | Sequence[str] = "o",
+        markers: str | int | np.ndarray | Sequence[str | int] = "o",
         uniform_marker: bool = False,
         custom_sdf: str = None,
         edge_colors: str | np.ndarray | pygfx.Color | Sequence[float] = "black",
@@ -84,6 +86,12 @@ class ScatterGraphic(PositionsGraphic):
         cmap_transform: 1D array-like or list of numerical values, optional
             if provided, these values are used to map the colors from the cmap
 
+        cmap_mode: str, default "vertex"
+            | "vertex": cmap colors are computed on the CPU and written to the per-vertex RGBA colors buffer
+            | "texture": only the ``cmap_transform`` value of each point is stored, the cmap is sampled from a 1D
+            texture on the GPU. Switching the cmap does not upload any per-point data and uses 4x less memory
+            than the colors buffer. Colors cannot be set per-point in this mode.
+
         mode: one of: "markers", "simple", "gaussian", "image", default "markers"
             The scatter points mode, cannot be changed after the graphic has been created.
 
@@ -92,7 +100,7 @@ class ScatterGraphic(PositionsGraphic):
             * gaussian: each point is a gaussian blob
             * image: use an image for each point, pass an array to the `image` kwarg, these are also called sprites
 
-        markers: None | str | np.ndarray | Sequence[str], default "o"
+        markers: None | str | int | np.ndarray | Sequence[str | int], default "o"
             The shape of the markers when `mode` is "markers"
 
             Supported values:
@@ -102,10 +110,12 @@ class ScatterGraphic(PositionsGraphic):
             * Unicode symbols: "●○■♦♥♠♣✳▲▼◀▶".
             * Emojis: "❤️♠️♣️♦️💎💍✳️📍".
             * A string containing the value "custom". In this case, WGSL code defined by ``custom_sdf`` will be used.
+            * An integer code from the pygfx.MarkerInt enum, an array of integer codes is the fastest way to set
+              per-vertex markers.
 
         uniform_marker: bool, default False
             Use the same marker for all points. Only valid when `mode` is "markers". Useful if you need to use
-            the same marker for all points and want to save GPU RAM.
+            the same marker for all points and want to save GPU RAM. ``markers`` must be a single str or int.
 
         custom_sdf: str = None,
             The SDF code for the marker shape when the marker is set to custom.
@@ -169,6 +179,7 @@ class ScatterGraphic(PositionsGraphic):
             uniform_color=uniform_color,
             cmap=cmap,
             cmap_transform=cmap_transform,
+            cmap_mode=cmap_mode,
             isolated_buffer=isolated_buffer,
             size_space=size_space,
             **kwargs,
@@ -200,9 +211,9 @@ class ScatterGraphic(PositionsGraphic):
                 material = pygfx.PointsMarkerMaterial
 
                 if uniform_marker:
-                    if not isinstance(markers, str):
+                    if not isinstance(markers, (str, int, np.integer)):
                         raise TypeError(
-                            "must pass a single <str> marker if uniform_marker is True"
+                            "must pass a single <str> or <int> marker if uniform_marker is True"
                         )
 
                     self._markers = UniformMarker(markers)
@@ -277,6 +288,11 @@ class ScatterGraphic(PositionsGraphic):
         if uniform_color:
             material_kwargs["color_mode"] = pygfx.ColorMode.uniform
             material_kwargs["color"] = self.colors
+        elif cmap_mode == "texture":
+            # sample the cmap texture using the per-point transform values
+            material_kwargs["color_mode"] = pygfx.ColorMode.vertex_map
+            material_kwargs["map"] = self._cmap.texture_map
+            geo_kwargs["texcoords"] = self._cmap.buffer
         else:
             material_kwargs["color_mode"] = pygfx.ColorMode.vertex
             geo_kwargs["colors"] = self.colors.buffer
@@ -333,7 +349,7 @@ class ScatterGraphic(PositionsGraphic):
             return self._markers.value
 
     @markers.setter
-    def markers(self, value: str | np.ndarray[str] | Sequence[str]):
+    def markers(self, value: str | int | np.ndarray | Sequence[str | int]):
         if self.mode != "markers":
             raise AttributeError(
                 f"scatter plot is: {self.mode}. The mode must be 'markers' to set the markers"
@@ -366,7 +366,7 @@ class PolygonSelector(BaseSelector):
                     ixs.append(g_ixs)
             else:
                 # map only this graphic
-                points = source.data.value[:2]
+                points = source.data.value[:, :2] + source.offset[:2]
                 ixs = np.where(
                     (points[:, 0] >= xmin)
                     & (points[:, 0] <= xmax)
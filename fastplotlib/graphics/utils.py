@@ -1,4 +1,4 @@
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
 
 from ._base import Graphic
 
@@ -35,3 +35,37 @@ def pause_events(*graphics: Graphic):
 
     for g, value in zip(graphics, original_vals):
         g.block_events = value
+
+
+@contextmanager
+def batch_update(*graphics: Graphic):
+    """
+    Context manager for batching feature updates across multiple graphics.
+
+    Buffer uploads and feature events are deferred until the context manager exits,
+    see :meth:`Graphic.batch_update`.
+
+    Examples
+    --------
+
+    .. code-block::
+
+        # pass in any number of graphics
+        with fpl.batch_update(scatter, line):
+            scatter.data[:, 1] = ys
+            scatter.colors = colors
+            line.data[:, 1] = ys
+
+        # context manager exited, buffers are uploaded and one event is emitted per changed feature
+
+    """
+    if not all([isinstance(g, Graphic) for g in graphics]):
+        raise TypeError(
+            f"`batch_update` only takes Graphic instances as arguments, "
+            f"you have passed the following types:\n{[type(g) for g in graphics]}"
+        )
+
+    with ExitStack() as stack:
+        for g in graphics:
+            stack.enter_context(g.batch_update())
+        yield
@@ -3,8 +3,16 @@ from ._subplot import Subplot
 from ._utils import IMGUI
 
 if IMGUI:
-    from ._imgui_figure import ImguiFigure
-
     __all__ = ["Figure", "ImguiFigure"]
 else:
     __all__ = ["Figure"]
+
+
+def __getattr__(name: str):
+    # ImguiFigure is imported on first use, it imports fastplotlib.ui which imports from the layouts
+    if name == "ImguiFigure" and IMGUI:
+        from ._imgui_figure import ImguiFigure
+
+        return ImguiFigure
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,7 @@ from ._utils import controller_types as valid_controller_types
 from ._subplot import Subplot
 from ._engine import GridLayout, WindowLayout, ScreenSpaceCamera
 from .. import ImageGraphic
+from ..graphics._memory import total_usage, usage_by_name, format_bytes
 
 
 class Figure:
@@ -124,6 +125,9 @@ class Figure:
             subplot names, ignored if extents or rects are provided as a dict
 
         """
+        # {"gpu": nbytes | None, "host": nbytes | None}, see set_memory_budget()
+        self._memory_budget = dict.fromkeys(["gpu", "host"])
+
         # create canvas and renderer
         if canvas_kwargs is not None:
             if size not in canvas_kwargs.keys():
@@ -680,8 +684,13 @@ class Figure:
     def _call_animate_functions(self, funcs: list[callable]):
         for fn in funcs:
             try:
-                if len(getfullargspec(fn).args) > 0:
-                    fn(self)
+                args = getfullargspec(fn).args
+
+                if len(args) > 0:
+                    if args[0] == "self" and not len(args) > 1:
+                        fn()
+                    else:
+                        fn(self)
                 else:
                     fn()
             except (ValueError, TypeError):
@@ -782,6 +791,142 @@ class Figure:
         for subplot in self:
             subplot.clear()
 
+    def memory_report(self) -> dict:
+        """
+        Host and GPU memory used by all graphics in this Figure, in bytes.
+
+        Usage is given as a dict with the keys ``"host"``, ``"gpu"``, ``"shared_host"`` and ``"shared_gpu"``,
+        see ``Graphic.memory_usage()``. Each array or resource is counted once across the entire Figure, and
+        those that are used by more than one graphic are counted as shared.
+
+        Returns
+        -------
+        dict
+            .. code-block:: py
+
+                {
+                    "total": usage,
+                    "subplots": {
+                        subplot_name: {
+                            "total": usage,
+                            "graphics": {graphic_label: {feature_name: usage, ..., "total": usage}},
+                        },
+                    },
+                }
+
+            Subplots without a name use their index in the Figure. Graphics without a name are labelled by their
+            type and address. Graphics in the docks of a subplot are included with the subplot.
+
+        """
+        entries = list()
+        for i, subplot in enumerate(self):
+            subplot_name = str(subplot.name) if subplot.name is not None else i
+
+            for plot_area in [subplot, *subplot.docks.values()]:
+                for graphic in plot_area.objects:
+                    entries.append((subplot_name, graphic, graphic._fpl_memory_items()))
+
+        # number of graphics that use each array or resource
+        n_users = dict()
+        for _, _, items in entries:
+            for key in {
+                item.key for feature_items in items.values() for item in feature_items
+            }:
+                n_users[key] = n_users.get(key, 0) + 1
+
+        shared_keys = {key for key, n in n_users.items() if n > 1}
+
+        subplots = dict()
+        seen = set()
+        for subplot_name, graphic, items in entries:
+            usage = usage_by_name(items, seen=seen, shared_keys=shared_keys)
+            usage["total"] = total_usage(usage.values())
+
+            if graphic.name is not None:
+                label = graphic.name
+            else:
+                label = f"{graphic.__class__.__name__} at {graphic._fpl_address}"
+
+            subplot_report = subplots.setdefault(
+                subplot_name, {"total": None, "graphics": dict()}
+            )
+            subplot_report["graphics"][label] = usage
+
+        for subplot_report in subplots.values():
+            subplot_report["total"] = total_usage(
+                usage["total"] for usage in subplot_report["graphics"].values()
+            )
+
+        return {
+            "total": total_usage(r["total"] for r in subplots.values()),
+            "subplots": subplots,
+        }
+
+    @property
+    def memory_budget(self) -> dict[str, int | None]:
+        """memory budget in bytes, ``{"gpu": nbytes | None, "host": nbytes | None}``, see ``set_memory_budget()``"""
+        return dict(self._memory_budget)
+
+    def set_memory_budget(self, gpu: int | None = None, host: int | None = None):
+        """
+        Set a memory budget for this Figure. A ``RuntimeWarning`` is given when a graphic is added and the
+        total usage of the Figure exceeds the budget.
+
+        Parameters
+        ----------
+        gpu: int | None
+            budget in bytes for GPU buffers and textures, including those shared between graphics.
+            ``None`` for no budget.
+
+        host: int | None
+            budget in bytes for host arrays that are owned by the graphics, such as isolated copies of data.
+            Arrays that are shared with the user, such as arrays used with ``isolated_buffer=False``, are not
+            counted. ``None`` for no budget.
+
+        """
+        for kind, value in [("gpu", gpu), ("host", host)]:
+            if value is not None and value < 0:
+                raise ValueError(f"`{kind}` memory budget must be >= 0 or None")
+
+        self._memory_budget = {"gpu": gpu, "host": host}
+
+        self.check_memory_budget()
+
+    def check_memory_budget(self) -> bool:
+        """
+        Check the total memory usage of this Figure against the memory budget, gives a ``RuntimeWarning``
+        if the budget is exceeded.
+
+        Returns
+        -------
+        bool
+            ``True`` if the usage is within the budget
+
+        """
+        if all(v is None for v in self._memory_budget.values()):
+            return True
+
+        total = self.memory_report()["total"]
+
+        usage = {
+            "gpu": total["gpu"] + total["shared_gpu"],
+            "host": total["host"],
+        }
+
+        within_budget = True
+        for kind, budget in self._memory_budget.items():
+            if budget is None or usage[kind] <= budget:
+                continue
+
+            within_budget = False
+            warn(
+                f"{self.__class__.__name__} {kind} memory usage of {format_bytes(usage[kind])} exceeds the "
+                f"budget of {format_bytes(budget)}, see `Figure.memory_report()` for a breakdown",
+                RuntimeWarning,
+            )
+
+        return within_budget
+
     def export_numpy(self, rgb: bool = False) -> np.ndarray:
         """
         Export a snapshot of the Figure as numpy array.
@@ -101,6 +101,8 @@ class GraphicMethodsMixin:
         emissive: str | tuple | numpy.ndarray = (0, 0, 0),
         shininess: int = 30,
         isolated_buffer: bool = True,
+        brick_size: int = None,
+        empty_threshold: float = None,
         **kwargs,
     ) -> ImageVolumeGraphic:
         """
@@ -163,6 +165,22 @@ class GraphicMethodsMixin:
             data arrays are ready-only such as memmaps. If False, the input array is itself used as the
             buffer - useful if the array is large.
 
+        brick_size: int, optional
+            Split the volume into bricks of this size along each dimension, for example 64. Bricks that cannot
+            contribute to the rendered image are skipped when rendering: bricks whose max is below ``threshold``
+            in "iso" mode, bricks whose max is below ``vmin`` in "mip" mode and bricks whose min is above
+            ``vmax`` in "minip" mode. Useful for sparse volumes that are mostly background. By default the
+            volume is only split at the GPU's max texture size.
+
+            The bricks overlap by one voxel so that there are no seams between them. In "mip" mode the bricks
+            are composed with max blending, the color of each pixel is the per-channel max of the colors of
+            the bricks along the ray. This is the exact MIP for colormaps whose channels increase with the
+            value, such as "gray", and on a black background.
+
+        empty_threshold: float, optional
+            Bricks whose max value is at or below this threshold are empty, they are not uploaded to the GPU
+            and never rendered. Usually the background level of the volume, used with ``brick_size``.
+
         kwargs
             additional keyword arguments passed to :class:`.Graphic`
 
@@ -184,6 +202,87 @@ class GraphicMethodsMixin:
             emissive,
             shininess,
             isolated_buffer,
+            brick_size,
+            empty_threshold,
+            **kwargs,
+        )
+
+    def add_labels(
+        self,
+        positions: Union[numpy.ndarray, Sequence[float]],
+        text: Union[Sequence[str], numpy.ndarray],
+        font_sizes: Union[float, int, numpy.ndarray, Sequence[float]] = 14,
+        colors: Union[str, numpy.ndarray, Sequence[float], Sequence[str]] = "w",
+        outline_color: str | numpy.ndarray | list[float] | tuple[float] = "w",
+        outline_thickness: float = 0.0,
+        screen_space: bool = True,
+        anchor: str = "middle-center",
+        culling: Optional[Literal["offscreen", "overlap"]] = None,
+        isolated_buffer: bool = True,
+        **kwargs,
+    ) -> LabelsGraphic:
+        """
+
+        Create a graphic that draws many text labels, such as annotations for a large number of points.
+
+        All labels are drawn by a single text object with one glyph buffer, the positions, text,
+        font sizes and colors of the labels are stored in arrays and support slicing.
+
+        Parameters
+        ----------
+        positions: np.ndarray | Sequence[float]
+            positions of the labels, array-like, shape must be [n, 2] or [n, 3] where n is the number of labels
+
+        text: Sequence[str] | np.ndarray
+            text of each label, must have n elements
+
+        font_sizes: float | int | np.ndarray | Sequence[float], default 14
+            font size of each label, or a single font size for all labels
+
+        colors: str | np.ndarray | Sequence[float] | Sequence[str], default "w"
+            color of each label, or a single color for all labels
+
+        outline_color: str, array, list, tuple, default "w"
+            str or RGBA array to set the outline color of all labels
+
+        outline_thickness: float, default 0
+            relative outline thickness, value between 0.0 - 0.5
+
+        screen_space: bool = True
+            if True, font sizes are in screen space, if False the font sizes are in data space
+
+        anchor: str, default "middle-center"
+            position of the origin of each label, a string representing the vertical and horizontal
+            anchors, separated by a dash
+
+            * Vertical values: "top", "middle", "baseline", "bottom"
+            * Horizontal values: "left", "center", "right"
+
+        culling: "offscreen", "overlap" or None, default None
+            hide labels before each render, see :attr:`culling`
+
+        isolated_buffer: bool, default True
+            If True, initialize a buffer with the same shape as the input positions and then set the data,
+            useful if the input positions are not float32 or if you do not want the graphic to share the
+            array with the input.
+
+        **kwargs
+            passed to :class:`.Graphic`
+
+
+        """
+        return self._create_graphic(
+            LabelsGraphic,
+            positions,
+            text,
+            font_sizes,
+            colors,
+            outline_color,
+            outline_thickness,
+            screen_space,
+            anchor,
+            culling,
+            isolated_buffer,
             **kwargs,
         )
 
@@ -281,6 +380,7 @@ class GraphicMethodsMixin:
         uniform_color: bool = False,
         cmap: str = None,
         cmap_transform: Union[numpy.ndarray, Sequence] = None,
+        cmap_mode: Literal["vertex", "texture"] = "vertex",
         isolated_buffer: bool = True,
         size_space: str = "screen",
         **kwargs,
@@ -316,6 +416,12 @@ class GraphicMethodsMixin:
         cmap_transform: 1D array-like of numerical values, optional
             if provided, these values are used to map the colors from the cmap
 
+        cmap_mode: str, default "vertex"
+            | "vertex": cmap colors are computed on the CPU and written to the per-vertex RGBA colors buffer
+            | "texture": only the ``cmap_transform`` value of each vertex is stored, the cmap is sampled from a 1D
+            texture on the GPU. Switching the cmap does not upload any per-vertex data and uses 4x less memory
+            than the colors buffer. Colors cannot be set per-vertex in this mode.
+
         size_space: str, default "screen"
             coordinate space in which the thickness is expressed ("screen", "world", "model")
 
@@ -332,6 +438,7 @@ class GraphicMethodsMixin:
             uniform_color,
             cmap,
             cmap_transform,
+            cmap_mode,
             isolated_buffer,
             size_space,
             **kwargs,
@@ -570,6 +677,60 @@ class GraphicMethodsMixin:
             PolygonGraphic, data, mode, colors, mapcoords, cmap, clim, **kwargs
         )
 
+    def add_polygons(
+        self,
+        data: Sequence[numpy.ndarray],
+        colors: Union[str, numpy.ndarray, Sequence[float], Sequence[str]] = "w",
+        visibility: Union[bool, numpy.ndarray, Sequence[bool]] = True,
+        outline_thickness: float = 0.0,
+        outline_color: Union[str, Sequence[float]] = "w",
+        **kwargs,
+    ) -> PolygonsGraphic:
+        """
+
+        Create a graphic that draws many filled polygons, such as regions of interest or segmentation masks.
+
+        All polygons are triangulated together and packed into a single mesh, each polygon is a contiguous
+        range of the vertices and faces of the mesh. The colors and visibility of the polygons can be set
+        for many polygons at once without triangulating the polygons again.
+
+        If ``outline_thickness`` is greater than zero the outlines of all polygons are drawn with a single line,
+        the outlines of the polygons are separated by NaN vertices. The outline is not pickable, and it is
+        only shown for visible polygons.
+
+        Parameters
+        ----------
+        data: Sequence[np.ndarray]
+            the vertices of each polygon, each polygon must be array-like of shape [n_vertices, 2] or
+            [n_vertices, 3]. Polygons are triangulated in the 'xy' plane.
+
+        colors: str | np.ndarray | Sequence[float] | Sequence[str], default "w"
+            color of each polygon, or a single color for all polygons
+
+        visibility: bool | np.ndarray | Sequence[bool], default True
+            visibility of each polygon, or a single bool for all polygons
+
+        outline_thickness: float, default 0.0
+            thickness of the outline of the polygons in screen pixels, no outline is drawn if 0
+
+        outline_color: str | Sequence[float], default "w"
+            color of the outline of all polygons
+
+        **kwargs
+            passed to :class:`.Graphic`
+
+
+        """
+        return self._create_graphic(
+            PolygonsGraphic,
+            data,
+            colors,
+            visibility,
+            outline_thickness,
+            outline_color,
+            **kwargs,
+        )
+
     def add_scatter(
         self,
         data: Any,
@@ -577,8 +738,9 @@ class GraphicMethodsMixin:
         uniform_color: bool = False,
         cmap: str = None,
         cmap_transform: numpy.ndarray = None,
+        cmap_mode: Literal["vertex", "texture"] = "vertex",
         mode: Literal["markers", "simple", "gaussian", "image"] = "markers",
-        markers: Union[str, numpy.ndarray, Sequence[str]] = "o",
+        markers: Union[str, int, numpy.ndarray, Sequence[str | int]] = "o",
         uniform_marker: bool = False,
         custom_sdf: str = None,
         edge_colors: Union[
@@ -621,6 +783,12 @@ class GraphicMethodsMixin:
         cmap_transform: 1D array-like or list of numerical values, optional
             if provided, these values are used to map the colors from the cmap
 
+        cmap_mode: str, default "vertex"
+            | "vertex": cmap colors are computed on the CPU and written to the per-vertex RGBA colors buffer
+            | "texture": only the ``cmap_transform`` value of each point is stored, the cmap is sampled from a 1D
+            texture on the GPU. Switching the cmap does not upload any per-point data and uses 4x less memory
+            than the colors buffer. Colors cannot be set per-point in this mode.
+
         mode: one of: "markers", "simple", "gaussian", "image", default "markers"
             The scatter points mode, cannot be changed after the graphic has been created.
 
@@ -629,7 +797,7 @@ class GraphicMethodsMixin:
             * gaussian: each point is a gaussian blob
             * image: use an image for each point, pass an array to the `image` kwarg, these are also called sprites
 
-        markers: None | str | np.ndarray | Sequence[str], default "o"
+        markers: None | str | int | np.ndarray | Sequence[str | int], default "o"
             The shape of the markers when `mode` is "markers"
 
             Supported values:
@@ -639,10 +807,12 @@ class GraphicMethodsMixin:
             * Unicode symbols: "●○■♦♥♠♣✳▲▼◀▶".
             * Emojis: "❤️♠️♣️♦️💎💍✳️📍".
             * A string containing the value "custom". In this case, WGSL code defined by ``custom_sdf`` will be used.
+            * An integer code from the pygfx.MarkerInt enum, an array of integer codes is the fastest way to set
+              per-vertex markers.
 
         uniform_marker: bool, default False
             Use the same marker for all points. Only valid when `mode` is "markers". Useful if you need to use
-            the same marker for all points and want to save GPU RAM.
+            the same marker for all points and want to save GPU RAM. ``markers`` must be a single str or int.
 
         custom_sdf: str = None,
             The SDF code for the marker shape when the marker is set to custom.
@@ -707,6 +877,7 @@ class GraphicMethodsMixin:
             uniform_color,
             cmap,
             cmap_transform,
+            cmap_mode,
             mode,
             markers,
             uniform_marker,
@@ -711,6 +711,8 @@ class PlotArea(GraphicMethodsMixin):
 
         graphic._fpl_add_plot_area_hook(self)
 
+        self.get_figure().check_memory_budget()
+
     def _check_graphic_name_exists(self, name):
         if name in self:
             raise ValueError(
@@ -7,6 +7,7 @@ import pygfx
 from pygfx import WgpuRenderer, Texture, Renderer
 
 from ..utils.gui import BaseRenderCanvas, RenderCanvas
+from ..utils.gpu import check_adapters
 
 try:
     import imgui_bundle
@@ -30,6 +31,9 @@ def make_canvas_and_renderer(
     as a tuple (canvas, renderer)
     """
 
+    # adapters are enumerated when the first canvas and renderer are created, not at import
+    check_adapters()
+
     if canvas is None:
         canvas = RenderCanvas(**canvas_kwargs)
     elif isinstance(canvas, str):
@@ -29,11 +29,31 @@ class LegendItem:
         self._label = label
         self._color = color
 
+        # [[xmin, ymin], [xmax, ymax]] of the item relative to its position, cached for the legend layout
+        self._extent: np.ndarray = None
+
+    @property
+    def width(self) -> float:
+        """width of the legend item"""
+        return self._extent[1, 0] - self._extent[0, 0]
+
+    @property
+    def height(self) -> float:
+        """height of the legend item"""
+        return self._extent[1, 1] - self._extent[0, 1]
+
+    def _compute_extent(self):
+        # only computed when the item is created or its label changes, computing
+        # the bounding box of the text is expensive
+        bbox = self.world_object.get_bounding_box()
+        if bbox is None:
+            self._extent = np.zeros((2, 2))
+        else:
+            self._extent = bbox[:, :2] - self.world_object.local.position[:2]
+
 
 class LineLegendItem(LegendItem):
-    def __init__(
-        self, parent, graphic: LineGraphic, label: str, position: tuple[int, int]
-    ):
+    def __init__(self, parent, graphic: LineGraphic, label: str):
         """
 
         Parameters
@@ -41,15 +61,13 @@ class LineLegendItem(LegendItem):
         graphic: LineGraphic
 
         label: str
-
-        position: [x, y]
         """
 
         if label is not None:
             pass
 
         elif graphic.name is not None:
-            pass
+            label = graphic.name
 
         else:
             raise ValueError(
@@ -57,6 +75,9 @@ class LineLegendItem(LegendItem):
             )
 
         # for now only support lines with a single color
+        if graphic.colors is None:
+            raise ValueError("Use colorbars for lines with a texture cmap, not legends")
+
         if np.unique(graphic.colors.value, axis=0).shape[0] > 1:
             raise ValueError("Use colorbars for multi-colored lines, not legends")
 
@@ -68,11 +89,9 @@ class LineLegendItem(LegendItem):
 
         graphic.colors.add_event_handler(self._update_color)
 
-        # construct Line WorldObject
-        data = np.array([[0, 0, 0], [3, 0, 0]], dtype=np.float32)
-
+        # construct Line WorldObject, the geometry is shared by all items of the legend
         self._line_world_object = pygfx.Line(
-            geometry=pygfx.Geometry(positions=data),
+            geometry=parent._fpl_item_line_geometry,
             material=pygfx.LineMaterial(
                 alpha_mode="blend",
                 render_queue=RenderQueue.overlay,
@@ -83,33 +102,21 @@ class LineLegendItem(LegendItem):
             ),
         )
 
-        # self._line_world_object.world.x = position[0]
-
         self._label_world_object = pygfx.Text(
             text=str(label),
             font_size=6,
             screen_space=False,
             anchor="middle-left",
-            material=pygfx.TextMaterial(
-                alpha_mode="blend",
-                aa=True,
-                render_queue=RenderQueue.overlay,
-                color="w",
-                outline_color="w",
-                outline_thickness=0,
-                depth_write=False,
-                depth_test=False,
-            ),
+            material=parent._fpl_item_text_material,
         )
 
         self.world_object = pygfx.Group()
         self.world_object.add(self._line_world_object, self._label_world_object)
 
-        self.world_object.world.x = position[0]
         # add 10 to x to account for space for the line
-        self._label_world_object.world.x = position[0] + 10
+        self._label_world_object.local.x = 10
 
-        self.world_object.world.y = position[1]
+        self._compute_extent()
 
         self.world_object.add_event_handler(
             partial(self._highlight_graphic, graphic), "click"
@@ -121,8 +128,17 @@ class LineLegendItem(LegendItem):
 
     @label.setter
     def label(self, text: str):
+        if text == self._label:
+            return
+
         self._parent._check_label_unique(text)
-        self._label_world_object.geometry.set_text(text)
+        self._label_world_object.set_text(str(text))
+        self._parent._fpl_rename_item(self._label, text)
+        self._label = text
+
+        # width has changed
+        self._compute_extent()
+        self._parent._fpl_layout_items()
 
     def _update_color(self, ev: GraphicFeatureEvent):
         new_color = ev.info["value"]
@@ -174,6 +190,32 @@ class Legend(Graphic):
         # hex id of Graphic, i.e. graphic._fpl_address are the keys
         self._items: OrderedDict[str:LegendItem] = OrderedDict()
 
+        # label -> hex id of Graphic, used to check that labels are unique
+        self._labels: dict[str, str] = dict()
+
+        # "deleted" event handler of each graphic, hex id of Graphic are the keys
+        self._delete_handlers: dict[str, callable] = dict()
+
+        # x position and width of each column, items are only placed using the cached item extents
+        self._column_x: list[float] = list()
+        self._column_widths: list[float] = list()
+        self._max_item_height = 0.0
+
+        # line geometry and text material are the same for all items
+        self._fpl_item_line_geometry = pygfx.Geometry(
+            positions=np.array([[0, 0, 0], [3, 0, 0]], dtype=np.float32)
+        )
+        self._fpl_item_text_material = pygfx.TextMaterial(
+            alpha_mode="blend",
+            aa=True,
+            render_queue=RenderQueue.overlay,
+            color="w",
+            outline_color="w",
+            outline_thickness=0,
+            depth_write=False,
+            depth_test=False,
+        )
+
         super().__init__(*args, **kwargs)
 
         group = pygfx.Group()
@@ -217,120 +259,189 @@ class Legend(Graphic):
 
         self._max_rows = max_rows
 
-        self._row_counter = 0
-        self._col_counter = 0
-
     def graphics(self) -> tuple[Graphic, ...]:
         return tuple(self._graphics)
 
     def _check_label_unique(self, label):
-        for legend_item in self._items.values():
-            if legend_item.label == label:
-                raise ValueError(
-                    f"You have passed the label '{label}' which is already used for another legend item. "
-                    f"All labels within a legend must be unique."
-                )
+        if label in self._labels.keys():
+            raise ValueError(
+                f"You have passed the label '{label}' which is already used for another legend item. "
+                f"All labels within a legend must be unique."
+            )
 
     def add_graphic(self, graphic: Graphic, label: str = None):
-        if graphic in self._graphics:
+        """
+        Add a graphic to the legend
+
+        Parameters
+        ----------
+        graphic: Graphic
+            graphic to add, only ``LineGraphic`` is supported for now
+
+        label: str, optional
+            label of the legend item, uses ``graphic.name`` if not provided
+
+        """
+        self.add_graphics([graphic], [label])
+
+    def add_graphics(
+        self, graphics: Iterable[Graphic], labels: Iterable[str | None] = None
+    ):
+        """
+        Add many graphics to the legend at once, much faster than calling :meth:`add_graphic` for each graphic
+
+        Parameters
+        ----------
+        graphics: Iterable[Graphic]
+            graphics to add, only ``LineGraphic`` is supported for now
+
+        labels: Iterable[str | None], optional
+            labels of the legend items, uses ``graphic.name`` of the graphics if not provided
+
+        """
+        graphics = list(graphics)
+
+        if labels is None:
+            labels = [None] * len(graphics)
+        else:
+            labels = list(labels)
+
+        if len(labels) != len(graphics):
+            raise ValueError(
+                f"number of labels != number of graphics: {len(labels)} != {len(graphics)}"
+            )
+
+        new_items = list()
+        try:
+            for graphic, label in zip(graphics, labels):
+                new_items.append(self._add_item(graphic, label))
+        finally:
+            # add the world objects of all items that were created at once
+            if len(new_items) > 0:
+                self._legend_items_group.add(*[item.world_object for item in new_items])
+                self._reset_mesh_dims()
+
+    def _add_item(self, graphic: Graphic, label: str | None) -> LegendItem:
+        if graphic._fpl_address in self._items.keys():
             raise KeyError(
                 f"Graphic already exists in legend with label: '{self._items[graphic._fpl_address].label}'"
             )
 
-        self._check_label_unique(label)
+        if label is None:
+            label = graphic.name
 
-        new_col_ix = self._col_counter
-        new_row_ix = self._row_counter
-
-        x_pos = 0
-        y_pos = 0
-
-        if self._row_counter == self._max_rows:
-            # set counters
-            new_col_ix = self._col_counter + 1
-
-            # get x position offset for this new column of LegendItems
-            # start by getting the LegendItems in the previous column
-            prev_column_items: list[LegendItem] = list(self._items.values())[
-                -self._max_rows :
-            ]
-            # x position of LegendItems in previous column
-            x_pos = prev_column_items[-1].world_object.world.x
-            max_width = 0
-            # get width of widest LegendItem in previous column to add to x_pos offset for this column
-            for item in prev_column_items:
-                bbox = item.world_object.get_world_bounding_box()
-                width, height, depth = np.ptp(bbox, axis=0)
-                max_width = max(max_width, width)
-
-            # x position offset for this new column
-            x_pos = x_pos + max_width + 15  # add 15 for spacing
-
-            # rest row index for next iteration
-            new_row_ix = 1
-        else:
-            if len(self._items) > 0:
-                x_pos = list(self._items.values())[-1].world_object.world.x
-
-            y_pos = new_row_ix * -10
-            new_row_ix = self._row_counter + 1
+        self._check_label_unique(label)
 
         if isinstance(graphic, LineGraphic):
-            legend_item = LineLegendItem(self, graphic, label, position=(x_pos, y_pos))
+            legend_item = LineLegendItem(self, graphic, label)
         else:
             raise ValueError("Legend only supported for LineGraphic for now.")
 
-        self._legend_items_group.add(legend_item.world_object)
-        self._reset_mesh_dims()
+        self._place_item(len(self._items), legend_item)
 
         self._graphics.append(graphic)
         self._items[graphic._fpl_address] = legend_item
+        self._labels[legend_item.label] = graphic._fpl_address
 
-        graphic.add_event_handler(partial(self.remove_graphic, graphic), "deleted")
+        handler = partial(self._graphic_deleted, graphic)
+        graphic.add_event_handler(handler, "deleted")
+        self._delete_handlers[graphic._fpl_address] = handler
 
-        self._col_counter = new_col_ix
-        self._row_counter = new_row_ix
+        return legend_item
 
-    def _reset_mesh_dims(self):
-        bbox = self._legend_items_group.get_world_bounding_box()
+    def _place_item(self, index: int, legend_item: LegendItem):
+        # set the position of an item from its index, items fill columns of max_rows
+        col, row = divmod(index, self._max_rows)
+
+        if col == len(self._column_x):
+            # first item of a new column
+            if col == 0:
+                x_pos = 0
+            else:
+                # add 15 for spacing
+                x_pos = self._column_x[-1] + self._column_widths[-1] + 15
+
+            self._column_x.append(x_pos)
+            self._column_widths.append(legend_item.width)
+        else:
+            self._column_widths[col] = max(self._column_widths[col], legend_item.width)
+
+        self._max_item_height = max(self._max_item_height, legend_item.height)
+
+        legend_item.world_object.local.x = self._column_x[col]
+        legend_item.world_object.local.y = row * -10
 
-        width, height, _ = np.ptp(bbox, axis=0)
+    def _fpl_layout_items(self):
+        # place all items, only uses the cached item extents
+        self._column_x.clear()
+        self._column_widths.clear()
+        self._max_item_height = 0.0
+
+        for i, legend_item in enumerate(self._items.values()):
+            self._place_item(i, legend_item)
+
+        self._reset_mesh_dims()
+
+    def _fpl_rename_item(self, old_label: str, new_label: str):
+        self._labels[new_label] = self._labels.pop(old_label)
+
+    def _reset_mesh_dims(self):
+        if len(self._items) == 0:
+            width, height = 0, 0
+        else:
+            width = self._column_x[-1] + self._column_widths[-1]
+            n_rows = min(len(self._items), self._max_rows)
+            height = (n_rows - 1) * 10 + self._max_item_height
 
         self._mesh.geometry.positions.data[mesh_masks.x_right] = width + 7
         self._mesh.geometry.positions.data[mesh_masks.x_left] = -5
-        self._mesh.geometry.positions.data[mesh_masks.y_bottom] = 0
         self._mesh.geometry.positions.data[mesh_masks.y_bottom] = -height - 3
         self._mesh.geometry.positions.update_range()
 
+    def _graphic_deleted(self, graphic: Graphic, ev):
+        self.remove_graphic(graphic)
+
     def remove_graphic(self, graphic: Graphic):
+        """remove a graphic from the legend"""
+        if graphic._fpl_address not in self._items.keys():
+            raise KeyError("Graphic not in legend")
+
         self._graphics.remove(graphic)
         legend_item = self._items.pop(graphic._fpl_address)
-        self._legend_items_group.remove(legend_item.world_object)
-        self._reset_item_positions()
+        self._labels.pop(legend_item.label)
 
-    def _reset_item_positions(self):
-        for i, (graphic_loc, legend_item) in enumerate(self._items.items()):
-            y_pos = i * -10
-            legend_item.world_object.world.y = y_pos
+        graphic.remove_event_handler(
+            self._delete_handlers.pop(graphic._fpl_address), "deleted"
+        )
+        if isinstance(legend_item, LineLegendItem):
+            graphic.colors.remove_event_handler(legend_item._update_color)
 
-        self._reset_mesh_dims()
+        self._legend_items_group.remove(legend_item.world_object)
+        self._fpl_layout_items()
 
     def reorder(self, labels: Iterable[str]):
-        all_labels = [legend_item.label for legend_item in self._items.values()]
+        """
+        Reorder the legend items
+
+        Parameters
+        ----------
+        labels: Iterable[str]
+            all the labels in the legend, in the new order
+
+        """
+        labels = list(labels)
 
-        if not set(labels) == set(all_labels):
+        if not (len(labels) == len(self._labels) and set(labels) == set(self._labels)):
             raise ValueError("Must pass all existing legend labels")
 
         new_items = OrderedDict()
 
         for label in labels:
-            for graphic_loc, legend_item in self._items.items():
-                if label == legend_item.label:
-                    new_items[graphic_loc] = self._items.pop(graphic_loc)
-                    break
+            graphic_loc = self._labels[label]
+            new_items[graphic_loc] = self._items[graphic_loc]
 
         self._items = new_items
-        self._reset_item_positions()
+        self._fpl_layout_items()
 
     def _pointer_down(self, ev):
         self._last_position = self._plot_area.map_screen_to_world(ev)
@@ -1,10 +1,12 @@
 from ._histogram_lut import HistogramLUTTool
 from ._textbox import TextBox, Tooltip
 from ._cursor import Cursor
+from ._sync import SyncHub
 
 __all__ = [
     "HistogramLUTTool",
     "TextBox",
     "Tooltip",
     "Cursor",
+    "SyncHub",
 ]
@@ -1,11 +1,15 @@
 from functools import partial
-from typing import Literal, Sequence, Callable
+from typing import Literal, Sequence, Callable, TYPE_CHECKING
 
 import numpy as np
 import pygfx
 
-from ..layouts import Subplot
 from ..utils import RenderQueue
+from ._picking import get_picker
+
+if TYPE_CHECKING:
+    # layouts imports tools, only import for type hints to avoid a circular import
+    from ..layouts import Subplot
 
 
 class Cursor:
@@ -55,8 +59,9 @@ class Cursor:
 
         """
 
-        self._cursors: dict[Subplot, pygfx.Points | pygfx.Group[pygfx.Line]] = dict()
+        self._cursors: dict[Subplot, pygfx.Points | pygfx.Line] = dict()
         self._transforms: dict[Subplot, Callable | None] = dict()
+        self._pointer_handlers: dict[Subplot, Callable] = dict()
 
         self._mode = None
         self.mode = mode
@@ -88,15 +93,14 @@ class Cursor:
             return
 
         # mode has changed, clear and create new world objects
-        subplots = list(self._cursors.keys())
+        transforms = dict(self._transforms)
 
         self.clear()
-
-        for subplot in subplots:
-            self.add_subplot(subplot)
-
         self._mode = mode
 
+        for subplot, transform in transforms.items():
+            self.add_subplot(subplot, transform)
+
     @property
     def size(self) -> float:
         """size of marker or crosshair line thickness"""
@@ -108,9 +112,7 @@ class Cursor:
             if self.mode == "marker":
                 c.material.size = new_size
             elif self.mode == "crosshair":
-                h, v = c.children
-                h.material.thickness = new_size
-                v.material.thickness = new_size
+                c.material.thickness = new_size
 
         self._size = new_size
 
@@ -131,9 +133,7 @@ class Cursor:
                 c.material.size_space = space
 
             elif self.mode == "crosshair":
-                h, v = c.children
-                h.material.thickness_space = space
-                v.material.thickness_space = space
+                c.material.thickness_space = space
 
         self._size_space = space
 
@@ -220,63 +220,83 @@ class Cursor:
 
     @position.setter
     def position(self, pos: tuple[float, float]):
+        self._position[:] = pos[:2]
+
+        # update all cursors in one pass, the tooltips are set using pick info that is read
+        # asynchronously after the next render, with one readback for all subplots of a figure
         for subplot, cursor in self._cursors.items():
             if self._transforms[subplot] is not None:
-                pos_transformed = self._transforms[subplot](pos)
+                x, y = self._transforms[subplot](pos)[:2]
             else:
-                pos_transformed = pos
+                x, y = pos[:2]
 
+            positions = cursor.geometry.positions
             if self.mode == "marker":
-                cursor.geometry.positions.data[0, :-1] = pos_transformed
-                cursor.geometry.positions.update_full()
+                positions.data[0, :-1] = x, y
 
             elif self.mode == "crosshair":
-                line_h, line_v = cursor.children
-
-                # set x vals for horizontal line
-                line_h.geometry.positions.data[0, 0] = pos_transformed[0] - 1
-                line_h.geometry.positions.data[1, 0] = pos[0] + 1
-
-                # set y value
-                line_h.geometry.positions.data[:, 1] = pos_transformed[1]
-
-                line_h.geometry.positions.update_full()
-
-                # set y vals for vertical line
-                line_v.geometry.positions.data[0, 1] = pos_transformed[1] - 1
-                line_v.geometry.positions.data[1, 1] = pos_transformed[1] + 1
-
-                # set x value
-                line_v.geometry.positions.data[:, 0] = pos_transformed[0]
-
-                line_v.geometry.positions.update_full()
-
-            # set tooltip using pick info if a graphic is at this position
-            # for now we just set z = 1
-            screen_pos = subplot.map_world_to_screen((*pos_transformed, 1))
-            pick_info = subplot.get_pick_info(screen_pos)
+                # horizontal and vertical segment
+                positions.data[:, :-1] = [
+                    [x - 1, y],
+                    [x + 1, y],
+                    [x, y - 1],
+                    [x, y + 1],
+                ]
+
+            positions.update_full()
+
+            self._request_tooltip(subplot, x, y)
+
+    def _request_tooltip(self, subplot: "Subplot", x: float, y: float):
+        picker = get_picker(subplot.get_figure())
+
+        # skip picking if a tooltip cannot be shown in this subplot
+        if not subplot.tooltip.enabled or not any(
+            g._fpl_support_tooltip for g in subplot.graphics
+        ):
+            picker.cancel((self, subplot))
+            subplot.tooltip.clear()
+            return
 
-            self._position[:] = pos_transformed
+        # for now we just set z = 1
+        screen_pos = subplot.map_world_to_screen((x, y, 1))
 
-            if pick_info is not None:
-                graphic = pick_info["graphic"]
-                if (
-                    graphic._fpl_support_tooltip
-                ):  # some graphics don't support tooltips, ex: Text
-                    if graphic.tooltip_format is not None:
-                        # custom formatter
-                        info = graphic.tooltip_format(pick_info)
-                    else:
-                        # default formatter for this graphic
-                        info = graphic.format_pick_info(pick_info)
+        if not subplot.viewport.is_inside(*screen_pos):
+            picker.cancel((self, subplot))
+            subplot.tooltip.clear()
+            return
 
-                    subplot.tooltip.display(screen_pos, info)
-                    continue
+        picker.request((self, subplot), screen_pos, partial(self._set_tooltip, subplot))
 
-            # tooltip cleared if none of the above condiitionals reached the tooltip display call
-            subplot.tooltip.clear()
+    def _set_tooltip(
+        self,
+        subplot: "Subplot",
+        screen_pos: tuple[float, float],
+        pick_info: dict | None,
+    ):
+        # called by the picker after the render following a position change
+        if subplot not in self._cursors.keys():
+            return
 
-    def add_subplot(self, subplot: Subplot, transform: Callable | None = None):
+        if pick_info is not None:
+            graphic = pick_info["graphic"]
+            if (
+                graphic._fpl_support_tooltip
+            ):  # some graphics don't support tooltips, ex: Text
+                if graphic.tooltip_format is not None:
+                    # custom formatter
+                    info = graphic.tooltip_format(pick_info)
+                else:
+                    # default formatter for this graphic
+                    info = graphic.format_pick_info(pick_info)
+
+                subplot.tooltip.display(screen_pos, info)
+                return
+
+        # tooltip cleared if none of the above condiitionals reached the tooltip display call
+        subplot.tooltip.clear()
+
+    def add_subplot(self, subplot: "Subplot", transform: Callable | None = None):
         """
         Add a subplot to this cursor, with an optional position transform function
 
@@ -305,29 +325,35 @@ class Cursor:
             cursor = self._create_crosshair()
 
         subplot.scene.add(cursor)
-        subplot.renderer.add_event_handler(
-            partial(self._pointer_moved, subplot), "pointer_move"
-        )
+
+        handler = partial(self._pointer_moved, subplot)
+        subplot.renderer.add_event_handler(handler, "pointer_move")
 
         self._cursors[subplot] = cursor
         self._transforms[subplot] = transform
+        self._pointer_handlers[subplot] = handler
 
         # let cursor manage tooltips
         subplot.renderer.remove_event_handler(subplot._fpl_set_tooltip, "pointer_move")
 
-    def remove_subplot(self, subplot: Subplot):
+    def remove_subplot(self, subplot: "Subplot"):
         """remove a subplot"""
         if subplot not in self._cursors.keys():
             raise KeyError("cursor not in given supblot")
 
         subplot.scene.remove(self._cursors.pop(subplot))
+        self._transforms.pop(subplot)
+        subplot.renderer.remove_event_handler(
+            self._pointer_handlers.pop(subplot), "pointer_move"
+        )
+        get_picker(subplot.get_figure()).cancel((self, subplot))
 
         # give back tooltip control to the subplot
         subplot.renderer.add_event_handler(subplot._fpl_set_tooltip, "pointer_move")
 
     def clear(self):
         """remove all subplots"""
-        for subplot in self._cursors.keys():
+        for subplot in list(self._cursors.keys()):
             self.remove_subplot(subplot)
 
     def _create_marker(self) -> pygfx.Points:
@@ -352,43 +378,21 @@ class Cursor:
 
         return point
 
-    def _create_crosshair(self) -> pygfx.Group:
-        # Creates two infinite lines, used for "crosshair" mode
+    def _create_crosshair(self) -> pygfx.Line:
+        # Creates one line with two infinite segments, horizontal and vertical, used for "crosshair" mode
         x, y = self.position
-        line_h_data = np.array(
+        data = np.array(
             [
                 [x - 1, y, 0],
                 [x + 1, y, 0],
-            ],
-            dtype=np.float32,
-        )
-
-        line_v_data = np.array(
-            [
                 [x, y - 1, 0],
                 [x, y + 1, 0],
             ],
             dtype=np.float32,
         )
 
-        line_h = pygfx.Line(
-            geometry=pygfx.Geometry(positions=line_h_data),
-            material=pygfx.LineInfiniteSegmentMaterial(
-                thickness=self.size,
-                thickness_space=self.size_space,
-                color=self.color,
-                opacity=self.alpha,
-                alpha_mode="blend",
-                aa=True,
-                render_queue=RenderQueue.selector,
-                depth_test=False,
-                depth_write=False,
-                pick_write=False,
-            ),
-        )
-
-        line_v = pygfx.Line(
-            geometry=pygfx.Geometry(positions=line_v_data),
+        line = pygfx.Line(
+            geometry=pygfx.Geometry(positions=data),
             material=pygfx.LineInfiniteSegmentMaterial(
                 thickness=self.size,
                 thickness_space=self.size_space,
@@ -403,10 +407,7 @@ class Cursor:
             ),
         )
 
-        lines = pygfx.Group()
-        lines.add(line_h, line_v)
-
-        return lines
+        return line
 
     def _pointer_moved(self, subplot, ev: pygfx.PointerEvent):
         if not self.enabled:
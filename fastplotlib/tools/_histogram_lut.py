@@ -1,4 +1,3 @@
-from math import ceil
 from typing import Sequence
 import weakref
 
@@ -25,6 +24,10 @@ def _get_image_graphic_events(image_graphic: ImageGraphic) -> list[str]:
     return events
 
 
+# number of rows in the colorbar image, it is a linear ramp so the resolution does not depend on the data range
+COLORBAR_ROWS = 256
+
+
 # TODO: This is a widget, we can think about a BaseWidget class later if necessary
 class HistogramLUTTool(Graphic):
     _fpl_support_tooltip = False
@@ -89,6 +92,9 @@ class HistogramLUTTool(Graphic):
 
         self._scale_factor: float = 1.0
 
+        # (bottom, top) of the histogram in world space, used to auto-scale only when it changes
+        self._extent: tuple[float, float] | None = None
+
         hist, edges, hist_scaled, edges_flanked = self._calculate_histogram(data)
 
         line_data = np.column_stack([hist_scaled, edges_flanked])
@@ -171,44 +177,67 @@ class HistogramLUTTool(Graphic):
         for ig in self.images:
             ig.add_event_handler(self._image_cmap_handler, *ig_events)
 
-        # colorbar for grayscale images
-        if self.images[0].cmap is not None:
-            self._colorbar: ImageGraphic = self._make_colorbar(edges_flanked)
-            self._colorbar.add_event_handler(self._open_cmap_picker, "click")
+        self._extent = (edges_flanked[0], edges_flanked[-1])
 
-            self.world_object.add(self._colorbar.world_object)
-        else:
-            self._colorbar = None
-            self._cmap = None
+        # colorbar for grayscale images
+        self._colorbar: ImageGraphic | None = None
+        self._cmap = None
+        self._update_colorbar(edges_flanked)
 
-    def _make_colorbar(self, edges_flanked) -> ImageGraphic:
+    def _get_colorbar_data(self, edges_flanked) -> np.ndarray:
         # use the histogram edge values as data for an
         # image with 2 columns, this will be our colorbar!
         colorbar_data = np.column_stack(
-            [
-                np.linspace(
-                    edges_flanked[0], edges_flanked[-1], ceil(np.ptp(edges_flanked))
-                )
-            ]
-            * 2
+            [np.linspace(edges_flanked[0], edges_flanked[-1], COLORBAR_ROWS)] * 2
         ).astype(np.float32)
 
         colorbar_data /= self._scale_factor
 
+        return colorbar_data
+
+    def _make_colorbar(self, edges_flanked) -> ImageGraphic:
         cbar = ImageGraphic(
-            data=colorbar_data,
+            data=self._get_colorbar_data(edges_flanked),
             vmin=self.vmin,
             vmax=self.vmax,
             cmap=self.images[0].cmap,
             interpolation="linear",
-            offset=(-55, edges_flanked[0], -1),
         )
 
         cbar.world_object.world.scale_x = 20
+        cbar.add_event_handler(self._open_cmap_picker, "click")
         self._cmap = self.images[0].cmap
 
         return cbar
 
+    def _update_colorbar(self, edges_flanked):
+        """update the colorbar in place, it is only created or removed if the images switch between grayscale and RGB"""
+        if self.images[0].cmap is None:
+            if self._colorbar is not None:
+                self._colorbar.clear_event_handlers()
+                self.world_object.remove(self._colorbar.world_object)
+
+            self._colorbar = None
+            self._cmap = None
+            return
+
+        if self._colorbar is None:
+            self._colorbar = self._make_colorbar(edges_flanked)
+            self.world_object.add(self._colorbar.world_object)
+        else:
+            # same shape, only the texture is updated
+            self._colorbar.data = self._get_colorbar_data(edges_flanked)
+
+            if self._colorbar.cmap != self.images[0].cmap:
+                self._colorbar.cmap = self.images[0].cmap
+                self._cmap = self.images[0].cmap
+
+        # stretch the colorbar rows over the histogram edges
+        self._colorbar.offset = (-55, edges_flanked[0], -1)
+        self._colorbar.world_object.world.scale_y = np.ptp(edges_flanked) / (
+            COLORBAR_ROWS - 1
+        )
+
     def _get_vmin_vmax_str(self) -> tuple[str, str]:
         if self.vmin < 0.001 or self.vmin > 99_999:
             vmin_str = f"{self.vmin:.2e}"
@@ -372,21 +401,13 @@ class HistogramLUTTool(Graphic):
 
         self._data = weakref.proxy(data)
 
-        if self._colorbar is not None:
-            self._colorbar.clear_event_handlers()
-            self.world_object.remove(self._colorbar.world_object)
-
-        if self.images[0].cmap is not None:
-            self._colorbar: ImageGraphic = self._make_colorbar(edges_flanked)
-            self._colorbar.add_event_handler(self._open_cmap_picker, "click")
-
-            self.world_object.add(self._colorbar.world_object)
-        else:
-            self._colorbar = None
-            self._cmap = None
+        self._update_colorbar(edges_flanked)
 
-        # reset plotarea dims
-        self._plot_area.auto_scale()
+        # reset plotarea dims only if the histogram moved, avoids resetting the camera on every frame
+        extent = (edges_flanked[0], edges_flanked[-1])
+        if extent != self._extent:
+            self._extent = extent
+            self._plot_area.auto_scale()
 
     @property
     def images(self) -> tuple[ImageGraphic | ImageVolumeGraphic]:
@@ -0,0 +1,250 @@
+from typing import Callable, Hashable
+from warnings import warn
+from weakref import WeakKeyDictionary
+
+import wgpu
+import pygfx
+from pygfx.objects._base import id_provider
+
+from ..graphics._base import WORLD_OBJECT_TO_GRAPHIC
+from ..utils.gpu import SUPPORTED_PYGFX_VERSION
+
+# bytes per pixel of the pick texture, rgba16uint
+PICK_VALUE_SIZE = 8
+
+
+class BatchedPicker:
+    def __init__(self, figure):
+        """
+        Reads the pick info at many screen positions of a figure with at most one GPU readback per frame.
+
+        Requests are queued and the pixels of the pick texture at all requested positions are copied to
+        a single buffer after the figure is rendered. The buffer is mapped asynchronously and read at the
+        start of the next frame, when the copy has completed, so requesting pick info never stalls on the GPU.
+
+        Use :func:`get_picker` to get the picker of a figure, it is shared by all tools in the figure.
+
+        The pick texture is a private attribute of the pygfx renderer. With a pygfx version other than the
+        supported version, or if reading the pick texture fails, the picker falls back to calling
+        ``renderer.get_pick_info`` for each request.
+
+        Parameters
+        ----------
+        figure: Figure
+            figure whose canvas is picked
+
+        """
+        self._renderer: pygfx.WgpuRenderer = figure.renderer
+        self._device = self._renderer.device
+
+        # key -> (screen position, callback), newer requests with the same key replace older ones
+        self._requests: dict[Hashable, tuple[tuple[float, float], Callable]] = dict()
+
+        self._buffer: wgpu.GPUBuffer | None = None
+
+        # requests that were copied to the buffer and are waiting for the buffer to be mapped
+        self._in_flight: list[tuple[tuple[float, float], Callable]] = list()
+        self._map_promise = None
+
+        # False if the pygfx internals are not as expected, use renderer.get_pick_info instead
+        self._use_pick_texture = pygfx.__version__ == SUPPORTED_PYGFX_VERSION
+
+        figure.add_animations(self._read, pre_render=True)
+        figure.add_animations(self._copy, pre_render=False, post_render=True)
+
+    def request(
+        self,
+        key: Hashable,
+        position: tuple[float, float],
+        callback: Callable[[tuple[float, float], dict | None], None],
+    ):
+        """
+        Request the pick info at a screen position, the ``callback`` is called after the next render.
+
+        Parameters
+        ----------
+        key: Hashable
+            identifies the requester, only the last position requested with a given key is picked
+
+        position: (float, float)
+            screen space position in logical pixels
+
+        callback: Callable
+            called with the position and the pick info, the pick info is ``None`` if no graphic is
+            at this position, otherwise it is the same as :meth:`PlotArea.get_pick_info`
+
+        """
+        self._requests[key] = (tuple(position), callback)
+
+    def cancel(self, key: Hashable):
+        """cancel a pending request"""
+        self._requests.pop(key, None)
+
+    def _get_buffer(self, n: int) -> wgpu.GPUBuffer:
+        size = n * PICK_VALUE_SIZE
+        if self._buffer is None or self._buffer.size < size:
+            if self._buffer is not None:
+                self._buffer.destroy()
+
+            # round up to reduce reallocations
+            size = max(256, 1 << (size - 1).bit_length())
+            self._buffer = self._device.create_buffer(
+                size=size,
+                usage=wgpu.BufferUsage.COPY_DST | wgpu.BufferUsage.MAP_READ,
+            )
+
+        return self._buffer
+
+    def _get_pick_texture(self) -> wgpu.GPUTexture | None:
+        """
+        The pick texture of the renderer, read the same way as WgpuRenderer.get_pick_info.
+        This is the only use of private pygfx internals by the picker.
+        """
+        return self._renderer._blender.get_texture("pick")
+
+    def _pick_sync(self, position: tuple[float, float]) -> dict | None:
+        """pick info at a position using the public renderer.get_pick_info, one GPU readback per call"""
+        info = self._renderer.get_pick_info(position)
+
+        wobject = info["world_object"]
+        if wobject is None or wobject.id not in WORLD_OBJECT_TO_GRAPHIC.keys():
+            return None
+
+        info["graphic"] = WORLD_OBJECT_TO_GRAPHIC[wobject.id]
+        return info
+
+    def _fallback(self, error: Exception):
+        """use renderer.get_pick_info from now on, the pygfx or wgpu internals are not as expected"""
+        warn(
+            f"batched picking is not supported with pygfx {pygfx.__version__}, falling back to "
+            f"renderer.get_pick_info. The error was: {error!r}",
+            RuntimeWarning,
+        )
+
+        self._use_pick_texture = False
+        self._map_promise = None
+
+        in_flight = list(self._in_flight)
+        self._in_flight.clear()
+
+        for position, callback in in_flight:
+            callback(position, self._pick_sync(position))
+
+    def _copy(self):
+        # called after the figure is rendered, copies the pick pixel of every request
+        if len(self._requests) == 0 or self._map_promise is not None:
+            # nothing requested, or the previous readback has not been read yet
+            return
+
+        if not self._use_pick_texture:
+            requests = list(self._requests.values())
+            self._requests.clear()
+
+            for position, callback in requests:
+                callback(position, self._pick_sync(position))
+
+            return
+
+        try:
+            pick_tex = self._get_pick_texture()
+        except Exception as e:
+            self._fallback(e)
+            return
+
+        if pick_tex is None:
+            return
+
+        requests = list(self._requests.values())
+        self._requests.clear()
+
+        w, h, _ = pick_tex.size
+        logical_w, logical_h = self._renderer.logical_size
+
+        buffer = self._get_buffer(len(requests))
+        encoder = self._device.create_command_encoder()
+
+        self._in_flight.clear()
+        for (x, y), callback in requests:
+            if not (0 <= x <= logical_w and 0 <= y <= logical_h):
+                # outside the canvas, nothing to pick
+                callback((x, y), None)
+                continue
+
+            # logical pixels to pick texture pixels
+            px = max(0, min(w - 1, int(x / logical_w * w)))
+            py = max(0, min(h - 1, int(y / logical_h * h)))
+
+            encoder.copy_texture_to_buffer(
+                {"texture": pick_tex, "mip_level": 0, "origin": (px, py, 0)},
+                {
+                    "buffer": buffer,
+                    "offset": len(self._in_flight) * PICK_VALUE_SIZE,
+                    "bytes_per_row": 256,
+                    "rows_per_image": 1,
+                },
+                copy_size=(1, 1, 1),
+            )
+            self._in_flight.append(((x, y), callback))
+
+        if len(self._in_flight) == 0:
+            return
+
+        try:
+            self._device.queue.submit([encoder.finish()])
+            self._map_promise = buffer.map_async(
+                wgpu.MapMode.READ, 0, len(self._in_flight) * PICK_VALUE_SIZE
+            )
+        except Exception as e:
+            self._fallback(e)
+
+    def _read(self):
+        # called before the next render, the copy was submitted one frame ago so the wait returns immediately
+        if self._map_promise is None:
+            return
+
+        n = len(self._in_flight)
+        try:
+            self._map_promise.sync_wait()
+            self._map_promise = None
+
+            try:
+                data = self._buffer.read_mapped(0, n * PICK_VALUE_SIZE, copy=True)
+            finally:
+                self._buffer.unmap()
+        except Exception as e:
+            self._fallback(e)
+            return
+
+        pick_values = data.cast("Q")
+
+        in_flight = list(self._in_flight)
+        self._in_flight.clear()
+
+        for (position, callback), pick_value in zip(in_flight, pick_values):
+            callback(position, self._get_pick_info(pick_value))
+
+    @staticmethod
+    def _get_pick_info(pick_value: int) -> dict | None:
+        # decode the pick value the same way as WgpuRenderer.get_pick_info
+        wobject = id_provider.get_object_from_id(pick_value & 1048575)  # 2**20-1
+
+        if wobject is None or wobject.id not in WORLD_OBJECT_TO_GRAPHIC.keys():
+            return None
+
+        info = {"world_object": wobject}
+        info.update(wobject._wgpu_get_pick_info(pick_value))
+        info["graphic"] = WORLD_OBJECT_TO_GRAPHIC[wobject.id]
+
+        return info
+
+
+# one picker per figure
+_pickers = WeakKeyDictionary()
+
+
+def get_picker(figure) -> BatchedPicker:
+    """get the batched picker of a figure, it is created on first use"""
+    if figure not in _pickers:
+        _pickers[figure] = BatchedPicker(figure)
+
+    return _pickers[figure]
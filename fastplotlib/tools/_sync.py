@@ -0,0 +1,489 @@
+from collections import deque
+from typing import Any, Callable, TYPE_CHECKING
+from weakref import WeakSet
+
+import numpy as np
+
+from ..graphics import Graphic
+from ..graphics.selectors._base_selector import BaseSelector
+
+if TYPE_CHECKING:
+    # layouts and widgets import tools, only import for type hints to avoid a circular import
+    from ..layouts import Subplot
+    from ..widgets import ImageWidget
+
+
+def _equal(a, b) -> bool:
+    """compare synced values, which can be scalars, arrays, or dicts of them such as camera states"""
+    if a is b:
+        return True
+
+    if isinstance(a, dict) or isinstance(b, dict):
+        if not (isinstance(a, dict) and isinstance(b, dict)):
+            return False
+
+        if a.keys() != b.keys():
+            return False
+
+        return all(_equal(a[k], b[k]) for k in a.keys())
+
+    try:
+        return bool(np.array_equal(a, b))
+    except Exception:
+        return a == b
+
+
+class _SyncNode:
+    """a piece of state that is synced by a SyncHub"""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+        # key of this node in the hub
+        self.key: tuple | None = None
+
+        # True while the hub sets the value, events emitted by setting the value are ignored
+        self.applying = False
+
+    def get(self):
+        raise NotImplementedError
+
+    def set(self, value):
+        raise NotImplementedError
+
+    def get_figure(self):
+        """figure whose render cycle flushes the hub, ``None`` if not known yet"""
+        raise NotImplementedError
+
+    def connect(self, callback: Callable[["_SyncNode"], None]):
+        """call ``callback`` with this node when the value changes"""
+        pass
+
+    def disconnect(self):
+        pass
+
+    def poll(self) -> bool:
+        """``True`` if the value changed since it was last synced, for state that does not emit events"""
+        return False
+
+
+class _FeatureNode(_SyncNode):
+    def __init__(self, graphic: Graphic, feature: str):
+        super().__init__(graphic)
+
+        if feature not in graphic._features:
+            raise KeyError(
+                f"'{feature}' is not a feature of {graphic}, the features are: {graphic._features}"
+            )
+
+        self.feature = feature
+        self._handler = None
+
+    def get(self):
+        return getattr(self.obj, self.feature)
+
+    def set(self, value):
+        setattr(self.obj, self.feature, value)
+
+    def get_figure(self):
+        if self.obj._plot_area is None:
+            return None
+
+        return self.obj._plot_area.get_figure()
+
+    def connect(self, callback):
+        def handler(ev):
+            if not self.applying:
+                callback(self)
+
+        self._handler = handler
+        self.obj.add_event_handler(handler, self.feature)
+
+    def disconnect(self):
+        if self._handler is not None:
+            self.obj.remove_event_handler(self._handler, self.feature)
+            self._handler = None
+
+
+class _CameraNode(_SyncNode):
+    def __init__(self, subplot: "Subplot"):
+        super().__init__(subplot)
+        self._last_state = self.get()
+
+    def get(self) -> dict:
+        return self.obj.camera.get_state()
+
+    def set(self, value: dict):
+        self.obj.camera.set_state(value)
+        self._last_state = self.get()
+
+    def get_figure(self):
+        return self.obj.get_figure()
+
+    def poll(self) -> bool:
+        # cameras do not emit events, they are compared once per frame
+        state = self.get()
+        if _equal(state, self._last_state):
+            return False
+
+        self._last_state = state
+        return True
+
+
+class _ImageWidgetNode(_SyncNode):
+    def __init__(self, image_widget: "ImageWidget"):
+        super().__init__(image_widget)
+        self._handler = None
+
+    def get(self) -> dict[str, int]:
+        return dict(self.obj.current_index)
+
+    def set(self, value: dict[str, int]):
+        self.obj.current_index = value
+
+    def get_figure(self):
+        return self.obj.figure
+
+    def connect(self, callback):
+        def handler(index):
+            if not self.applying:
+                callback(self)
+
+        self._handler = handler
+        self.obj.add_event_handler(handler)
+
+    def disconnect(self):
+        if self._handler is not None:
+            self.obj.remove_event_handler(self._handler)
+            self._handler = None
+
+
+class SyncHub:
+    def __init__(self):
+        """
+        Synchronize state across subplots, selectors, graphic features and ImageWidgets.
+
+        Objects are linked with :meth:`link`. Changes are not applied immediately, they are collected and
+        applied once per frame before the figures are rendered. Each object is updated at most once per frame,
+        in topological order of the links, so linking many views does not cause cascades of events. Multiple
+        changes of an object within a frame are coalesced into one update and values that did not change are
+        not set.
+
+        Examples
+        --------
+
+        .. code-block:: py
+
+            hub = fpl.SyncHub()
+
+            # sync the cameras of two subplots in different figures
+            hub.link(fig1[0, 0], fig2[0, 0], bidirectional=True)
+
+            # a selector sets the "t" index of an ImageWidget
+            hub.link(selector, iw, transform=lambda x: {"t": int(x)})
+
+            # the vmin of one image sets the vmin of another
+            hub.link((image1, "vmin"), (image2, "vmin"))
+
+        """
+        self._nodes: dict[tuple, _SyncNode] = dict()
+
+        # source key -> {target key: transform}
+        self._links: dict[tuple, dict[tuple, Callable | None]] = dict()
+
+        # nodes that changed since the last flush, in order
+        self._dirty: dict[tuple, None] = dict()
+
+        self._figures = WeakSet()
+
+        self._flushing = False
+
+    @property
+    def links(self) -> list[tuple[Any, Any]]:
+        """all links as (source, target) pairs"""
+        return [
+            (self._nodes[source].obj, self._nodes[target].obj)
+            for source, targets in self._links.items()
+            for target in targets.keys()
+        ]
+
+    def _get_key(self, obj) -> tuple:
+        from ..layouts._plot_area import PlotArea
+        from ..widgets import ImageWidget
+
+        if isinstance(obj, tuple):
+            if not (
+                len(obj) == 2
+                and isinstance(obj[0], Graphic)
+                and isinstance(obj[1], str)
+            ):
+                raise TypeError(
+                    f"tuples passed to SyncHub must be (Graphic, feature_name), you passed: {obj}"
+                )
+            return (id(obj[0]), obj[1])
+
+        if isinstance(obj, BaseSelector):
+            return (id(obj), "selection")
+
+        if isinstance(obj, PlotArea):
+            return (id(obj), "camera")
+
+        if isinstance(obj, ImageWidget):
+            return (id(obj), "current_index")
+
+        raise TypeError(
+            f"SyncHub can link subplots, selectors, ImageWidgets, or (Graphic, feature_name) tuples, "
+            f"you passed: {type(obj)}"
+        )
+
+    def _get_node(self, obj) -> tuple:
+        """get or create the node of an object, returns its key"""
+        from ..layouts._plot_area import PlotArea
+
+        key = self._get_key(obj)
+        if key in self._nodes.keys():
+            return key
+
+        if isinstance(obj, tuple):
+            node = _FeatureNode(*obj)
+        elif isinstance(obj, BaseSelector):
+            node = _FeatureNode(obj, "selection")
+        elif isinstance(obj, PlotArea):
+            node = _CameraNode(obj)
+        else:
+            node = _ImageWidgetNode(obj)
+
+        node.key = key
+        node.connect(self._mark_dirty)
+
+        self._nodes[key] = node
+        self._links[key] = dict()
+
+        self._register_figure(node)
+
+        return key
+
+    def _register_figure(self, node: _SyncNode):
+        figure = node.get_figure()
+        if figure is None or figure in self._figures:
+            return
+
+        # the hub is flushed before every render of the figure
+        figure.add_animations(self.flush)
+        self._figures.add(figure)
+
+    def _mark_dirty(self, node: _SyncNode):
+        # move to the end, the last change within a frame wins
+        self._dirty.pop(node.key, None)
+        self._dirty[node.key] = None
+
+        # graphics may have been added to a figure after they were linked
+        self._register_figure(node)
+
+    def link(
+        self,
+        source,
+        target,
+        transform: Callable[[Any], Any] = None,
+        bidirectional: bool = False,
+        inverse: Callable[[Any], Any] = None,
+    ):
+        """
+        Link the state of ``source`` to ``target``, changes of the source are applied to the target.
+
+        Parameters
+        ----------
+        source: Subplot | BaseSelector | ImageWidget | tuple[Graphic, str]
+            | Subplot: the camera state is synced
+            | selector: the ``selection`` is synced
+            | ImageWidget: the ``current_index`` is synced
+            | (Graphic, feature_name): the feature is synced, for example ``(image, "vmin")``
+
+        target: Subplot | BaseSelector | ImageWidget | tuple[Graphic, str]
+            same as ``source``
+
+        transform: Callable, optional
+            computes the target value from the source value, by default the value is set as is
+
+        bidirectional: bool, default False
+            also link ``target`` to ``source``
+
+        inverse: Callable, optional
+            computes the source value from the target value if ``bidirectional``, required if a
+            ``transform`` is given
+
+        """
+        if transform is not None and not callable(transform):
+            raise TypeError(f"`transform` must be callable, you passed: {transform}")
+
+        if bidirectional and transform is not None and inverse is None:
+            raise ValueError(
+                "an `inverse` transform must be provided for bidirectional links with a `transform`"
+            )
+
+        source_key = self._get_node(source)
+        target_key = self._get_node(target)
+
+        if source_key == target_key:
+            raise ValueError("cannot link an object to itself")
+
+        self._links[source_key][target_key] = transform
+
+        if bidirectional:
+            self._links[target_key][source_key] = inverse
+
+    def unlink(self, source, target, bidirectional: bool = False):
+        """remove the link from ``source`` to ``target``, and from ``target`` to ``source`` if ``bidirectional``"""
+        source_key = self._get_key(source)
+        target_key = self._get_key(target)
+
+        pairs = [(source_key, target_key)]
+        if bidirectional:
+            pairs.append((target_key, source_key))
+
+        for a, b in pairs:
+            if a not in self._links.keys() or b not in self._links[a].keys():
+                raise KeyError(
+                    f"no link from {self._nodes[a].obj} to {self._nodes[b].obj}"
+                )
+
+            self._links[a].pop(b)
+
+        for key in {source_key, target_key}:
+            self._remove_if_unlinked(key)
+
+    def remove(self, obj):
+        """remove all links of an object"""
+        key = self._get_key(obj)
+        if key not in self._nodes.keys():
+            raise KeyError(f"{obj} is not linked")
+
+        self._links[key].clear()
+        for targets in self._links.values():
+            targets.pop(key, None)
+
+        for k in list(self._nodes.keys()):
+            self._remove_if_unlinked(k)
+
+    def clear(self):
+        """remove all links"""
+        for node in self._nodes.values():
+            node.disconnect()
+
+        for figure in self._figures:
+            figure.remove_animation(self.flush)
+
+        self._nodes.clear()
+        self._links.clear()
+        self._dirty.clear()
+        self._figures = WeakSet()
+
+    def _remove_if_unlinked(self, key: tuple):
+        if len(self._links[key]) > 0:
+            return
+
+        if any(key in targets.keys() for targets in self._links.values()):
+            return
+
+        self._nodes.pop(key).disconnect()
+        self._links.pop(key)
+        self._dirty.pop(key, None)
+
+    def _get_order(self, sources: list[tuple]) -> list[tuple]:
+        """
+        nodes reachable from the sources in topological order, links into the sources are ignored so that
+        changed nodes are not overwritten, cycles are broken in breadth first order
+        """
+        sources_set = set(sources)
+
+        # breadth first search for the reachable nodes
+        reachable = list(sources)
+        visited = set(sources)
+        queue = deque(sources)
+        while len(queue) > 0:
+            key = queue.popleft()
+            for target in self._links[key].keys():
+                if target not in visited:
+                    visited.add(target)
+                    reachable.append(target)
+                    queue.append(target)
+
+        # Kahn's algorithm on the reachable subgraph
+        in_degree = {key: 0 for key in reachable}
+        for key in reachable:
+            for target in self._links[key].keys():
+                if target not in sources_set:
+                    in_degree[target] += 1
+
+        order = list()
+        added = set()
+        ready = deque(key for key in reachable if in_degree[key] == 0)
+        while len(order) < len(reachable):
+            if len(ready) == 0:
+                # cycle, continue from the first remaining node in breadth first order
+                ready.append(next(key for key in reachable if key not in added))
+
+            key = ready.popleft()
+            if key in added:
+                continue
+
+            order.append(key)
+            added.add(key)
+
+            for target in self._links[key].keys():
+                if target in sources_set or target in added:
+                    continue
+
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+
+        return order
+
+    def flush(self):
+        """apply all pending changes, called automatically before the linked figures are rendered"""
+        if self._flushing:
+            return
+
+        for key, node in self._nodes.items():
+            if node.poll():
+                self._dirty.pop(key, None)
+                self._dirty[key] = None
+
+        if len(self._dirty) == 0:
+            return
+
+        sources = list(self._dirty.keys())
+        self._dirty.clear()
+
+        self._flushing = True
+        try:
+            values = {key: self._nodes[key].get() for key in sources}
+
+            for key in self._get_order(sources):
+                if key not in values.keys():
+                    # no value reached this node, only possible across a broken cycle
+                    continue
+
+                node = self._nodes[key]
+                value = values[key]
+
+                if key not in sources:
+                    if _equal(value, node.get()):
+                        # unchanged, don't emit events or propagate further
+                        continue
+
+                    node.applying = True
+                    try:
+                        node.set(value)
+                    finally:
+                        node.applying = False
+
+                for target, transform in self._links[key].items():
+                    if target in sources:
+                        continue
+
+                    # the last source in topological order wins
+                    values[target] = value if transform is None else transform(value)
+        finally:
+            self._flushing = False
@@ -135,6 +135,10 @@ class TextBox:
         self._fpl_world_object = pygfx.Group()
         self._fpl_world_object.add(self._plane, self._text, self._line)
 
+        # (text, font size) of the current layout, the background and outline are only
+        # recomputed when these change, moving the textbox only moves the group
+        self._layout_key: tuple[str, float] | None = None
+
         # padded to bbox so the background box behind the text extends a bit further
         # making the text easier to read
         self._padding = np.zeros(shape=(2, 3), dtype=np.float32)
@@ -142,6 +146,7 @@ class TextBox:
 
         # position of the tooltip in screen space
         self._position = np.array([0.0, 0.0])
+        self._fpl_world_object.local.position = (8, 8, 0)
 
     @property
     def position(self) -> np.ndarray:
@@ -156,6 +161,7 @@ class TextBox:
     @font_size.setter
     def font_size(self, size: float):
         self._text.font_size = size
+        self._update_layout(self._text_str)
 
     @property
     def text_color(self):
@@ -191,13 +197,19 @@ class TextBox:
         The padding defines the number of pixels around the tooltip text that the background is extended by.
         """
 
-        return self.padding[0, :2].copy()
+        return self._padding[0, :2].copy()
 
     @padding.setter
     def padding(self, padding_xy: tuple[float, float]):
         self._padding[0, :2] = padding_xy
         self._padding[1, :2] = -np.asarray(padding_xy)
 
+        # background size has changed
+        if self._layout_key is not None:
+            text = self._text_str
+            self._layout_key = None
+            self._update_layout(text)
+
     @property
     def visible(self) -> bool:
         """get or set the visibility"""
@@ -222,13 +234,50 @@ class TextBox:
         """
         # set the text and top left position of the tooltip
         self.visible = True
-        self._text.set_text(info)
+        self._update_layout(info)
         self._draw_tooltip(position)
         self._position[:] = position
 
+    @property
+    def _text_str(self) -> str:
+        # current text
+        if self._layout_key is None:
+            return ""
+        return self._layout_key[0]
+
+    def _update_layout(self, text: str):
+        """set the text and fit the background and outline to it, skipped if the text and font size are unchanged"""
+        key = (text, self._text.font_size)
+        if key == self._layout_key:
+            return
+
+        self._layout_key = key
+        self._text.set_text(text)
+
+        # bounding box relative to the group, the group is moved to position the textbox
+        bbox = self._text.get_bounding_box()
+        if bbox is None:
+            # empty text
+            bbox = np.zeros((2, 3), dtype=np.float32)
+
+        [[x0, y0, _], [x1, y1, _]] = bbox - self._padding
+
+        plane_positions = self._plane.geometry.positions
+        plane_positions.data[masks.x0] = x0
+        plane_positions.data[masks.x1] = x1
+        plane_positions.data[masks.y0] = y0
+        plane_positions.data[masks.y1] = y1
+        plane_positions.update_range()
+
+        # line points: [x0, y0], [x0, y1], [x1, y1], [x1, y0], [x0, y0]
+        line_positions = self._line.geometry.positions
+        line_positions.data[:, 0] = (x0, x0, x1, x1, x0)
+        line_positions.data[:, 1] = (y0, y1, y1, y0, y0)
+        line_positions.update_range()
+
     def _draw_tooltip(self, pos: tuple[float, float]):
         """
-        Sets the positions of the world objects so it's draw at the given position
+        Sets the position of the textbox so it's drawn at the given position
 
         Parameters
         ----------
@@ -246,27 +295,11 @@ class TextBox:
         x += 8
         y -= 8
 
-        self._text.world.position = (x, -y, 0)
-
-        bbox = self._text.get_world_bounding_box() - self._padding
-        [[x0, y0, _], [x1, y1, _]] = bbox
-
-        self._plane.geometry.positions.data[masks.x0] = x0
-        self._plane.geometry.positions.data[masks.x1] = x1
-        self._plane.geometry.positions.data[masks.y0] = y0
-        self._plane.geometry.positions.data[masks.y1] = y1
-
-        self._plane.geometry.positions.update_range()
-
-        # line points
-        pts = [[x0, y0], [x0, y1], [x1, y1], [x1, y0], [x0, y0]]
-
-        self._line.geometry.positions.data[:, :2] = pts
-        self._line.geometry.positions.update_range()
+        self._fpl_world_object.local.position = (x, -y, 0)
 
     def clear(self, *args):
         """clear the text box and make it invisible"""
-        self._text.set_text("")
+        # the text is kept so that displaying the same text again does not need a new layout
         self._fpl_world_object.visible = False
 
 
@@ -1,11 +1,11 @@
-import ctypes
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import cmap
 
 import wgpu
 from imgui_bundle import imgui
-from wgpu import GPUTexture
+from wgpu import GPUDevice, GPUTextureView
 
 from .. import Popup
 from ...utils.functions import (
@@ -18,6 +18,76 @@ from ...utils.functions import (
 
 all_cmaps = [*SEQUENTIAL_CMAPS, *CYCLIC_CMAPS, *DIVERGING_CMAPS, *MISC_CMAPS]
 
+# width of each colormap thumbnail in the atlas
+ATLAS_THUMBNAIL_WIDTH = 50
+
+# rows of each colormap thumbnail, only the middle rows are sampled so that neighbouring thumbnails don't bleed
+ATLAS_THUMBNAIL_HEIGHT = 4
+
+# cmap thumbnail atlas for each device, shared by the colormap pickers of all figures
+_atlas_views: WeakKeyDictionary[GPUDevice, GPUTextureView] = WeakKeyDictionary()
+
+# index of each colormap in the atlas
+_atlas_rows: dict[str, int] = {name: i for i, name in enumerate(all_cmaps)}
+
+
+def make_cmap_atlas() -> np.ndarray:
+    """
+    Make an RGBA image with the thumbnails of all colormaps stacked vertically, in the order of ``all_cmaps``.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape [len(all_cmaps) * ATLAS_THUMBNAIL_HEIGHT, ATLAS_THUMBNAIL_WIDTH, 4]
+
+    """
+    x = np.linspace(0, 1, ATLAS_THUMBNAIL_WIDTH)
+    thumbnails = np.stack([cmap.Colormap(name)(x) for name in all_cmaps])
+
+    # [n_cmaps, width, 4] -> [n_cmaps * height, width, 4]
+    atlas = np.repeat(thumbnails, ATLAS_THUMBNAIL_HEIGHT, axis=0)
+
+    return (atlas * 255).astype(np.uint8)
+
+
+def get_cmap_atlas_view(device: GPUDevice) -> GPUTextureView:
+    """Get the cmap thumbnail atlas texture for this device, it is created and uploaded on first use"""
+    if device in _atlas_views:
+        return _atlas_views[device]
+
+    data = make_cmap_atlas()
+
+    texture = device.create_texture(
+        size=(data.shape[1], data.shape[0], 1),
+        usage=wgpu.TextureUsage.COPY_DST | wgpu.TextureUsage.TEXTURE_BINDING,
+        dimension=wgpu.TextureDimension.d2,
+        format=wgpu.TextureFormat.rgba8unorm,
+        mip_level_count=1,
+        sample_count=1,
+    )
+
+    device.queue.write_texture(
+        {"texture": texture, "mip_level": 0, "origin": (0, 0, 0)},
+        data,
+        {"offset": 0, "bytes_per_row": data.shape[1] * 4},
+        (data.shape[1], data.shape[0], 1),
+    )
+
+    _atlas_views[device] = texture.create_view()
+
+    return _atlas_views[device]
+
+
+def get_cmap_atlas_uvs(
+    cmap_name: str,
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """(uv0, uv1) texture coordinates of the thumbnail of this colormap within the atlas"""
+    n_rows = len(all_cmaps) * ATLAS_THUMBNAIL_HEIGHT
+    top = _atlas_rows[cmap_name] * ATLAS_THUMBNAIL_HEIGHT
+
+    # sample the middle rows of the thumbnail
+    return (0.0, (top + 1) / n_rows), (1.0, (top + ATLAS_THUMBNAIL_HEIGHT - 1) / n_rows)
+
 
 class ColormapPicker(Popup):
     """Colormap picker menu popup tool"""
@@ -31,20 +101,8 @@ class ColormapPicker(Popup):
         self.renderer = self._figure.renderer
         self.imgui_renderer = self._figure.imgui_renderer
 
-        # maps str cmap names -> int texture IDs
-        self._cmap_texture_refs: dict[str, imgui.ImTextureRef] = dict()
-
-        # make all colormaps and upload representative texture for each cmap to the GPU
-        for name in all_cmaps:
-            # get data that represents cmap
-            colormap = cmap.Colormap(name)
-            data = colormap(np.linspace(0, 1)) * 255
-
-            # needs to be 2D to create a texture
-            data = np.vstack([[data]] * 2).astype(np.uint8)
-
-            # upload the texture to the GPU, get the texture ID and texture
-            self._cmap_texture_refs[name] = self._create_texture_and_upload(data)
+        # imgui reference to the shared cmap thumbnail atlas, registered when the popup is first opened
+        self._atlas_ref: imgui.ImTextureRef | None = None
 
         # used to set the states of the UI
         self._lut_tool = None
@@ -57,32 +115,14 @@ class ColormapPicker(Popup):
 
         self._texture_height = None
 
-    def _create_texture_and_upload(self, data: np.ndarray) -> tuple[int, GPUTexture]:
-        """crates a GPUTexture from the 2D data and uploads it"""
-
-        # create a GPUTexture
-        texture = self.renderer.device.create_texture(
-            size=(data.shape[1], data.shape[0], 4),
-            usage=wgpu.TextureUsage.COPY_DST | wgpu.TextureUsage.TEXTURE_BINDING,
-            dimension=wgpu.TextureDimension.d2,
-            format=wgpu.TextureFormat.rgba8unorm,
-            mip_level_count=1,
-            sample_count=1,
-        )
-
-        # upload to the GPU
-        self.renderer.device.queue.write_texture(
-            {"texture": texture, "mip_level": 0, "origin": (0, 0, 0)},
-            data,
-            {"offset": 0, "bytes_per_row": data.shape[1] * 4},
-            (data.shape[1], data.shape[0], 1),
-        )
-
-        # get a view
-        texture_view = texture.create_view()
+    @property
+    def atlas_ref(self) -> imgui.ImTextureRef:
+        """imgui texture reference to the cmap thumbnail atlas, registered with this figure's imgui renderer on first use"""
+        if self._atlas_ref is None:
+            view = get_cmap_atlas_view(self.renderer.device)
+            self._atlas_ref = self.imgui_renderer.backend.register_texture(view)
 
-        # return texture ref
-        return self.imgui_renderer.backend.register_texture(texture_view)
+        return self._atlas_ref
 
     def open(self, pos: tuple[int, int], lut_tool):
         """
@@ -119,11 +159,13 @@ class ColormapPicker(Popup):
         imgui.push_style_color(imgui.Col_.border, (1.0, 1.0, 1.0, 1.0))
         imgui.push_style_var(imgui.StyleVar_.image_border_size, 1.0)
 
-        # cmap image
-        texture_ref = self._cmap_texture_refs[cmap_name]
+        # cmap image, from the thumbnail atlas
+        uv0, uv1 = get_cmap_atlas_uvs(cmap_name)
         imgui.image(
-            texture_ref,
+            self.atlas_ref,
             image_size=(50, self._texture_height),
+            uv0=uv0,
+            uv1=uv1,
         )
         # pop white border
         imgui.pop_style_var()
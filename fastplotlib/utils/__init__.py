@@ -1,10 +1,8 @@
+import importlib
 from dataclasses import dataclass
 
-# this MUST be imported as early as possible in fpl.__init__ before any other wgpu stuff
-from .gui import loop
 from .functions import *
 from .gpu import enumerate_adapters, select_adapter, print_wgpu_report
-from ._plot_helpers import *
 from .enums import *
 
 
@@ -14,3 +12,26 @@ class _Config:
 
 
 config = _Config(party_parrot=False)
+
+
+def __getattr__(name: str):
+    # the gui module selects the canvas backend when it is imported, only do this when the loop is needed
+    if name == "loop":
+        from .gui import loop
+
+        return loop
+
+    # the plot helpers import graphics, which imports utils, so these are imported on first access
+    if name in [
+        "_plot_helpers",
+        "get_nearest_graphics_indices",
+        "get_nearest_graphics",
+    ]:
+        _plot_helpers = importlib.import_module("._plot_helpers", __name__)
+
+        if name == "_plot_helpers":
+            return _plot_helpers
+
+        return getattr(_plot_helpers, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
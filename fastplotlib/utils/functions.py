@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from functools import lru_cache
 from typing import *
 
 import numpy as np
@@ -6,7 +7,6 @@ import cmap as cmap_lib
 
 from pygfx import Texture, Color
 
-
 cmap_catalog = cmap_lib.Catalog()
 
 COLORMAPS = sorted(
@@ -138,7 +138,36 @@ COLORMAP_NAMES = {
 }
 
 
-def get_cmap(name: str, alpha: float = 1.0, gamma: float = 1.0) -> np.ndarray:
+# max number of colormaps, LUTs and textures that are kept in the process-wide caches
+CMAP_CACHE_SIZE: int = 128
+
+
+@lru_cache(maxsize=CMAP_CACHE_SIZE)
+def _get_colormap_cached(name: str) -> cmap_lib.Colormap:
+    return cmap_lib.Colormap(name)
+
+
+def _get_colormap(name: str | dict) -> cmap_lib.Colormap:
+    """get a ``cmap.Colormap``, cached by name"""
+    if isinstance(name, str):
+        return _get_colormap_cached(name)
+
+    # not hashable, ex: dict
+    return cmap_lib.Colormap(name)
+
+
+@lru_cache(maxsize=CMAP_CACHE_SIZE)
+def _get_cmap_lut(name: str, alpha: float, gamma: float, n: int) -> np.ndarray:
+    lut = _get_colormap(name).lut(n, gamma=gamma).astype(np.float32)
+    lut[:, -1] = alpha
+    # shared by every caller, must never be modified in-place
+    lut.flags.writeable = False
+    return lut
+
+
+def get_cmap(
+    name: str, alpha: float = 1.0, gamma: float = 1.0, n: int = 256
+) -> np.ndarray:
     """
     Get a colormap as numpy array
 
@@ -150,6 +179,8 @@ def get_cmap(name: str, alpha: float = 1.0, gamma: float = 1.0) -> np.ndarray:
         alpha, 0.0 - 1.0
     gamma: float
         gamma, 0.0 - 1.0
+    n: int, default 256
+        number of colors in the LUT
 
     Returns
     -------
@@ -157,10 +188,14 @@ def get_cmap(name: str, alpha: float = 1.0, gamma: float = 1.0) -> np.ndarray:
         [n_colors, 4], i.e. [n_colors, RGBA]
 
     """
+    if not isinstance(name, str):
+        # not hashable, ex: dict
+        cmap = cmap_lib.Colormap(name).lut(n, gamma=gamma)
+        cmap[:, -1] = alpha
+        return cmap.astype(np.float32)
 
-    cmap = cmap_lib.Colormap(name).lut(256, gamma=gamma)
-    cmap[:, -1] = alpha
-    return cmap.astype(np.float32)
+    # the LUT is cached, return a copy so that the cached LUT is never modified
+    return _get_cmap_lut(name, alpha, gamma, n).copy()
 
 
 def make_colors(n_colors: int, cmap: str, alpha: float = 1.0) -> np.ndarray:
@@ -186,7 +221,7 @@ def make_colors(n_colors: int, cmap: str, alpha: float = 1.0) -> np.ndarray:
 
     """
 
-    cm = cmap_lib.Colormap(cmap)
+    cm = _get_colormap(cmap)
 
     # can also use cm.category == "qualitative", but checking for non-interpolated
     # colormaps is a bit more general.  (and not all "custom" colormaps will be
@@ -204,8 +239,50 @@ def make_colors(n_colors: int, cmap: str, alpha: float = 1.0) -> np.ndarray:
     return cm(cm_ixs).astype(np.float32)
 
 
-def get_cmap_texture(name: str, alpha: float = 1.0) -> Texture:
-    return Texture(get_cmap(name, alpha), dim=1)
+# LRU cache of cmap textures, {(name, alpha, gamma, n): Texture}
+_CMAP_TEXTURES: OrderedDict[tuple[str, float, float, int], Texture] = OrderedDict()
+
+
+def get_cmap_texture(
+    name: str, alpha: float = 1.0, gamma: float = 1.0, n: int = 256
+) -> Texture:
+    """
+    Get a 1D texture of a colormap.
+
+    Textures are cached and shared by all graphics that use the same colormap, they must
+    not be modified in-place. Set a new texture on the ``TextureMap`` to change a cmap instead.
+
+    Parameters
+    ----------
+    name: str
+        name of colormap
+    alpha: float
+        alpha, 0.0 - 1.0
+    gamma: float
+        gamma, 0.0 - 1.0
+    n: int, default 256
+        number of colors in the LUT
+
+    Returns
+    -------
+    Texture
+        shared 1D texture of the colormap LUT
+
+    """
+    key = (name, alpha, gamma, n)
+
+    if key in _CMAP_TEXTURES:
+        _CMAP_TEXTURES.move_to_end(key)
+        return _CMAP_TEXTURES[key]
+
+    texture = Texture(_get_cmap_lut(name, alpha, gamma, n), dim=1)
+    _CMAP_TEXTURES[key] = texture
+
+    if len(_CMAP_TEXTURES) > CMAP_CACHE_SIZE:
+        # evict the least recently used texture, graphics that are still using it keep a reference
+        _CMAP_TEXTURES.popitem(last=False)
+
+    return texture
 
 
 def make_colors_dict(labels: Sequence, cmap: str, **kwargs) -> OrderedDict:
@@ -331,10 +408,12 @@ def calculate_figure_shape(n_subplots: int) -> tuple[int, int]:
 
 def normalize_min_max(a):
     """normalize an array between 0 - 1"""
-    if np.unique(a).size == 1:
+    a_min, a_max = np.min(a), np.max(a)
+
+    if a_min == a_max:
         return np.zeros(a.size)
 
-    return (a - np.min(a)) / (np.max(a - np.min(a)))
+    return (a - a_min) / (a_max - a_min)
 
 
 def parse_cmap_values(
@@ -373,12 +452,12 @@ def parse_cmap_values(
                 f"len(cmap_values) != len(data): {len(transform)} != {n_colors}"
             )
 
-        colormap = get_cmap(cmap_name)
+        colormap = _get_cmap_lut(cmap_name, 1.0, 1.0, 256)
 
         n_colors = colormap.shape[0] - 1
 
         # can also use cm.category == "qualitative"
-        if cmap_lib.Colormap(cmap_name).interpolation == "nearest":
+        if _get_colormap(cmap_name).interpolation == "nearest":
 
             # check that cmap_values are <int> and within the number of colors `n_colors`
 
@@ -388,7 +467,7 @@ def parse_cmap_values(
                     f"<int> `cmap_transform` values should be used with qualitative colormaps, "
                     f"the dtype you have passed is {transform.dtype}"
                 )
-            if max(transform) > n_colors:
+            if transform.max() > n_colors:
                 raise IndexError(
                     f"You have chosen the qualitative colormap <'{cmap_name}'> which only has "
                     f"<{n_colors}> colors, which is lower than the max value of your `cmap_transform`."
@@ -400,7 +479,7 @@ def parse_cmap_values(
             norm_cmap_values = (normalize_min_max(transform) * n_colors).astype(int)
 
         # use colormap as LUT to map the cmap_values to the colormap index
-        colors = np.vstack([colormap[val] for val in norm_cmap_values])
+        colors = np.take(colormap, norm_cmap_values, axis=0)
 
         return colors
 
@@ -1,7 +1,13 @@
+from functools import cache
+from warnings import warn
+
 import wgpu
 from pygfx.renderers.wgpu import select_adapter as pygfx_select_adapter
 from pygfx import print_wgpu_report as pygfx_print_wgpu_report
 
+# pygfx version that the uses of private pygfx internals are tested with, it is pinned in pyproject.toml
+SUPPORTED_PYGFX_VERSION = "0.15.3"
+
 
 def enumerate_adapters() -> list[wgpu.GPUAdapter]:
     return wgpu.gpu.enumerate_adapters_sync()
@@ -22,3 +28,26 @@ def print_wgpu_report():
 
 
 print_wgpu_report.__doc__ = pygfx_print_wgpu_report.__doc__
+
+
+@cache
+def check_adapters():
+    """
+    Warn if WGPU cannot enumerate any adapters. This is only done once, when the first canvas and
+    renderer are created, instead of at ``import fastplotlib``.
+    """
+    if len(enumerate_adapters()) < 1:
+        warn(
+            f"WGPU could not enumerate any adapters, fastplotlib will not work.\n"
+            f"This is caused by one of the following:\n"
+            f"1. You do not have a hardware GPU installed and you do not have "
+            f"software rendering (ex. lavapipe) installed either\n"
+            f"2. Your GPU drivers are not installed or something is wrong with your GPU driver installation, "
+            f"re-installing the latest drivers from your hardware vendor (probably Nvidia or AMD) may help.\n"
+            f"3. You are missing system libraries that are required for WGPU to access GPU(s), this is "
+            f"common in cloud computing environments.\n"
+            f"These two links can help you troubleshoot:\n"
+            f"https://wgpu-py.readthedocs.io/en/stable/start.html#platform-requirements\n"
+            f"https://fastplotlib.readthedocs.io/en/latest/user_guide/gpu.html\n",
+            RuntimeWarning,
+        )
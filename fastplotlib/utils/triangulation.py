@@ -3,32 +3,47 @@ import logging
 import numpy as np
 from .mapbox_earcut import earcut as mapbox_earcut
 
-
 logger = logging.getLogger("fastplotlib")
 
 
-# Note: the current triangulation is in pure Python. If the results or performance of the current implementation
-# proves inadequate, we can have a look at Bermuda: https://github.com/napari/bermuda
+# Note: the default triangulation uses numpy, convex polygons are triangulated as a fan and large polygons
+# with ear clipping that clips many ears at once. The pure Python mapbox earcut port is used for small
+# non-convex polygons and for polygons that the vectorized ear clipping cannot handle, such as
+# self-intersecting polygons.
+# If the results or performance prove inadequate, we can have a look at Bermuda: https://github.com/napari/bermuda
 
 
-def triangulate(positions, method="earcut"):
+def triangulate(positions, method="auto", reuse: np.ndarray | None = None):
     """Triangulate the given vertex positions.
 
     Returns an Nx3 integer array of faces that form a surface-mesh over the
     given positions, where N is the length of the positions minus 2,
     expressed in (local) vertex indices. The faces won't contain any
     forbidden_edges.
+
+    If ``reuse`` is given, these faces are returned if they are still a valid
+    triangulation of the positions. Useful when the vertices of a polygon move
+    but the number of vertices does not change.
     """
     if len(positions) < 3:
         return np.zeros((0,), np.int32)
     if len(positions) == 3:
         return np.array([0, 1, 2], np.int32)
 
+    if reuse is not None and faces_are_valid(positions, reuse):
+        return reuse
+
     # Anticipating more variations ...
     if method == "earcut":
         method = "mapbox_earcut"
 
-    if method == "naive":
+    if method == "auto":
+        faces = _triangulate_numpy(positions, min_ear_clipping_size=256)
+        if faces is None:
+            # small non-convex polygon, or vectorized ear clipping failed, ex: self-intersecting polygon
+            logger.debug("using mapbox earcut")
+            faces = triangulate(positions, method="mapbox_earcut")
+    elif method == "naive":
         faces = _triangulate_naive(positions)
     elif method == "mapbox_earcut":
         positions2d = positions[:, :2].flatten()
@@ -68,3 +83,409 @@ def _triangulate_naive(positions, forbidden_edges=None):
         i2 = (i + 2) % nverts
         faces.append([i0, i1, i2])
     return np.array(faces, np.int32)
+
+
+def _signed_area(positions2d: np.ndarray) -> float:
+    """shoelace formula, positive if the polygon is counter-clockwise"""
+    x, y = positions2d[:, 0], positions2d[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _cross(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """z component of (b - a) x (c - b), positive for a left turn at b"""
+    return (b[..., 0] - a[..., 0]) * (c[..., 1] - b[..., 1]) - (
+        b[..., 1] - a[..., 1]
+    ) * (c[..., 0] - b[..., 0])
+
+
+def faces_are_valid(positions, faces: np.ndarray) -> bool:
+    """
+    Check that faces from a previous triangulation are a valid triangulation of a simple polygon
+    with the given vertex positions.
+
+    The faces must be a triangulated disk bounded by the polygon edges: every polygon edge is the edge
+    of exactly one face, in the direction of the polygon, and every other edge is shared by exactly two
+    faces, in opposite directions. If in addition every face has the orientation of the polygon,
+    the faces cover every point inside the polygon exactly once and cannot overlap.
+    """
+    faces = np.asarray(faces).reshape(-1, 3)
+    n = len(positions)
+    if faces.shape[0] != n - 2 or faces.min() < 0 or faces.max() >= n:
+        return False
+
+    positions2d = np.asarray(positions)[:, :2].astype(np.float64)
+    area = _signed_area(positions2d)
+
+    if area == 0:
+        return False
+
+    faces = faces.astype(np.int64)
+
+    # the faces can be oriented either way, ex: mapbox earcut, use the orientation of the polygon
+    if not np.any((faces == 0) & (faces[:, [1, 2, 0]] == 1)):
+        faces = faces[:, ::-1]
+
+    # directed edges of the faces, each encoded as a single integer
+    edge_start = faces.ravel()
+    edge_end = faces[:, [1, 2, 0]].ravel()
+    edges = edge_start * n + edge_end
+    if np.unique(edges).size != edges.size:
+        return False
+
+    # the polygon edges, directed as the faces are if they have the orientation of the polygon
+    boundary = np.arange(n) * n + (np.arange(n) + 1) % n
+    is_boundary = np.isin(edges, boundary)
+    if np.count_nonzero(is_boundary) != n:
+        return False
+
+    # every other edge must have a twin in the opposite direction
+    interior = ~is_boundary
+    reverse = edge_end[interior] * n + edge_start[interior]
+    if not np.isin(reverse, edges[interior]).all():
+        return False
+
+    tri = positions2d[faces]
+    areas = _cross(tri[:, 0], tri[:, 1], tri[:, 2]) * np.sign(area)
+
+    # every face has the orientation of the polygon, or zero area, ex: collinear vertices
+    return bool(np.all(areas >= 0))
+
+
+def _triangulate_numpy(positions, min_ear_clipping_size: int = 0) -> np.ndarray | None:
+    """
+    Vectorized triangulation of a simple polygon without holes, returns ``None`` if it fails.
+
+    Non-convex polygons with fewer than ``min_ear_clipping_size`` vertices are not triangulated
+    and ``None`` is returned, the overhead of the numpy calls makes ear clipping slower than
+    mapbox earcut for small polygons.
+
+    Convex polygons are triangulated as a fan. Otherwise ears are clipped with :func:`_ear_clip_polygons`.
+    """
+    positions2d = np.asarray(positions)[:, :2].astype(np.float64)
+    n = len(positions2d)
+
+    area = _signed_area(positions2d)
+
+    # work with a counter-clockwise polygon
+    indices = np.arange(n, dtype=np.int32)
+    if area < 0:
+        indices = indices[::-1]
+
+    pts = positions2d[indices]
+    turns = _cross(np.roll(pts, 1, axis=0), pts, np.roll(pts, -1, axis=0))
+
+    if np.all(turns >= 0):
+        # convex, fan triangulation from the first vertex
+        faces = np.column_stack(
+            [np.zeros(n - 2, dtype=np.int32), np.arange(1, n - 1), np.arange(2, n)]
+        )
+        return indices[faces].astype(np.int32)
+
+    if n < min_ear_clipping_size or area == 0:
+        return None
+
+    faces, _, failed = _ear_clip_polygons(
+        positions2d, np.array([0, n]), np.sign([area]), np.array([0])
+    )
+
+    if len(failed) > 0:
+        return None
+
+    return faces.astype(np.int32)
+
+
+def _any_point_in_triangles(
+    points, point_ids, a, b, c, triangle_ids, chunk_size: int = 2**22
+):
+    """
+    For each triangle [a, b, c] (counter-clockwise), whether any of the points is inside or on the edge,
+    points that are a vertex of the triangle (same id) are ignored.
+
+    Only the points within the x range of each triangle are tested, the points are sorted by x so
+    these are a contiguous range for each triangle.
+    """
+    order = np.argsort(points[:, 0], kind="stable")
+    sorted_x = points[order, 0]
+
+    tri_x = np.stack([a[:, 0], b[:, 0], c[:, 0]])
+    lo = np.searchsorted(sorted_x, tri_x.min(axis=0), side="left")
+    hi = np.searchsorted(sorted_x, tri_x.max(axis=0), side="right")
+    counts = hi - lo
+
+    result = np.zeros(len(a), dtype=bool)
+
+    # limit the number of (triangle, point) pairs tested at once
+    ends = np.cumsum(counts)
+    chunk_ends = np.searchsorted(
+        ends, np.arange(chunk_size, ends[-1] + chunk_size, chunk_size), side="right"
+    )
+
+    start = 0
+    for stop in [*chunk_ends, len(a)]:
+        stop = max(stop, start + 1)
+        if start >= len(a):
+            break
+
+        s = slice(start, stop)
+        start = stop
+
+        n_pairs = counts[s].sum()
+        if n_pairs == 0:
+            continue
+
+        # (triangle, point) pairs
+        tri = np.repeat(np.arange(s.start, s.stop), counts[s])
+        offsets = np.arange(n_pairs) - np.repeat(
+            np.cumsum(counts[s]) - counts[s], counts[s]
+        )
+        pt = order[lo[tri] + offsets]
+
+        px, py = points[pt, 0], points[pt, 1]
+
+        inside = (point_ids[pt] != triangle_ids[tri, 0]) & (
+            point_ids[pt] != triangle_ids[tri, 2]
+        )
+        for v0, v1 in [(a[tri], b[tri]), (b[tri], c[tri]), (c[tri], a[tri])]:
+            # point is left of or on each edge
+            inside &= (
+                (v1[:, 0] - v0[:, 0]) * (py - v0[:, 1])
+                - (v1[:, 1] - v0[:, 1]) * (px - v0[:, 0])
+            ) >= 0
+
+        result[np.unique(tri[inside])] = True
+
+    return result
+
+
+def triangulate_polygons(polygons: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Triangulate many polygons at once.
+
+    The polygons are triangulated together with numpy: convex polygons as fans and the other polygons with
+    :func:`_ear_clip_polygons`, the rings of all polygons are processed in the same iterations.
+    Polygons that cannot be ear clipped, ex: self-intersecting polygons, are triangulated separately
+    with :func:`triangulate`.
+
+    Returns the faces, [n_faces, 3] indices into the concatenated vertices of all polygons, and the
+    face offsets, [n_polygons + 1], the faces of polygon ``i`` are ``faces[face_offsets[i]:face_offsets[i + 1]]``.
+    """
+    n_polygons = len(polygons)
+    sizes = np.array([len(p) for p in polygons], dtype=np.int64)
+    vertex_offsets = np.concatenate([[0], np.cumsum(sizes)])
+
+    if vertex_offsets[-1] == 0:
+        return np.zeros((0, 3), np.int32), np.zeros(n_polygons + 1, np.int64)
+
+    positions2d = np.concatenate(
+        [np.asarray(p, dtype=np.float64)[:, :2].reshape(-1, 2) for p in polygons]
+    )
+    polygon_ids = np.repeat(np.arange(n_polygons), sizes)
+
+    # previous and next vertex of each vertex within its polygon
+    vertex_ids = np.arange(len(positions2d))
+    first = vertex_offsets[:-1][polygon_ids]
+    last = vertex_offsets[1:][polygon_ids] - 1
+    prev_ = np.where(vertex_ids == first, last, vertex_ids - 1)
+    next_ = np.where(vertex_ids == last, first, vertex_ids + 1)
+
+    # shoelace formula for all polygons
+    x, y = positions2d[:, 0], positions2d[:, 1]
+    areas = np.bincount(
+        polygon_ids, weights=x * y[next_] - x[next_] * y, minlength=n_polygons
+    )
+    orientation = np.sign(areas)
+
+    # turns with counter-clockwise orientation for all polygons
+    turns = (
+        _cross(positions2d[prev_], positions2d, positions2d[next_])
+        * orientation[polygon_ids]
+    )
+    convex = np.bincount(polygon_ids, weights=turns < 0, minlength=n_polygons) == 0
+
+    valid = sizes >= 3
+    fan = valid & convex & (areas != 0)
+    clip = valid & ~convex & (areas != 0)
+
+    faces = list()
+    face_polygon_ids = list()
+
+    # fan triangulation of all convex polygons
+    fan_ids = np.flatnonzero(fan)
+    n_faces = sizes[fan_ids] - 2
+    fan_polygon_ids = np.repeat(fan_ids, n_faces)
+    j = np.arange(n_faces.sum()) - np.repeat(np.cumsum(n_faces) - n_faces, n_faces)
+    start = vertex_offsets[fan_polygon_ids]
+    faces.append(np.column_stack([start, start + j + 1, start + j + 2]))
+    face_polygon_ids.append(fan_polygon_ids)
+
+    # batched ear clipping of the other polygons
+    clip_faces, clip_polygon_ids, failed = _ear_clip_polygons(
+        positions2d, vertex_offsets, orientation, np.flatnonzero(clip)
+    )
+    faces.append(clip_faces)
+    face_polygon_ids.append(clip_polygon_ids)
+
+    # everything else is triangulated one polygon at a time
+    for i in [*np.flatnonzero(valid & (areas == 0)), *failed]:
+        polygon_faces = triangulate(
+            positions2d[vertex_offsets[i] : vertex_offsets[i + 1]]
+        )
+        polygon_faces = np.asarray(polygon_faces).reshape(-1, 3)
+        faces.append(polygon_faces + vertex_offsets[i])
+        face_polygon_ids.append(np.full(len(polygon_faces), i))
+
+    faces = np.concatenate(faces)
+    face_polygon_ids = np.concatenate(face_polygon_ids)
+
+    # group the faces by polygon
+    order = np.argsort(face_polygon_ids, kind="stable")
+    face_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(face_polygon_ids, minlength=n_polygons))]
+    )
+
+    return faces[order].astype(np.int32), face_offsets
+
+
+def _ear_clip_polygons(
+    positions2d: np.ndarray,
+    vertex_offsets: np.ndarray,
+    orientation: np.ndarray,
+    polygon_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, list[int]]:
+    """
+    Ear clipping of many polygons at once, the rings of the polygons are concatenated and every iteration
+    clips the non-adjacent ears of all polygons.
+
+    On each iteration the ear test is done for all vertices at once and all ears that are not adjacent
+    to another clipped ear are clipped. Ears that are not adjacent can always be clipped together, so the
+    number of iterations is usually much smaller than the number of vertices.
+
+    Returns the faces, the polygon of each face, and the polygons that could not be ear clipped.
+    """
+    if polygon_ids.size == 0:
+        return np.zeros((0, 3), np.int64), np.zeros(0, np.int64), list()
+
+    sizes = vertex_offsets[polygon_ids + 1] - vertex_offsets[polygon_ids]
+
+    # ring of remaining vertices, the vertices of each polygon are contiguous and counter-clockwise
+    ring_polygons = np.repeat(polygon_ids, sizes)
+    local = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    ccw = orientation[ring_polygons] > 0
+    ring = vertex_offsets[ring_polygons] + np.where(
+        ccw, local, np.repeat(sizes, sizes) - 1 - local
+    )
+
+    # translate the polygons so that their x ranges do not overlap, the points in triangle
+    # test then never tests points of one polygon against the triangles of another polygon
+    ring_x = positions2d[ring, 0]
+    polygon_starts = np.cumsum(sizes) - sizes
+    min_x = np.minimum.reduceat(ring_x, polygon_starts)
+    widths = np.maximum.reduceat(ring_x, polygon_starts) - min_x + 1
+    shift = np.zeros(len(vertex_offsets) - 1)
+    shift[polygon_ids] = np.cumsum(widths) - widths - min_x
+
+    pts = positions2d.copy()
+    pts[ring, 0] += shift[ring_polygons]
+
+    faces = list()
+    face_polygon_ids = list()
+    failed = list()
+
+    while ring.size > 0:
+        n = ring.size
+        pos = np.arange(n)
+
+        # start and size of each polygon in the ring
+        is_first = np.ones(n, dtype=bool)
+        is_first[1:] = ring_polygons[1:] != ring_polygons[:-1]
+        starts = np.flatnonzero(is_first)
+        group_sizes = np.diff(np.append(starts, n))
+        group = np.cumsum(is_first) - 1
+
+        # polygons that are down to their last triangle
+        done = group_sizes == 3
+        if done.any():
+            faces.append(ring[starts[done][:, None] + np.arange(3)])
+            face_polygon_ids.append(ring_polygons[starts[done]])
+
+            keep = ~done[group]
+            ring, ring_polygons = ring[keep], ring_polygons[keep]
+            continue
+
+        first_pos = starts[group]
+        last_pos = first_pos + group_sizes[group] - 1
+        prev_pos = np.where(pos == first_pos, last_pos, pos - 1)
+        next_pos = np.where(pos == last_pos, first_pos, pos + 1)
+
+        a, b, c = pts[ring[prev_pos]], pts[ring], pts[ring[next_pos]]
+        turns = _cross(a, b, c)
+
+        reflex = np.flatnonzero(turns < 0)
+
+        # collinear vertices make zero area faces, clip them right away
+        ears = turns == 0
+
+        candidates = np.flatnonzero(turns > 0)
+        if reflex.size == 0:
+            ears[candidates] = True
+        elif candidates.size > 0:
+            ears[candidates] = ~_any_point_in_triangles(
+                pts[ring[reflex]],
+                ring[reflex],
+                a[candidates],
+                b[candidates],
+                c[candidates],
+                np.column_stack(
+                    [
+                        ring[prev_pos[candidates]],
+                        ring[candidates],
+                        ring[next_pos[candidates]],
+                    ]
+                ),
+            )
+
+        n_ears = np.bincount(group, weights=ears, minlength=len(starts))
+        if (n_ears == 0).any():
+            # these polygons cannot be ear clipped, ex: self-intersecting
+            no_ears = n_ears == 0
+            failed.extend(ring_polygons[starts[no_ears]].tolist())
+
+            keep = ~no_ears[group]
+            ring, ring_polygons = ring[keep], ring_polygons[keep]
+            continue
+
+        # select ears that are not adjacent to each other: in each run of consecutive ears take every other ear
+        run_start = ears & ~ears[prev_pos]
+        all_ears = n_ears == group_sizes
+        run_start[starts[all_ears]] = True
+        start_index = np.maximum.accumulate(np.where(run_start, pos, 0))
+        selected = ears & ((pos - start_index) % 2 == 0)
+
+        # the ring of each polygon wraps around
+        wrapped = selected[starts] & selected[starts + group_sizes - 1]
+        selected[(starts + group_sizes - 1)[wrapped]] = False
+
+        # leave at least 3 vertices of each polygon
+        n_selected = np.cumsum(selected)
+        rank = n_selected - (n_selected[first_pos] - selected[first_pos]) - 1
+        selected &= rank < group_sizes[group] - 3
+
+        faces.append(
+            np.column_stack(
+                [ring[prev_pos[selected]], ring[selected], ring[next_pos[selected]]]
+            )
+        )
+        face_polygon_ids.append(ring_polygons[selected])
+
+        ring, ring_polygons = ring[~selected], ring_polygons[~selected]
+
+    if len(faces) == 0:
+        return np.zeros((0, 3), np.int64), np.zeros(0, np.int64), failed
+
+    faces = np.concatenate(faces)
+    face_polygon_ids = np.concatenate(face_polygon_ids)
+
+    # the failed polygons are triangulated again from scratch
+    keep = ~np.isin(face_polygon_ids, failed)
+
+    return faces[keep], face_polygon_ids[keep], failed
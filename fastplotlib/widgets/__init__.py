@@ -1,3 +1,3 @@
-from .image_widget import ImageWidget
+from .image_widget import ImageWidget, PlaybackClock, PlaybackStats
 
-__all__ = ["ImageWidget"]
+__all__ = ["ImageWidget", "PlaybackClock", "PlaybackStats"]
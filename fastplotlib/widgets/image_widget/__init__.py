@@ -1,4 +1,5 @@
 from ...layouts import IMGUI
+from ._playback import PlaybackClock, PlaybackStats
 
 if IMGUI:
     from ._widget import ImageWidget
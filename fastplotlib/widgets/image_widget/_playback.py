@@ -0,0 +1,236 @@
+from collections import deque
+from math import floor
+from time import perf_counter
+from typing import Callable
+
+
+class PlaybackClock:
+    def __init__(
+        self,
+        fps: float = 20,
+        loop: bool = False,
+        time_func: Callable[[], float] = perf_counter,
+    ):
+        """
+        Media clock for playing through a dimension at a fixed framerate, independent of the render rate.
+
+        The frame to display is computed from the time elapsed since playback started, so playback does not
+        drift and frames are skipped when rendering falls behind. A clock can be shared by multiple
+        ImageWidgets to play them in sync, see :meth:`.ImageWidget.set_playback_clock`.
+
+        Parameters
+        ----------
+        fps: float, default 20
+            playback framerate
+
+        loop: bool, default False
+            loop back to the first frame at the end, if ``False`` playback stops at the last frame
+
+        time_func: Callable[[], float], default ``time.perf_counter``
+            returns the current time in seconds
+
+        """
+        if fps <= 0:
+            raise ValueError(f"`fps` must be positive, you passed: {fps}")
+
+        self._fps = float(fps)
+        self._loop = loop
+        self._time_func = time_func
+
+        self._playing = False
+
+        # playback position is _anchor_index at _anchor_time, and advances at fps from there
+        self._anchor_index: int = 0
+        self._anchor_time: float = 0.0
+
+        # number of frames of the longest media played with this clock, playback stops at its end
+        self._n_frames: int = 0
+
+    @property
+    def fps(self) -> float:
+        """Get or set the playback framerate"""
+        return self._fps
+
+    @fps.setter
+    def fps(self, value: float):
+        if value <= 0:
+            raise ValueError(f"`fps` must be positive, you passed: {value}")
+
+        # continue from the current position at the new rate
+        self._reanchor(self.position)
+        self._fps = float(value)
+
+    @property
+    def loop(self) -> bool:
+        """Get or set whether playback loops back to the first frame at the end"""
+        return self._loop
+
+    @loop.setter
+    def loop(self, value: bool):
+        self._loop = bool(value)
+
+    @property
+    def playing(self) -> bool:
+        """``True`` if the clock is running"""
+        return self._playing
+
+    @property
+    def position(self) -> float:
+        """current playback position in frames, not wrapped or clamped to the number of frames"""
+        if not self._playing:
+            return float(self._anchor_index)
+
+        return self._anchor_index + (self._time_func() - self._anchor_time) * self.fps
+
+    def _reanchor(self, position: float):
+        # keep the fraction of the current frame so that changing the fps or pausing doesn't skip or repeat frames
+        self._anchor_index = floor(position)
+        self._anchor_time = (
+            self._time_func() - (position - self._anchor_index) / self.fps
+        )
+
+    def play(self, index: int = None):
+        """
+        Start playback
+
+        Parameters
+        ----------
+        index: int, optional
+            frame to start from, by default playback resumes from the current position
+
+        """
+        if index is not None:
+            self._anchor_index = int(index)
+        else:
+            self._anchor_index = floor(self.position)
+
+        self._anchor_time = self._time_func()
+        self._playing = True
+
+    def pause(self):
+        """Pause playback at the current frame"""
+        self._anchor_index = floor(self.position)
+        self._playing = False
+
+    def seek(self, index: int):
+        """Jump to the given frame, playback continues from there if the clock is running"""
+        self._anchor_index = int(index)
+        self._anchor_time = self._time_func()
+
+    def _fpl_add_media(self, n_frames: int):
+        """register the number of frames of a media played with this clock"""
+        self._n_frames = max(self._n_frames, n_frames)
+
+    def get_frame(self, n_frames: int) -> tuple[int, float]:
+        """
+        Get the frame that is due now
+
+        If the clock does not loop, shorter media stay at their last frame and the clock stops at the end of
+        the longest media that it plays.
+
+        Parameters
+        ----------
+        n_frames: int
+            number of frames in the played dimension of the caller
+
+        Returns
+        -------
+        tuple[int, float]
+            | frame index
+            | latency: time in seconds since this frame became due
+
+        """
+        position = self.position
+        index = floor(position)
+
+        latency = (position - index) / self.fps if self._playing else 0.0
+
+        self._fpl_add_media(n_frames)
+
+        if self.loop:
+            index %= n_frames
+
+        else:
+            if index >= self._n_frames:
+                # end of the longest media, stop at its last frame
+                self._anchor_index = self._n_frames - 1
+                self._playing = False
+
+            if index >= n_frames:
+                # clamped for this caller only
+                index = n_frames - 1
+                latency = 0.0
+
+        return index, latency
+
+
+class PlaybackStats:
+    # number of recent frames used to compute the achieved framerate
+    window: int = 30
+
+    def __init__(self):
+        """Playback statistics of one dimension of an ImageWidget"""
+        self._frame_times: deque[float] = deque(maxlen=self.window)
+
+        self._frames_displayed: int = 0
+        self._frames_dropped: int = 0
+        self._latency: float = 0.0
+
+    @property
+    def fps(self) -> float:
+        """achieved framerate over the recently displayed frames"""
+        if len(self._frame_times) < 2:
+            return 0.0
+
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        if elapsed <= 0:
+            return 0.0
+
+        return (len(self._frame_times) - 1) / elapsed
+
+    @property
+    def frames_displayed(self) -> int:
+        """number of frames displayed during playback"""
+        return self._frames_displayed
+
+    @property
+    def frames_dropped(self) -> int:
+        """number of frames that were skipped to keep up with the playback clock"""
+        return self._frames_dropped
+
+    @property
+    def latency(self) -> float:
+        """time in seconds between when the last displayed frame became due and when it was displayed"""
+        return self._latency
+
+    def _update(
+        self,
+        previous_index: int,
+        index: int,
+        n_frames: int,
+        latency: float,
+        now: float,
+    ):
+        """record that frame ``index`` was displayed after frame ``previous_index``"""
+        if index > previous_index:
+            self._frames_dropped += index - previous_index - 1
+        elif index < previous_index:
+            # looped back
+            self._frames_dropped += (n_frames - 1 - previous_index) + index
+
+        self._frames_displayed += 1
+        self._latency = latency
+        self._frame_times.append(now)
+
+    def reset(self):
+        """reset all stats"""
+        self._frame_times.clear()
+        self._frames_displayed = 0
+        self._frames_dropped = 0
+        self._latency = 0.0
+
+    def __repr__(self):
+        return (
+            f"PlaybackStats(fps={self.fps:.1f}, frames_displayed={self.frames_displayed}, "
+            f"frames_dropped={self.frames_dropped}, latency={self.latency * 1000:.1f}ms)"
+        )
@@ -4,6 +4,7 @@ from time import perf_counter
 from imgui_bundle import imgui, icons_fontawesome_6 as fa
 
 from ...ui import EdgeWindow
+from ._playback import PlaybackClock, PlaybackStats
 
 
 class ImageWidgetSliders(EdgeWindow):
@@ -11,23 +12,50 @@ class ImageWidgetSliders(EdgeWindow):
         super().__init__(figure=figure, size=size, location=location, title=title)
         self._image_widget = image_widget
 
-        # whether or not a dimension is in play mode
-        self._playing: dict[str, bool] = {"t": False, "z": False}
+        # clock that determines the frame to display when playing a dimension
+        self._clocks: dict[str, PlaybackClock] = {
+            "t": PlaybackClock(fps=20),
+            "z": PlaybackClock(fps=20),
+        }
 
-        # approximate framerate for playing
-        self._fps: dict[str, int] = {"t": 20, "z": 20}
-        # framerate converted to frame time
-        self._frame_time: dict[str, float] = {"t": 1 / 20, "z": 1 / 20}
-
-        # last timepoint that a frame was displayed from a given dimension
-        self._last_frame_time: dict[str, float] = {"t": 0, "z": 0}
+        self._stats: dict[str, PlaybackStats] = {
+            "t": PlaybackStats(),
+            "z": PlaybackStats(),
+        }
 
         self._loop = False
 
         if "RTD_BUILD" in os.environ.keys():
             if os.environ["RTD_BUILD"] == "1":
-                self._playing["t"] = True
                 self._loop = True
+                self._clocks["t"].loop = True
+                self._clocks["t"].play()
+
+    def set_clock(self, dim: str, clock: PlaybackClock):
+        """use the given clock for playing this dimension, it can be shared with other ImageWidgets"""
+        self._clocks[dim] = clock
+        self._stats[dim].reset()
+
+        if dim in self._image_widget._dims_max_bounds.keys():
+            clock._fpl_add_media(self._image_widget._dims_max_bounds[dim])
+        self._loop = clock.loop
+
+    def _play(self, dim: str):
+        """advance to the frame that is due according to the playback clock"""
+        clock = self._clocks[dim]
+        n_frames = self._image_widget._dims_max_bounds[dim]
+
+        index, latency = clock.get_frame(n_frames)
+
+        previous_index = self._image_widget.current_index[dim]
+        if index == previous_index:
+            return
+
+        self._image_widget.current_index = {dim: index}
+
+        self._stats[dim]._update(
+            previous_index, index, n_frames, latency, now=perf_counter()
+        )
 
     def set_index(self, dim: str, index: int):
         """set the current_index of the ImageWidget"""
@@ -40,7 +68,7 @@ class ImageWidgetSliders(EdgeWindow):
                 index = 0
             else:
                 # if looping not enabled, stop playing this dimension
-                self._playing[dim] = False
+                self._clocks[dim].pause()
                 return
 
         # set current_index
@@ -68,52 +96,53 @@ class ImageWidgetSliders(EdgeWindow):
         if imgui.is_item_hovered(0):
             imgui.set_tooltip("reset contrast limits using current frame")
 
-        # time now
-        now = perf_counter()
-
         # buttons and slider UI elements for each dim
         for dim in self._image_widget.slider_dims:
             imgui.push_id(f"{self._id_counter}_{dim}")
 
-            if self._playing[dim]:
+            clock = self._clocks[dim]
+
+            if clock.playing:
                 # show pause button if playing
                 if imgui.button(label=fa.ICON_FA_PAUSE):
-                    # if pause button clicked, then set playing to false
-                    self._playing[dim] = False
-
-                # if in play mode and enough time has elapsed w.r.t. the desired framerate, increment the index
-                if now - self._last_frame_time[dim] >= self._frame_time[dim]:
-                    self.set_index(dim, self._image_widget.current_index[dim] + 1)
-                    self._last_frame_time[dim] = now
+                    # if pause button clicked, stop the clock
+                    clock.pause()
+                else:
+                    # display the frame that is due, frames are skipped if rendering is slower than the clock
+                    self._play(dim)
 
             else:
                 # we are not playing, so display play button
                 if imgui.button(label=fa.ICON_FA_PLAY):
-                    # if play button is clicked, set last frame time to 0 so that index increments on next render
-                    self._last_frame_time[dim] = 0
-                    # set playing to True since play button was clicked
-                    self._playing[dim] = True
+                    # start the clock from the current frame
+                    self._stats[dim].reset()
+                    clock.play(self._image_widget.current_index[dim])
 
             imgui.same_line()
             # step back one frame button
-            if imgui.button(label=fa.ICON_FA_BACKWARD_STEP) and not self._playing[dim]:
+            if imgui.button(label=fa.ICON_FA_BACKWARD_STEP) and not clock.playing:
                 self.set_index(dim, self._image_widget.current_index[dim] - 1)
 
             imgui.same_line()
             # step forward one frame button
-            if imgui.button(label=fa.ICON_FA_FORWARD_STEP) and not self._playing[dim]:
+            if imgui.button(label=fa.ICON_FA_FORWARD_STEP) and not clock.playing:
                 self.set_index(dim, self._image_widget.current_index[dim] + 1)
 
             imgui.same_line()
             # stop button
             if imgui.button(label=fa.ICON_FA_STOP):
-                self._playing[dim] = False
-                self._last_frame_time[dim] = 0
+                clock.pause()
+                clock.seek(0)
                 self.set_index(dim, 0)
 
             imgui.same_line()
             # loop checkbox
-            _, self._loop = imgui.checkbox(label=fa.ICON_FA_ROTATE, v=self._loop)
+            loop_changed, self._loop = imgui.checkbox(
+                label=fa.ICON_FA_ROTATE, v=self._loop
+            )
+            if loop_changed:
+                for c in self._clocks.values():
+                    c.loop = self._loop
             if imgui.is_item_hovered(0):
                 imgui.set_tooltip("loop playback")
 
@@ -123,19 +152,21 @@ class ImageWidgetSliders(EdgeWindow):
             imgui.set_next_item_width(100)
             # framerate int entry
             fps_changed, value = imgui.input_int(
-                label="fps", v=self._fps[dim], step_fast=5
+                label="fps", v=round(clock.fps), step_fast=5
             )
             if imgui.is_item_hovered(0):
+                stats = self._stats[dim]
                 imgui.set_tooltip(
-                    "framerate is approximate and less reliable as it approaches your monitor refresh rate"
+                    f"achieved: {stats.fps:.1f} fps\n"
+                    f"dropped frames: {stats.frames_dropped}\n"
+                    f"latency: {stats.latency * 1000:.1f} ms"
                 )
             if fps_changed:
                 if value < 1:
                     value = 1
                 if value > 50:
                     value = 50
-                self._fps[dim] = value
-                self._frame_time[dim] = 1 / value
+                clock.fps = value
 
             val = self._image_widget.current_index[dim]
             vmax = self._image_widget._dims_max_bounds[dim] - 1
@@ -162,6 +193,10 @@ class ImageWidgetSliders(EdgeWindow):
             # if the slider value changed for this dimension
             flag_index_changed |= changed
 
+            if changed:
+                # continue playing from the new index
+                self._clocks[dim].seek(index)
+
             imgui.pop_id()
 
         if flag_index_changed:
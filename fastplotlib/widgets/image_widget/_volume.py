@@ -0,0 +1,185 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+import pygfx
+
+from ...graphics import ImageVolumeGraphic
+from ...graphics.features import GraphicFeatureEvent
+
+
+class _VolumeDoubleBuffer:
+    """
+    Double buffered textures for the volume of an ImageVolumeGraphic.
+
+    A new volume is written into the back buffer and uploaded in z slabs over several render cycles while the
+    front buffer is displayed, the buffers are swapped once the whole volume has been uploaded.
+    """
+
+    # max number of bytes written and uploaded per render cycle
+    upload_bytes: int = 32 * 1024**2
+
+    def __init__(self, graphic: ImageVolumeGraphic):
+        self._graphic = graphic
+
+        data = graphic.data
+        if data.brick_size is not None or data.empty_threshold is not None:
+            raise ValueError(
+                "bricked ImageVolumeGraphics are not supported for volume playback"
+            )
+
+        # back buffer, same chunks as the front buffer
+        self._back_value = np.zeros_like(data.value)
+        self._back_buffer = np.empty(data.buffer.shape, dtype=object)
+        for _, chunk_index, data_slice in data:
+            self._back_buffer[chunk_index] = pygfx.Texture(
+                self._back_value[data_slice], dim=3
+            )
+
+        # volume that is being uploaded into the back buffer
+        self._frame: np.ndarray | None = None
+
+        # latest volume requested while another one is being uploaded, uploaded next
+        self._next_frame: np.ndarray | None = None
+
+        # next z plane of the volume that is uploaded
+        self._z: int = 0
+
+    @property
+    def uploading(self) -> bool:
+        """``True`` if a volume is being uploaded into the back buffer"""
+        return self._frame is not None
+
+    def set_frame(self, frame: np.ndarray):
+        """
+        upload a new volume, if a volume is already being uploaded it is finished first so that
+        fast playback still swaps in new volumes, volumes that were requested in between are skipped
+        """
+        if frame.shape != self._back_value.shape:
+            raise ValueError(
+                f"volume shape {frame.shape} does not match the shape of the displayed volume "
+                f"{self._back_value.shape}"
+            )
+
+        if self._frame is not None:
+            self._next_frame = frame
+            return
+
+        self._frame = frame
+        self._z = 0
+
+    def step(self):
+        """write and upload the next z slab of the back buffer, swap the buffers once the volume is complete"""
+        if self._frame is None:
+            return
+
+        n_planes = self._frame.shape[0]
+        plane_bytes = self._back_value[0].nbytes
+        z_stop = min(n_planes, self._z + max(1, self.upload_bytes // plane_bytes))
+
+        # converted once, straight into the buffer that is uploaded
+        np.copyto(
+            self._back_value[self._z : z_stop],
+            self._frame[self._z : z_stop],
+            casting="unsafe",
+        )
+
+        # upload the slab of each texture chunk that intersects it
+        for _, chunk_index, data_slice in self._graphic.data:
+            chunk_z = data_slice[0]
+            start = max(self._z, chunk_z.start)
+            stop = min(z_stop, chunk_z.stop)
+            if start >= stop:
+                continue
+
+            texture = self._back_buffer[chunk_index]
+            texture.update_range(
+                (0, 0, start - chunk_z.start),
+                (texture.size[0], texture.size[1], stop - start),
+            )
+
+        self._z = z_stop
+
+        if self._z == n_planes:
+            self._swap()
+
+    def _swap(self):
+        data = self._graphic.data
+
+        data._value, self._back_value = self._back_value, data._value
+        data._buffer, self._back_buffer = self._back_buffer, data._buffer
+
+        # display the new textures
+        for texture, chunk_index, _ in data:
+            self._graphic._tiles[chunk_index].geometry.grid = texture
+
+        self._frame, self._next_frame = self._next_frame, None
+        self._z = 0
+
+        event = GraphicFeatureEvent(
+            "data", info={"key": slice(None), "value": data.value}
+        )
+        data._call_event_handlers(event)
+
+
+class _FramePrefetcher:
+    """Computes the frames of the next timepoints in a background thread"""
+
+    def __init__(
+        self,
+        get_frame: Callable[[int, dict[str, int]], np.ndarray],
+        n_frames: Callable[[], int],
+        n_ahead: int = 2,
+    ):
+        self._get_frame = get_frame
+        self._n_frames = n_frames
+        self.n_ahead = n_ahead
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="fpl-volume-prefetch"
+        )
+
+        # {(data_ix, t): future}
+        self._futures: dict[tuple[int, int], Future] = dict()
+
+    def get(self, data_ix: int, index: dict[str, int]) -> np.ndarray:
+        """get the frame for this index, prefetched if possible, and start prefetching the next timepoints"""
+        t = index.get("t", 0)
+
+        future = self._futures.pop((data_ix, t), None)
+        if future is not None and not future.cancelled():
+            frame = future.result()
+        else:
+            frame = self._get_frame(data_ix, index)
+
+        if "t" not in index:
+            return frame
+
+        # timepoints ahead, wrap around for looped playback
+        n_frames = self._n_frames()
+        ahead = {(t + i) % n_frames for i in range(1, self.n_ahead + 1)}
+
+        # cancel prefetches that are no longer ahead
+        for key in list(self._futures.keys()):
+            if key[0] == data_ix and key[1] not in ahead:
+                self._futures.pop(key).cancel()
+
+        for t_next in sorted(ahead, key=lambda i: (i - t) % n_frames):
+            key = (data_ix, t_next)
+            if key not in self._futures:
+                self._futures[key] = self._executor.submit(
+                    self._get_frame, data_ix, {**index, "t": t_next}
+                )
+
+        return frame
+
+    def clear(self):
+        """discard all prefetched frames, they are stale if the data or the processing functions change"""
+        for future in self._futures.values():
+            future.cancel()
+
+        self._futures.clear()
+
+    def shutdown(self):
+        self.clear()
+        self._executor.shutdown(wait=False)
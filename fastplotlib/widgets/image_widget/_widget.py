@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Callable
 from warnings import warn
@@ -7,11 +8,12 @@ import numpy as np
 from rendercanvas import BaseRenderCanvas
 
 from ...layouts import ImguiFigure as Figure
-from ...graphics import ImageGraphic
+from ...graphics import ImageGraphic, ImageVolumeGraphic
 from ...utils import calculate_figure_shape, quick_min_max
 from ...tools import HistogramLUTTool
 from ._sliders import ImageWidgetSliders
-
+from ._playback import PlaybackClock, PlaybackStats
+from ._volume import _VolumeDoubleBuffer, _FramePrefetcher
 
 # Number of dimensions that represent one image/one frame
 # For grayscale shape will be [n_rows, n_cols], i.e. 2 dims
@@ -21,6 +23,9 @@ IMAGE_DIM_COUNTS = {"gray": 2, "rgb": 3}
 # Map boolean (indicating whether we use RGB or grayscale) to the string. Used to index RGB_DIM_MAP
 RGB_BOOL_MAP = {False: "gray", True: "rgb"}
 
+# Number of dimensions that represent one volume, [n_planes, n_rows, n_cols]
+VOLUME_DIM_COUNT = 3
+
 # Dimensions that can be scrolled from a given data array
 SCROLLABLE_DIMS_ORDER = {
     0: "",
@@ -111,7 +116,7 @@ class ImageWidget:
         return self._figure
 
     @property
-    def managed_graphics(self) -> list[ImageGraphic]:
+    def managed_graphics(self) -> list[ImageGraphic | ImageVolumeGraphic]:
         """List of ``ImageWidget`` managed graphics."""
         iw_managed = list()
         for subplot in self.figure:
@@ -221,10 +226,27 @@ class ImageWidget:
 
             self._current_index.update(index)
 
-            for i, (ig, data) in enumerate(zip(self.managed_graphics, self.data)):
-                frame = self._process_indices(data, self._current_index)
-                frame = self._process_frame_apply(frame, i)
-                ig.data = frame
+            if self._volume:
+                # volumes of the next timepoints are prefetched, new volumes are uploaded over the next render cycles
+                for data_ix, buffer in enumerate(self._volume_buffers):
+                    buffer.set_frame(
+                        self._prefetcher.get(data_ix, dict(self._current_index))
+                    )
+
+            else:
+                if self._frame_apply_executor is not None and len(self.data) > 1:
+                    # process the frames of all subplots in parallel
+                    frames = list(
+                        self._frame_apply_executor.map(
+                            self._get_frame, range(len(self.data))
+                        )
+                    )
+                else:
+                    frames = [self._get_frame(i) for i in range(len(self.data))]
+
+                # all frames are ready, swap them in together so that the subplots are always in sync
+                for ig, frame in zip(self.managed_graphics, frames):
+                    ig.data = frame
 
             # call any event handlers
             for handler in self._current_index_changed_handlers:
@@ -236,6 +258,41 @@ class ImageWidget:
             # set_value has finished executing, now allow future executions
             self._reentrant_block = False
 
+    @property
+    def playback_clocks(self) -> dict[str, PlaybackClock]:
+        """
+        clocks used to play each slider dimension, use ``playback_clocks["t"].play()`` or ``.pause()``
+        to control playback
+        """
+        return {
+            dim: self._image_widget_sliders._clocks[dim] for dim in self.slider_dims
+        }
+
+    @property
+    def playback_stats(self) -> dict[str, PlaybackStats]:
+        """achieved framerate, dropped frames and frame latency of the playback of each slider dimension"""
+        return {dim: self._image_widget_sliders._stats[dim] for dim in self.slider_dims}
+
+    def set_playback_clock(self, clock: PlaybackClock, dim: str = "t"):
+        """
+        Set the clock used to play a slider dimension. Share a clock between ImageWidgets to play them in sync.
+
+        Parameters
+        ----------
+        clock: PlaybackClock
+            the clock, for example the clock of another ImageWidget: ``iw2.set_playback_clock(iw1.playback_clocks["t"])``
+
+        dim: str, default "t"
+            slider dimension
+
+        """
+        if dim not in self.slider_dims:
+            raise KeyError(
+                f"dimension '{dim}' is not a slider dimension, the slider dimensions are: {self.slider_dims}"
+            )
+
+        self._image_widget_sliders.set_clock(dim, clock)
+
     @property
     def n_img_dims(self) -> list[int]:
         """
@@ -264,7 +321,11 @@ class ImageWidget:
             Number of scrollable dimensions for each ``array`` in the dataset.
         """
 
-        n_img_dims = IMAGE_DIM_COUNTS[RGB_BOOL_MAP[rgb]]
+        if self._volume:
+            n_img_dims = VOLUME_DIM_COUNT
+        else:
+            n_img_dims = IMAGE_DIM_COUNTS[RGB_BOOL_MAP[rgb]]
+
         # Make sure each image stack at least ``n_img_dims`` dimensions
         if len(curr_arr.shape) < n_img_dims:
             raise ValueError(
@@ -273,7 +334,7 @@ class ImageWidget:
             )
 
         # If RGB(A), last dim must be 3 or 4
-        if n_img_dims == 3:
+        if rgb:
             if not (curr_arr.shape[-1] == 3 or curr_arr.shape[-1] == 4):
                 raise ValueError(
                     f"Expected size 3 or 4 for last dimension of RGB(A) array, got: {curr_arr.shape[-1]}."
@@ -284,6 +345,12 @@ class ImageWidget:
         if n_scrollable_dims not in SCROLLABLE_DIMS_ORDER.keys():
             raise ValueError(f"Array had shape {curr_arr.shape} which is not supported")
 
+        if self._volume and n_scrollable_dims > 1:
+            raise ValueError(
+                f"Array had shape {curr_arr.shape}, volume data must be of shape [t, n_planes, n_rows, n_cols] "
+                f"or [n_planes, n_rows, n_cols]"
+            )
+
         return n_scrollable_dims
 
     def __init__(
@@ -298,6 +365,8 @@ class ImageWidget:
         rgb: bool | list[bool] = None,
         cmap: str = "plasma",
         graphic_kwargs: dict = None,
+        frame_apply_workers: int = None,
+        volume: bool = False,
     ):
         """
         This widget facilitates high-level navigation through image stacks, which are arrays containing one or more
@@ -315,6 +384,9 @@ class ImageWidget:
         4       "tzxy(c)"
         ======= ==========
 
+        If ``volume`` is ``True`` each image stack is a volume or a volume time-series, "zxy" or "tzxy", displayed
+        with an ImageVolumeGraphic.
+
         Parameters
         ----------
         data: Union[np.ndarray, List[np.ndarray]
@@ -336,6 +408,7 @@ class ImageWidget:
             | "array_index" is the position of the corresponding array in the data list.
             | if `window_funcs` is used, then this function is applied after `window_funcs`
             | this function must be a callable that returns a 2D array
+            | the returned array is copied into the texture buffers, it can be a preallocated array that is reused
             | example use case: converting an RGB frame from video to a 2D grayscale frame
 
         figure_shape: Optional[Tuple[int, int]]
@@ -355,11 +428,30 @@ class ImageWidget:
             data arrays are grayscale or RGB(A).
 
         graphic_kwargs: Any
-            passed to each ImageGraphic in the ImageWidget figure subplots
+            passed to each ImageGraphic, or ImageVolumeGraphic if ``volume`` is ``True``, in the ImageWidget
+            figure subplots
+
+        frame_apply_workers: int, optional
+            | number of threads used to get the frames of all subplots in parallel, i.e. slice the data arrays and
+            | run the `window_funcs` and `frame_apply` functions. Useful with many subplots and expensive functions
+            | that release the GIL, such as most numpy, scipy and opencv functions. The displayed frames of all
+            | subplots are updated together once all of them are ready. By default frames are processed serially.
+
+        volume: bool, default False
+            | display volumes with an ImageVolumeGraphic, the "t" slider plays through the timepoints of the volumes.
+            | The volumes of the next timepoints are computed in a background thread while the current one is
+            | displayed. New volumes are written into a second set of textures and uploaded in chunks over several
+            | render cycles, the displayed textures are swapped once the whole volume has been uploaded.
 
         """
         self._initialized = False
 
+        self._volume = volume
+
+        # double buffered volume textures and volume prefetching, only used for volumes
+        self._volume_buffers: list[_VolumeDoubleBuffer] = list()
+        self._prefetcher: _FramePrefetcher | None = None
+
         if figure_kwargs is None:
             figure_kwargs = dict()
 
@@ -403,12 +495,18 @@ class ImageWidget:
                         f"len(rgb) != len(data), {len(rgb)} != {len(self.data)}. These must be equal"
                     )
 
+                if self._volume and any(rgb):
+                    raise ValueError("RGB(A) data is not supported for volumes")
+
                 self._rgb = rgb
 
-                self._n_img_dims = [
-                    IMAGE_DIM_COUNTS[RGB_BOOL_MAP[self._rgb[i]]]
-                    for i in range(len(self.data))
-                ]
+                if self._volume:
+                    self._n_img_dims = [VOLUME_DIM_COUNT] * len(self.data)
+                else:
+                    self._n_img_dims = [
+                        IMAGE_DIM_COUNTS[RGB_BOOL_MAP[self._rgb[i]]]
+                        for i in range(len(self.data))
+                    ]
 
                 self._n_scrollable_dims = [
                     self._get_n_scrollable_dims(self.data[i], self._rgb[i])
@@ -416,14 +514,16 @@ class ImageWidget:
                 ]
 
                 # Define ndim of ImageWidget instance as largest number of scrollable dims + 2 (grayscale dimensions)
-                self._ndim = (
-                    max(
-                        [
-                            self.n_scrollable_dims[i]
-                            for i in range(len(self.n_scrollable_dims))
-                        ]
-                    )
-                    + IMAGE_DIM_COUNTS[RGB_BOOL_MAP[False]]
+                # or + 3 for volumes
+                self._ndim = max(
+                    [
+                        self.n_scrollable_dims[i]
+                        for i in range(len(self.n_scrollable_dims))
+                    ]
+                ) + (
+                    VOLUME_DIM_COUNT
+                    if self._volume
+                    else IMAGE_DIM_COUNTS[RGB_BOOL_MAP[False]]
                 )
 
                 if names is not None:
@@ -459,6 +559,13 @@ class ImageWidget:
             if dim in ALLOWED_SLIDER_DIMS.keys():
                 self.slider_dims.append(ALLOWED_SLIDER_DIMS[dim])
 
+        if frame_apply_workers is not None and frame_apply_workers > 0:
+            self._frame_apply_executor = ThreadPoolExecutor(
+                max_workers=frame_apply_workers, thread_name_prefix="fpl-frame-apply"
+            )
+        else:
+            self._frame_apply_executor = None
+
         self._frame_apply: dict[int, callable] = dict()
 
         if frame_apply is not None:
@@ -508,6 +615,9 @@ class ImageWidget:
 
         figure_kwargs_default = {"controller_ids": "sync", "names": names}
 
+        if self._volume:
+            figure_kwargs_default.update({"cameras": "3d", "controller_types": "orbit"})
+
         # update the default kwargs with any user-specified kwargs
         # user specified kwargs will overwrite the defaults
         figure_kwargs_default.update(figure_kwargs)
@@ -516,6 +626,13 @@ class ImageWidget:
         if graphic_kwargs is None:
             graphic_kwargs = dict()
 
+        if self._volume:
+            for kwarg in ["brick_size", "empty_threshold"]:
+                if kwarg in graphic_kwargs.keys():
+                    raise ValueError(
+                        f"`{kwarg}` is not supported for volumes displayed in an ImageWidget"
+                    )
+
         graphic_kwargs.update({"cmap": cmap})
 
         vmin_specified, vmax_specified = None, None
@@ -552,7 +669,9 @@ class ImageWidget:
                 # both vmin and vmax are specified
                 vmin, vmax = vmin_specified, vmax_specified
 
-            ig = ImageGraphic(
+            graphic_cls = ImageVolumeGraphic if self._volume else ImageGraphic
+
+            ig = graphic_cls(
                 frame,
                 name="image_widget_managed",
                 vmin=vmin,
@@ -587,6 +706,15 @@ class ImageWidget:
 
         self.figure.add_gui(self._image_widget_sliders)
 
+        if self._volume:
+            self._volume_buffers = [
+                _VolumeDoubleBuffer(ig) for ig in self.managed_graphics
+            ]
+            self._prefetcher = _FramePrefetcher(
+                self._get_frame, lambda: self._dims_max_bounds["t"]
+            )
+            self.figure.add_animations(self._upload_volumes)
+
         self._current_index_changed_handlers = set()
 
         self._reentrant_block = False
@@ -603,6 +731,11 @@ class ImageWidget:
             frame_apply = dict()
 
         self._frame_apply = frame_apply
+
+        if self._prefetcher is not None:
+            # prefetched volumes used the previous functions
+            self._prefetcher.clear()
+
         # force update image graphic
         self.current_index = self.current_index
 
@@ -622,6 +755,10 @@ class ImageWidget:
     def window_funcs(self, callable_dict: dict[str, int]):
         if callable_dict is None:
             self._window_funcs = None
+
+            if self._prefetcher is not None:
+                self._prefetcher.clear()
+
             # force frame to update
             self.current_index = self.current_index
             return
@@ -669,6 +806,10 @@ class ImageWidget:
                 f"You have passed a {type(callable_dict)}. See the docstring."
             )
 
+        if self._prefetcher is not None:
+            # prefetched volumes used the previous functions
+            self._prefetcher.clear()
+
         # force frame to update
         self.current_index = self.current_index
 
@@ -782,6 +923,19 @@ class ImageWidget:
             )
             return indices_dim
 
+    def _get_frame(self, data_ix: int, index: dict[str, int] = None) -> np.ndarray:
+        """get the frame to display for the data array at `data_ix`, using the current index by default"""
+        if index is None:
+            index = self._current_index
+
+        frame = self._process_indices(self.data[data_ix], index)
+        return self._process_frame_apply(frame, data_ix)
+
+    def _upload_volumes(self):
+        """upload the next chunk of each new volume, called on every render cycle"""
+        for buffer in self._volume_buffers:
+            buffer.step()
+
     def _process_frame_apply(self, array, data_ix) -> np.ndarray:
         if callable(self._frame_apply):
             return self._frame_apply(array)
@@ -925,6 +1079,10 @@ class ImageWidget:
                     f"existing data arrays"
                 )
 
+        if self._prefetcher is not None:
+            # prefetched volumes are from the previous data
+            self._prefetcher.clear()
+
         # if checks pass, update with new data
         for i, (new_array, current_array, subplot) in enumerate(
             zip(new_data, self._data, self.figure)
@@ -945,7 +1103,13 @@ class ImageWidget:
                 frame = self._process_frame_apply(frame, i)
 
                 # make new graphic first
-                new_graphic = ImageGraphic(data=frame, name="image_widget_managed")
+                if self._volume:
+                    new_graphic = ImageVolumeGraphic(
+                        data=frame, name="image_widget_managed"
+                    )
+                    self._volume_buffers[i] = _VolumeDoubleBuffer(new_graphic)
+                else:
+                    new_graphic = ImageGraphic(data=frame, name="image_widget_managed")
 
                 if self._histogram_widget:
                     # set hlut tool to use new graphic
@@ -1000,4 +1164,10 @@ class ImageWidget:
 
     def close(self):
         """Close Widget"""
+        if self._frame_apply_executor is not None:
+            self._frame_apply_executor.shutdown(wait=False)
+
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+
         self.figure.close()
@@ -0,0 +1,92 @@
+"""
+Benchmark the time taken by ``import fastplotlib``, each import is done in a fresh interpreter.
+
+Usage:
+    python scripts/benchmark_import_time.py [--repeats 10] [--statement "import fastplotlib"] [--top 15]
+
+``--top`` prints the slowest modules reported by ``python -X importtime`` for the last run.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+
+def time_statement(statement: str, env: dict) -> float:
+    """time the statement in a new interpreter, returns the time in seconds"""
+    code = (
+        "import time\n"
+        "t0 = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - t0)\n"
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_modules(statement: str, env: dict, top: int) -> list[tuple[int, str]]:
+    """parse ``-X importtime`` output, returns a list of (cumulative time in us, module name)"""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = list()
+    for line in out.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match is None:
+            continue
+
+        cumulative, indent, name = match.groups()
+        # only top level imports and first level nested imports
+        if len(indent) <= 3:
+            times.append((int(cumulative), name))
+
+    return sorted(times, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--statement", type=str, default="import fastplotlib")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # do not create a window or GUI event loop if the statement creates a canvas
+    env.setdefault("RENDERCANVAS_FORCE_OFFSCREEN", "1")
+
+    # warm up the filesystem and bytecode caches
+    time_statement(args.statement, env)
+
+    times = [time_statement(args.statement, env) for i in range(args.repeats)]
+
+    print(f"{args.statement!r}, {args.repeats} runs")
+    print(
+        f"median: {statistics.median(times) * 1000:.1f} ms, "
+        f"min: {min(times) * 1000:.1f} ms, "
+        f"max: {max(times) * 1000:.1f} ms"
+    )
+
+    if args.top > 0:
+        print(f"\nslowest imports (cumulative):")
+        for cumulative, name in slowest_modules(args.statement, env, args.top):
+            print(f"{cumulative / 1000:>10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
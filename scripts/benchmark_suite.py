@@ -0,0 +1,501 @@
+"""
+Benchmarks of the hot paths of fastplotlib, run on the offscreen canvas.
+
+Usage:
+    python scripts/benchmark_suite.py [--filter "selector*"] [--repeats 7] [--output results.json]
+    python scripts/benchmark_suite.py --compare baseline.json [--threshold 0.15]
+    python scripts/benchmark_suite.py --list
+
+Results are written as json with the time per call of each benchmark and the versions and adapter used.
+``--compare`` runs the benchmarks and compares the median times against a previous results file, the exit
+code is 1 if any benchmark is slower than the baseline by more than ``--threshold``.
+
+A software (CPU) adapter such as lavapipe is used if available so that results are comparable across
+machines, use ``--hardware`` to use the default adapter.
+"""
+
+import argparse
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from itertools import cycle
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable
+
+# must be set before a canvas is created
+os.environ.setdefault("RENDERCANVAS_FORCE_OFFSCREEN", "1")
+
+import numpy as np
+
+# name -> setup function, the setup function returns the function that is timed
+BENCHMARKS: dict[str, Callable[[], Callable[[], None]]] = dict()
+
+
+def benchmark(setup: Callable[[], Callable[[], None]]):
+    """register a benchmark, the decorated function does the setup and returns the function to time"""
+    BENCHMARKS[setup.__name__] = setup
+    return setup
+
+
+rng = np.random.default_rng(0)
+
+
+def make_line(n: int = 100_000) -> np.ndarray:
+    xs = np.linspace(0, 100, n, dtype=np.float32)
+    return np.column_stack([xs, np.sin(xs)])
+
+
+def make_figure(**kwargs):
+    # without imgui, so that the ui is not part of the timings
+    from fastplotlib.layouts import Figure
+
+    return Figure(size=(700, 560), **kwargs)
+
+
+# ===== graphic features
+
+
+@benchmark
+def vertex_positions_set_full_100k():
+    fig = make_figure()
+    graphic = fig[0, 0].add_scatter(rng.random((100_000, 3), dtype=np.float32))
+    new = cycle([rng.random((100_000, 3), dtype=np.float32) for i in range(2)])
+
+    def run():
+        graphic.data = next(new)
+
+    return run
+
+
+@benchmark
+def vertex_positions_set_slice_100k():
+    fig = make_figure()
+    graphic = fig[0, 0].add_scatter(rng.random((100_000, 3), dtype=np.float32))
+    new = rng.random((1_000, 3), dtype=np.float32)
+
+    def run():
+        graphic.data[50_000:51_000] = new
+
+    return run
+
+
+@benchmark
+def vertex_colors_set_full_100k():
+    fig = make_figure()
+    graphic = fig[0, 0].add_scatter(rng.random((100_000, 3), dtype=np.float32))
+    new = cycle([rng.random((100_000, 4), dtype=np.float32) for i in range(2)])
+
+    def run():
+        graphic.colors = next(new)
+
+    return run
+
+
+@benchmark
+def vertex_colors_set_slice_str_100k():
+    fig = make_figure()
+    graphic = fig[0, 0].add_scatter(rng.random((100_000, 3), dtype=np.float32))
+    colors = cycle(["r", "b"])
+
+    def run():
+        graphic.colors[::10] = next(colors)
+
+    return run
+
+
+@benchmark
+def texture_array_create_4096():
+    from fastplotlib.graphics.features import TextureArray
+
+    data = rng.random((4096, 4096), dtype=np.float32)
+
+    def run():
+        TextureArray(data)
+
+    return run
+
+
+@benchmark
+def texture_array_set_full_4096():
+    fig = make_figure()
+    graphic = fig[0, 0].add_image(rng.random((4096, 4096), dtype=np.float32))
+    new = cycle([rng.random((4096, 4096), dtype=np.float32) for i in range(2)])
+
+    def run():
+        graphic.data = next(new)
+
+    return run
+
+
+@benchmark
+def texture_array_set_slice_4096():
+    fig = make_figure()
+    graphic = fig[0, 0].add_image(rng.random((4096, 4096), dtype=np.float32))
+    new = rng.random((256, 256), dtype=np.float32)
+
+    def run():
+        graphic.data[1000:1256, 3000:3256] = new
+
+    return run
+
+
+# ===== collections
+
+
+def _line_collection(n_lines: int):
+    import fastplotlib as fpl
+
+    xs = np.linspace(0, 10, 100, dtype=np.float32)
+    data = [np.column_stack([xs, np.sin(xs + i)]) for i in range(n_lines)]
+
+    def run():
+        fpl.LineCollection(data, cmap="viridis")
+
+    return run
+
+
+@benchmark
+def line_collection_create_1k():
+    return _line_collection(1_000)
+
+
+@benchmark
+def line_collection_create_10k():
+    return _line_collection(10_000)
+
+
+# ===== selectors
+
+
+@benchmark
+def linear_selector_get_selected_index_line_100k():
+    fig = make_figure()
+    line = fig[0, 0].add_line(make_line())
+    selector = line.add_linear_selector(selection=40)
+
+    return selector.get_selected_index
+
+
+@benchmark
+def linear_region_selector_get_selected_indices_line_100k():
+    fig = make_figure()
+    line = fig[0, 0].add_line(make_line())
+    selector = line.add_linear_region_selector(selection=(20, 60))
+
+    return selector.get_selected_indices
+
+
+@benchmark
+def rectangle_selector_get_selected_indices_line_100k():
+    fig = make_figure()
+    line = fig[0, 0].add_line(make_line())
+    # the rectangle selection is stored as ints, (0, 1) in y selects the positive half of the sine
+    selector = line.add_rectangle_selector(selection=(20, 60, 0, 1))
+    assert len(selector.get_selected_indices()) > 0
+
+    return selector.get_selected_indices
+
+
+@benchmark
+def polygon_selector_get_selected_indices_line_100k():
+    fig = make_figure()
+    line = fig[0, 0].add_line(make_line())
+    selector = line.add_polygon_selector(
+        selection=[(20, -0.5, 0), (60, -0.8, 0), (70, 0.5, 0), (30, 0.9, 0)]
+    )
+    assert len(selector.get_selected_indices()) > 0
+
+    return selector.get_selected_indices
+
+
+@benchmark
+def rectangle_selector_get_selected_indices_image_2048():
+    fig = make_figure()
+    image = fig[0, 0].add_image(rng.random((2048, 2048), dtype=np.float32))
+    selector = image.add_rectangle_selector(selection=(100, 900, 200, 1200))
+
+    return selector.get_selected_indices
+
+
+@benchmark
+def linear_region_selector_get_selected_indices_collection_1k():
+    fig = make_figure()
+    xs = np.linspace(0, 100, 1_000, dtype=np.float32)
+    collection = fig[0, 0].add_line_collection(
+        [np.column_stack([xs, np.sin(xs + i)]) for i in range(1_000)]
+    )
+    selector = collection.add_linear_region_selector(selection=(20, 60))
+
+    return selector.get_selected_indices
+
+
+# ===== colors
+
+
+@benchmark
+def parse_colors_str_list_10k():
+    from fastplotlib.graphics.features.utils import parse_colors
+
+    colors = list(rng.choice(["r", "g", "b", "cyan", "#ff00ff"], size=10_000))
+
+    def run():
+        parse_colors(colors, 10_000)
+
+    return run
+
+
+@benchmark
+def parse_colors_rgba_array_1m():
+    from fastplotlib.graphics.features.utils import parse_colors
+
+    colors = rng.random((1_000_000, 4), dtype=np.float32)
+
+    def run():
+        parse_colors(colors, 1_000_000)
+
+    return run
+
+
+@benchmark
+def parse_cmap_values_100k():
+    from fastplotlib.utils.functions import parse_cmap_values
+
+    transform = rng.random(100_000)
+
+    def run():
+        parse_cmap_values(100_000, "viridis", transform)
+
+    return run
+
+
+# ===== widgets and tools
+
+
+@benchmark
+def image_widget_step_index_512():
+    import fastplotlib as fpl
+
+    data = rng.random((100, 512, 512), dtype=np.float32)
+    iw = fpl.ImageWidget(data, histogram_widget=False)
+
+    indices = cycle(range(100))
+
+    def run():
+        iw.current_index = {"t": next(indices)}
+
+    return run
+
+
+@benchmark
+def histogram_lut_set_data_2048():
+    import fastplotlib as fpl
+
+    fig = make_figure()
+    image = fig[0, 0].add_image(rng.random((2048, 2048), dtype=np.float32))
+    hlut = fpl.HistogramLUTTool(data=image.data.value, images=image)
+    fig[0, 0].docks["right"].add_graphic(hlut)
+
+    new = cycle([rng.normal(size=(2048, 2048)).astype(np.float32) for i in range(2)])
+
+    def run():
+        hlut.set_data(next(new))
+
+    return run
+
+
+@benchmark
+def figure_draw_export_numpy_scatter_100k():
+    fig = make_figure()
+    fig[0, 0].add_scatter(rng.random((100_000, 3), dtype=np.float32))
+    fig.show()
+
+    def run():
+        # the snapshot is read from the last rendered frame
+        fig.canvas.draw()
+        fig.export_numpy()
+
+    return run
+
+
+# ===== runner
+
+
+def time_benchmark(
+    func: Callable[[], None], repeats: int, min_time: float, max_time: float
+) -> dict[str, float | int]:
+    """
+    time ``func``, each repeat calls it ``number`` times so that a repeat takes at least ``min_time``,
+    slow benchmarks are repeated fewer times so that they take about ``max_time``, with at least 3 repeats
+    """
+    # warm up, also used to calibrate the number of calls per repeat
+    t0 = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - t0
+
+    number = max(1, int(min_time / max(elapsed, 1e-9)))
+    repeats = max(min(3, repeats), min(repeats, int(max_time / (number * elapsed))))
+
+    times = list()
+    for i in range(repeats):
+        t0 = time.perf_counter()
+        for j in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeats": repeats,
+    }
+
+
+def select_software_adapter() -> str:
+    """select a CPU adapter if there is one, returns a description of the adapter that is used"""
+    import fastplotlib as fpl
+
+    adapters = fpl.enumerate_adapters()
+    cpu = [a for a in adapters if a.info["adapter_type"].lower() == "cpu"]
+
+    if len(cpu) > 0:
+        fpl.select_adapter(cpu[0])
+        adapter = cpu[0]
+    elif len(adapters) > 0:
+        print("no software adapter found, using the default adapter", file=sys.stderr)
+        return ""
+    else:
+        return "none"
+
+    return f"{adapter.info['device']} ({adapter.info['backend_type']})"
+
+
+def get_metadata(adapter: str) -> dict:
+    import pygfx
+    import wgpu
+    import fastplotlib as fpl
+
+    if adapter == "":
+        adapter_info = pygfx.renderers.wgpu.get_shared().adapter.info
+        adapter = f"{adapter_info['device']} ({adapter_info['backend_type']})"
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fastplotlib": fpl.__version__,
+        "pygfx": pygfx.__version__,
+        "wgpu": wgpu.__version__,
+        "numpy": np.__version__,
+        "adapter": adapter,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """print a comparison table of the median times, returns the names of the regressed benchmarks"""
+    regressed = list()
+
+    print(f"\n{'benchmark':<58} {'baseline':>11} {'current':>11} {'ratio':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<58} {'-':>11} {result['median'] * 1000:>9.3f}ms {'new':>7}")
+            continue
+
+        before = baseline[name]["median"]
+        ratio = result["median"] / before
+
+        if ratio > 1 + threshold:
+            status = "  slower"
+            regressed.append(name)
+        elif ratio < 1 / (1 + threshold):
+            status = "  faster"
+        else:
+            status = ""
+
+        print(
+            f"{name:<58} {before * 1000:>9.3f}ms {result['median'] * 1000:>9.3f}ms {ratio:>7.2f}{status}"
+        )
+
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--filter", type=str, default="*", help="glob pattern of benchmark names"
+    )
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum time in seconds of each repeat",
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=20,
+        help="approximate maximum time in seconds of each benchmark, slow benchmarks are repeated fewer times",
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="write the results to this json file"
+    )
+    parser.add_argument(
+        "--compare", type=str, default=None, help="baseline results json file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative slowdown of the median time that is a regression",
+    )
+    parser.add_argument(
+        "--hardware", action="store_true", help="use the default adapter"
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS.keys() if fnmatch(name, args.filter)]
+
+    if args.list:
+        print("\n".join(names))
+        return
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    adapter = "" if args.hardware else select_software_adapter()
+
+    results = dict()
+    for name in names:
+        func = BENCHMARKS[name]()
+        results[name] = time_benchmark(func, args.repeats, args.min_time, args.max_time)
+        print(
+            f"{name:<58} {results[name]['median'] * 1000:>9.3f}ms "
+            f"± {results[name]['stdev'] * 1000:.3f}ms"
+        )
+
+    output = {"metadata": get_metadata(adapter), "results": results}
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+    if baseline is not None:
+        regressed = compare(results, baseline, args.threshold)
+        if len(regressed) > 0:
+            print(f"\n{len(regressed)} benchmark(s) slower than the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
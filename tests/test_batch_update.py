@@ -0,0 +1,151 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+
+
+def make_data(n: int = 100) -> np.ndarray:
+    xs = np.linspace(0, 10 * np.pi, n, dtype=np.float32)
+    return np.column_stack([xs, np.sin(xs)])
+
+
+class EventRecorder:
+    def __init__(self):
+        self.events = list()
+
+    def __call__(self, ev):
+        self.events.append(ev)
+
+    def types(self):
+        return [ev.type for ev in self.events]
+
+
+@pytest.mark.parametrize("graphic_type", [fpl.LineGraphic, fpl.ScatterGraphic])
+def test_batch_defers_events(graphic_type):
+    graphic = graphic_type(make_data())
+
+    recorder = EventRecorder()
+    graphic.add_event_handler(recorder, "data", "colors")
+
+    with graphic.batch_update():
+        graphic.data[10:20, 1] = 1.0
+        graphic.data[15:30, 1] = 2.0
+        graphic.colors[40:50] = "r"
+        graphic.colors = "b"
+
+        # nothing is dispatched inside the context
+        assert len(recorder.events) == 0
+
+    # one event per feature
+    assert sorted(recorder.types()) == ["colors", "data"]
+
+    data_ev = [ev for ev in recorder.events if ev.type == "data"][0]
+    # overlapping ranges are merged into one key
+    assert data_ev.info["key"] == slice(10, 30)
+    npt.assert_almost_equal(data_ev.info["value"], graphic.data[10:30])
+
+    colors_ev = [ev for ev in recorder.events if ev.type == "colors"][0]
+    assert colors_ev.info["key"] == slice(0, 100)
+    npt.assert_almost_equal(colors_ev.info["value"][:, 2], 1.0)
+
+
+def test_batch_single_event_unchanged():
+    graphic = fpl.LineGraphic(make_data())
+
+    recorder = EventRecorder()
+    graphic.add_event_handler(recorder, "data")
+
+    with graphic.batch_update():
+        graphic.data[3:8, 1] = 5.0
+
+    # a single update emits the original event
+    assert len(recorder.events) == 1
+    assert recorder.events[0].info["key"] == (slice(3, 8), 1)
+
+
+def test_batch_defers_uploads():
+    graphic = fpl.LineGraphic(make_data(1000))
+    buffer = graphic.data.buffer
+
+    # clear any pending chunks from creation
+    buffer._gfx_get_chunk_descriptions()
+    rev = buffer._rev
+
+    with graphic.batch_update():
+        graphic.data[100:200, 1] = 1.0
+        graphic.data[150:300, 1] = 1.0
+        graphic.data[[600, 610]] = 0.0
+        assert buffer._rev == rev
+
+    assert buffer._rev != rev
+
+    chunks = buffer._gfx_get_chunk_descriptions()
+    assert len(chunks) == 2
+    assert chunks[0][0] <= 100
+    assert chunks[0][0] + chunks[0][1] >= 300
+    assert chunks[1][0] <= 600
+    assert chunks[1][0] + chunks[1][1] >= 611
+
+
+def test_batch_nested_and_multiple_graphics():
+    line = fpl.LineGraphic(make_data())
+    scatter = fpl.ScatterGraphic(make_data())
+
+    recorder = EventRecorder()
+    line.add_event_handler(recorder, "data")
+    scatter.add_event_handler(recorder, "data", "sizes")
+
+    with fpl.batch_update(line, scatter):
+        with line.batch_update():
+            line.data[0, 1] = 1.0
+            line.data[1, 1] = 1.0
+
+        # inner context exits but outer batch is still active
+        assert len(recorder.events) == 0
+
+        scatter.data[5, 1] = 1.0
+        scatter.sizes[:] = 10
+
+    assert sorted(recorder.types()) == ["data", "data", "sizes"]
+
+
+def test_batch_update_exception():
+    graphic = fpl.LineGraphic(make_data())
+
+    recorder = EventRecorder()
+    graphic.add_event_handler(recorder, "data")
+
+    with pytest.raises(ValueError):
+        with graphic.batch_update():
+            graphic.data[0, 1] = 1.0
+            raise ValueError
+
+    # batch is closed and pending event is flushed
+    assert len(recorder.events) == 1
+    assert graphic.data._batch_depth == 0
+
+    graphic.data[1, 1] = 1.0
+    assert len(recorder.events) == 2
+
+
+def test_batch_collection():
+    data = np.stack([make_data(20) for i in range(5)])
+    lc = fpl.LineCollection(data)
+
+    recorder = EventRecorder()
+    lc.add_event_handler(recorder, "data")
+
+    with lc.batch_update():
+        lc[:].data[:, 1] = 1.0
+        lc[0].data[:, 1] = 2.0
+
+        assert len(recorder.events) == 0
+
+    assert recorder.types() == ["data"] * 5
+
+
+def test_batch_update_type_error():
+    with pytest.raises(TypeError):
+        with fpl.batch_update(make_data()):
+            pass
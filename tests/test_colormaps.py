@@ -0,0 +1,111 @@
+import cmap
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+from fastplotlib.utils import functions
+from fastplotlib.utils import get_cmap, get_cmap_texture, make_colors
+
+
+def test_get_cmap_copy():
+    a = get_cmap("viridis")
+    b = get_cmap("viridis")
+
+    npt.assert_almost_equal(a, b)
+    npt.assert_almost_equal(a, make_colors(256, "viridis"))
+
+    # get_cmap returns copies, the cached LUT is never modified
+    a[:] = 0
+    npt.assert_almost_equal(b, get_cmap("viridis"))
+
+    npt.assert_almost_equal(get_cmap("viridis", alpha=0.5)[:, -1], 0.5)
+    assert get_cmap("viridis", n=16).shape == (16, 4)
+
+
+def test_cmap_texture_shared():
+    texture = get_cmap_texture("jet")
+
+    assert isinstance(texture, pygfx.Texture)
+    assert texture is get_cmap_texture("jet")
+    assert texture is not get_cmap_texture("jet", alpha=0.5)
+    assert texture is not get_cmap_texture("viridis")
+
+    npt.assert_almost_equal(texture.data, make_colors(256, "jet"))
+
+    # shared textures are immutable
+    with pytest.raises(ValueError):
+        texture.data[:] = 0
+
+
+def test_cmap_texture_eviction(monkeypatch):
+    monkeypatch.setattr(functions, "CMAP_CACHE_SIZE", 2)
+    functions._CMAP_TEXTURES.clear()
+
+    viridis = get_cmap_texture("viridis")
+    get_cmap_texture("jet")
+    # viridis is now the most recently used
+    assert get_cmap_texture("viridis") is viridis
+
+    get_cmap_texture("gray")
+
+    assert len(functions._CMAP_TEXTURES) == 2
+    assert ("jet", 1.0, 1.0, 256) not in functions._CMAP_TEXTURES
+    assert get_cmap_texture("viridis") is viridis
+
+
+def test_cmap_atlas():
+    pytest.importorskip("imgui_bundle")
+
+    from fastplotlib.ui.right_click_menus._colormap_picker import (
+        all_cmaps,
+        make_cmap_atlas,
+        get_cmap_atlas_uvs,
+        ATLAS_THUMBNAIL_HEIGHT,
+        ATLAS_THUMBNAIL_WIDTH,
+    )
+
+    atlas = make_cmap_atlas()
+    n_rows = len(all_cmaps) * ATLAS_THUMBNAIL_HEIGHT
+    assert atlas.shape == (n_rows, ATLAS_THUMBNAIL_WIDTH, 4)
+    assert atlas.dtype == np.uint8
+
+    for name in ["viridis", all_cmaps[0], all_cmaps[-1]]:
+        (u0, v0), (u1, v1) = get_cmap_atlas_uvs(name)
+        assert (u0, u1) == (0, 1)
+
+        # uvs are within the rows of this thumbnail
+        rows = atlas[int(v0 * n_rows) : int(v1 * n_rows)]
+        assert rows.shape[0] > 0
+
+        expected = cmap.Colormap(name)(np.linspace(0, 1, ATLAS_THUMBNAIL_WIDTH))
+        for row in rows:
+            npt.assert_allclose(row / 255, expected, atol=1 / 255 + 1e-6)
+
+
+def test_cmap_atlas_view():
+    pytest.importorskip("imgui_bundle")
+
+    from pygfx.renderers.wgpu import get_shared
+    from fastplotlib.ui.right_click_menus._colormap_picker import (
+        all_cmaps,
+        get_cmap_atlas_view,
+        _atlas_views,
+        ATLAS_THUMBNAIL_HEIGHT,
+        ATLAS_THUMBNAIL_WIDTH,
+    )
+
+    device = get_shared().device
+
+    view = get_cmap_atlas_view(device)
+
+    # uploaded once per device and cached
+    assert get_cmap_atlas_view(device) is view
+    assert _atlas_views[device] is view
+
+    assert view.texture.size == (
+        ATLAS_THUMBNAIL_WIDTH,
+        len(all_cmaps) * ATLAS_THUMBNAIL_HEIGHT,
+        1,
+    )
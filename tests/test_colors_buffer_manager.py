@@ -238,3 +238,23 @@ def test_slice(color_input, slice_method: dict, test_graphic: bool):
     # reset
     colors[:] = (1, 1, 1, 1)
     npt.assert_almost_equal(colors[:], np.repeat([[1.0, 1.0, 1.0, 1.0]], 10, axis=0))
+
+
+@pytest.mark.parametrize("array_type", ["list", "str_array", "bytes_array"])
+def test_create_buffer_str_per_point(array_type):
+    names = ["r", "g", "b", "cyan", "magenta", "w", "k", "y", "#ff8800", "orange"]
+    # more unique values than the number of equality masks used by the parser
+    color_input = [names[i] for i in np.random.randint(0, len(names), 100)]
+    truth = np.vstack([np.array(pygfx.Color(c)) for c in color_input])
+
+    if array_type == "str_array":
+        color_input = np.asarray(color_input)
+    elif array_type == "bytes_array":
+        color_input = np.asarray(color_input).astype("S")
+
+    colors = VertexColors(colors=color_input, n_colors=100)
+    npt.assert_almost_equal(colors[:], truth)
+
+    # wrong number of colors
+    with pytest.raises(ValueError):
+        VertexColors(colors=color_input[:50], n_colors=100)
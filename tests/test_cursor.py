@@ -0,0 +1,118 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.tools._picking import get_picker
+
+
+def make_figure():
+    fig = fpl.Figure(shape=(2, 2), canvas="offscreen", size=(400, 400))
+
+    for subplot in fig:
+        subplot.add_scatter(np.random.rand(10, 2))
+
+    # text does not support tooltips
+    fig[1, 1].clear()
+    fig[1, 1].add_text("text")
+
+    for subplot in fig:
+        subplot.camera.show_rect(0, 1, 0, 1)
+
+    return fig
+
+
+def test_cursor_position():
+    fig = make_figure()
+    cursor = fpl.Cursor()
+
+    for subplot in fig:
+        if subplot is fig[0, 1]:
+            cursor.add_subplot(subplot, transform=lambda pos: (pos[0] + 0.25, pos[1]))
+        else:
+            cursor.add_subplot(subplot)
+
+    with pytest.raises(KeyError):
+        cursor.add_subplot(fig[0, 0])
+
+    fig[1, 0].tooltip.enabled = False
+
+    cursor.position = (0.5, 0.25)
+    assert cursor.position == (0.5, 0.25)
+
+    # horizontal and vertical segments of the crosshair
+    npt.assert_almost_equal(
+        cursor._cursors[fig[0, 0]].geometry.positions.data[:, :2],
+        [[-0.5, 0.25], [1.5, 0.25], [0.5, -0.75], [0.5, 1.25]],
+    )
+    npt.assert_almost_equal(
+        cursor._cursors[fig[0, 1]].geometry.positions.data[:, :2],
+        [[-0.25, 0.25], [1.75, 0.25], [0.75, -0.75], [0.75, 1.25]],
+    )
+
+    # pick requests are shared across subplots and only made for subplots that can show a tooltip
+    picker = get_picker(fig)
+    assert set(picker._requests.keys()) == {(cursor, fig[0, 0]), (cursor, fig[0, 1])}
+
+    # transformed position is outside the subplot
+    cursor.position = (0.5, 0.8)
+    cursor._transforms[fig[0, 0]] = lambda pos: (pos[0] + 10, pos[1])
+    cursor.position = (0.5, 0.8)
+    assert set(picker._requests.keys()) == {(cursor, fig[0, 1])}
+
+
+def test_cursor_mode():
+    fig = make_figure()
+    cursor = fpl.Cursor(size=3)
+
+    transform = lambda pos: pos
+    cursor.add_subplot(fig[0, 0], transform=transform)
+    cursor.add_subplot(fig[0, 1])
+
+    cursor.mode = "marker"
+    assert cursor.mode == "marker"
+    assert cursor._cursors[fig[0, 0]].material.size == 3
+    assert cursor._transforms == {fig[0, 0]: transform, fig[0, 1]: None}
+
+    cursor.position = (1, 2)
+    npt.assert_almost_equal(
+        cursor._cursors[fig[0, 1]].geometry.positions.data, [[1, 2, 0]]
+    )
+
+    n_handlers = len(fig.renderer._event_handlers["pointer_move"])
+    cursor.remove_subplot(fig[0, 1])
+    assert len(fig.renderer._event_handlers["pointer_move"]) == n_handlers
+
+    cursor.clear()
+    assert len(cursor._cursors) == 0
+    assert fig[0, 0]._fpl_set_tooltip in fig.renderer._event_handlers["pointer_move"]
+
+
+def test_picker_fallback():
+    fig = make_figure()
+    picker = get_picker(fig)
+    assert picker._use_pick_texture
+
+    results = list()
+
+    def callback(pos, info):
+        results.append((pos, info))
+
+    def broken_internals():
+        raise AttributeError("_blender")
+
+    # pygfx internals changed, requests are resolved with renderer.get_pick_info
+    picker._get_pick_texture = broken_internals
+    picker.request("test", (10, 10), callback)
+
+    with pytest.warns(RuntimeWarning, match="falling back"):
+        picker._copy()
+
+    assert not picker._use_pick_texture
+
+    picker.request("test", (20, 10), callback)
+    picker._copy()
+
+    # nothing drawn, nothing is picked
+    assert results == [((20, 10), None)]
+    assert len(picker._requests) == 0
@@ -0,0 +1,59 @@
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+from fastplotlib.tools import HistogramLUTTool
+
+
+def make_hlut(data):
+    fig = fpl.Figure()
+    image = fig[0, 0].add_image(data)
+
+    hlut = HistogramLUTTool(data=data, images=image)
+    fig[0, 0].docks["right"].add_graphic(hlut)
+
+    return hlut
+
+
+def test_set_data_reuses_colorbar(monkeypatch):
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(100, 100)).astype(np.float32) * 100
+
+    hlut = make_hlut(data)
+
+    colorbar = hlut._colorbar
+    texture = colorbar.data.buffer[0, 0]
+    histogram_line = hlut._histogram_line
+
+    n_auto_scale = list()
+    monkeypatch.setattr(
+        hlut._plot_area, "auto_scale", lambda *a, **kw: n_auto_scale.append(1)
+    )
+
+    # same extent
+    hlut.set_data(data.copy())
+    assert hlut._colorbar is colorbar
+    assert colorbar.data.buffer[0, 0] is texture
+    assert hlut._histogram_line is histogram_line
+    assert len(n_auto_scale) == 0
+
+    # new extent, the colorbar is updated in place
+    new_data = data * 3
+    hlut.set_data(new_data)
+    assert hlut._colorbar is colorbar
+    assert colorbar.data.buffer[0, 0] is texture
+    assert len(n_auto_scale) == 1
+
+    # colorbar spans the new data range
+    npt.assert_allclose(
+        colorbar.data.value[[0, -1], 0] * hlut._scale_factor, hlut._extent, rtol=1e-5
+    )
+    npt.assert_allclose(colorbar.offset[1], hlut._extent[0])
+    npt.assert_allclose(
+        colorbar.world_object.world.scale_y * (colorbar.data.value.shape[0] - 1),
+        hlut._extent[1] - hlut._extent[0],
+        rtol=1e-5,
+    )
+
+    hlut.cmap = "viridis"
+    assert colorbar.cmap == "viridis"
@@ -0,0 +1,232 @@
+import threading
+
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+
+
+def make_data(n: int = 4) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.random((20, 32, 32), dtype=np.float32) for i in range(n)]
+
+
+def test_frame_apply_workers():
+    data = make_data()
+
+    threads = set()
+
+    def frame_apply(frame):
+        threads.add(threading.current_thread().name)
+        return frame * 2
+
+    iw = fpl.ImageWidget(
+        data,
+        frame_apply=frame_apply,
+        window_funcs={"t": (np.mean, 3)},
+        histogram_widget=False,
+        frame_apply_workers=4,
+    )
+
+    # the first frames are processed in the main thread when the widget is created
+    threads.clear()
+    iw.current_index = {"t": 10}
+
+    for ig, array in zip(iw.managed_graphics, data):
+        npt.assert_almost_equal(ig.data.value, array[9:11].mean(axis=0) * 2)
+
+    assert all(name.startswith("fpl-frame-apply") for name in threads)
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_playback_clock():
+    time = FakeTime()
+    clock = fpl.PlaybackClock(fps=10, time_func=time)
+
+    assert clock.get_frame(100) == (0, 0)
+
+    clock.play(5)
+    time.now = 0.25
+    index, latency = clock.get_frame(100)
+    assert index == 7
+    npt.assert_almost_equal(latency, 0.05)
+
+    # slow render, frames are skipped to stay in real time
+    time.now = 1.0
+    assert clock.get_frame(100)[0] == 15
+
+    # changing the fps continues from the current frame
+    clock.fps = 20
+    time.now = 1.5
+    assert clock.get_frame(100)[0] == 25
+
+    clock.pause()
+    time.now = 10
+    assert clock.get_frame(100)[0] == 25
+
+    # stops at the end
+    clock.play()
+    time.now = 20
+    assert clock.get_frame(100) == (99, 0)
+    assert not clock.playing
+
+    clock.loop = True
+    clock.play(0)
+    time.now = 25.5
+    assert clock.get_frame(100)[0] == 110 % 100
+
+
+def test_playback_sync():
+    data = make_data(1)[0]
+    time = FakeTime()
+
+    iw1 = fpl.ImageWidget(data, histogram_widget=False)
+    iw2 = fpl.ImageWidget(data[::2], histogram_widget=False)
+
+    clock = fpl.PlaybackClock(fps=5, loop=True, time_func=time)
+    iw1.set_playback_clock(clock)
+    iw2.set_playback_clock(iw1.playback_clocks["t"])
+
+    clock.play()
+    time.now = 1.5
+    for iw in [iw1, iw2]:
+        iw._image_widget_sliders._play("t")
+
+    assert iw1.current_index["t"] == 7
+    assert iw2.current_index["t"] == 7
+
+    # iw2 has 10 frames, it loops back
+    time.now = 2.5
+    for iw in [iw1, iw2]:
+        iw._image_widget_sliders._play("t")
+
+    assert iw1.current_index["t"] == 12
+    assert iw2.current_index["t"] == 2
+
+    stats = iw2.playback_stats["t"]
+    assert stats.frames_displayed == 2
+    assert stats.frames_dropped == 6 + 4
+
+    # without looping the shorter widget stays at its last frame, it does not stop the shared clock
+    clock.loop = False
+    clock.play(0)
+    time.now = 2.5 + 3
+    for iw in [iw2, iw1]:
+        iw._image_widget_sliders._play("t")
+
+    assert clock.playing
+    assert iw1.current_index["t"] == 15
+    assert iw2.current_index["t"] == 9
+
+    time.now = 2.5 + 5
+    for iw in [iw2, iw1]:
+        iw._image_widget_sliders._play("t")
+
+    assert not clock.playing
+    assert iw1.current_index["t"] == 19
+    assert iw2.current_index["t"] == 9
+
+
+def test_set_frame():
+    data = make_data(1)[0]
+    iw = fpl.ImageWidget(data, histogram_widget=False)
+
+    ig = iw.managed_graphics[0]
+    texture = ig.data.buffer[0, 0]
+    value = ig.data.value
+
+    # float32 views of the data are copied into the existing buffer
+    iw.current_index = {"t": 5}
+    assert ig.data.value is value
+    assert texture.data is not data[5]
+    npt.assert_almost_equal(ig.data.value, data[5])
+
+    # other dtypes are converted once into the existing buffer
+    iw.set_data((data * 1000).astype(np.uint16))
+    iw.current_index = {"t": 3}
+    assert ig.data.value is value
+    npt.assert_almost_equal(ig.data.value, (data[3] * 1000).astype(np.uint16))
+
+    # frames from a frame_apply that reuses its output array are copied, not aliased
+    out = np.zeros(data.shape[1:], dtype=np.float32)
+
+    def frame_apply(frame):
+        np.multiply(frame, 2, out=out)
+        return out
+
+    iw.frame_apply = frame_apply
+    iw.current_index = {"t": 4}
+    assert ig.data.value is value
+    assert not np.shares_memory(texture.data, out)
+    assert ig.data.buffer[0, 0] is texture
+    npt.assert_almost_equal(ig.data.value, (data[4] * 1000).astype(np.uint16) * 2)
+
+    out[:] = -1
+    assert (ig.data.value != -1).all()
+
+
+def test_volume():
+    rng = np.random.default_rng(0)
+    data = rng.random((6, 16, 24, 32), dtype=np.float32)
+
+    iw = fpl.ImageWidget(data, volume=True, histogram_widget=False)
+
+    assert iw.slider_dims == ["t"]
+    assert iw.ndim == 4
+    graphic = iw.managed_graphics[0]
+    assert isinstance(graphic, fpl.ImageVolumeGraphic)
+    npt.assert_almost_equal(graphic.data.value, data[0])
+
+    textures = graphic.data.buffer.copy()
+    buffer = iw._volume_buffers[0]
+    # upload 4 planes per render cycle
+    buffer.upload_bytes = 4 * 24 * 32 * 4
+
+    iw.current_index = {"t": 1}
+
+    # the next timepoints are prefetched
+    assert set(iw._prefetcher._futures.keys()) == {(0, 2), (0, 3)}
+
+    # displayed until the new volume is fully uploaded
+    for i in range(3):
+        iw._upload_volumes()
+        npt.assert_almost_equal(graphic.data.value, data[0])
+        assert graphic.data.buffer[0, 0, 0] is textures[0, 0, 0]
+
+    iw._upload_volumes()
+    assert not buffer.uploading
+
+    # buffers are swapped
+    npt.assert_almost_equal(graphic.data.value, data[1])
+    texture = graphic.data.buffer[0, 0, 0]
+    assert texture is not textures[0, 0, 0]
+    assert graphic._tiles[0, 0, 0].geometry.grid is texture
+
+    # a volume requested during an upload is uploaded next, volumes in between are skipped
+    iw.current_index = {"t": 2}
+    iw._upload_volumes()
+    iw.current_index = {"t": 4}
+    iw.current_index = {"t": 5}
+    for i in range(4):
+        iw._upload_volumes()
+    npt.assert_almost_equal(graphic.data.value, data[2])
+    for i in range(4):
+        iw._upload_volumes()
+    npt.assert_almost_equal(graphic.data.value, data[5])
+    assert graphic.data.buffer[0, 0, 0] is texture
+
+    # prefetch wraps around for looped playback
+    assert set(iw._prefetcher._futures.keys()) == {(0, 0), (0, 1)}
+
+    # prefetched volumes are discarded when the processing changes
+    iw.frame_apply = lambda v: v * 2
+    for i in range(8):
+        iw._upload_volumes()
+    npt.assert_almost_equal(graphic.data.value, data[5] * 2)
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def run(code: str) -> str:
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return out.stdout.strip()
+
+
+def test_import_is_lazy():
+    # heavy submodules, the gui backend and wgpu are not imported with `import fastplotlib`
+    modules = [
+        "fastplotlib.graphics",
+        "fastplotlib.layouts",
+        "fastplotlib.widgets",
+        "fastplotlib.utils.gui",
+        "imgui_bundle",
+        "rendercanvas.auto",
+        "wgpu",
+    ]
+
+    out = run(
+        "import sys\n"
+        "import fastplotlib\n"
+        f"print([m for m in {modules} if m in sys.modules])\n"
+    )
+
+    assert out == "[]"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fastplotlib.graphics",
+        "import fastplotlib.layouts",
+        "import fastplotlib.tools",
+        "import fastplotlib.widgets",
+        "import fastplotlib.ui",
+        "from fastplotlib.ui import EdgeWindow",
+        "import fastplotlib; from fastplotlib.ui import EdgeWindow",
+        "from fastplotlib import *",
+    ],
+)
+def test_import_submodules(statement):
+    # no circular imports regardless of which submodule is imported first
+    run(statement)
+
+
+def test_lazy_attributes():
+    import fastplotlib as fpl
+    from fastplotlib.graphics import LineGraphic
+    from fastplotlib.layouts import Figure, IMGUI
+
+    assert fpl.LineGraphic is LineGraphic
+    assert fpl.IMGUI is IMGUI
+    assert "IMGUI" in fpl.__all__
+
+    if IMGUI:
+        from fastplotlib.layouts import ImguiFigure
+
+        assert fpl.Figure is ImguiFigure
+    else:
+        assert fpl.Figure is Figure
+
+    for name in fpl.__all__:
+        getattr(fpl, name)
+        assert name in dir(fpl)
+
+    with pytest.raises(AttributeError):
+        fpl.not_a_name
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+
+import numpy as np
+from numpy import testing as npt
+import pygfx
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import (
+    VertexPositions,
+    VertexColors,
+    VertexPointSizes,
+    LabelsText,
+)
+
+
+def make_labels(n: int = 20, **kwargs) -> fpl.LabelsGraphic:
+    positions = np.column_stack([np.arange(n), np.zeros(n)]).astype(np.float32)
+    text = [f"label {i}" for i in range(n)]
+
+    return fpl.LabelsGraphic(positions, text, **kwargs)
+
+
+def test_create_labels():
+    graphic = make_labels(font_sizes=np.arange(20) + 1, colors="r")
+
+    assert isinstance(graphic.positions, VertexPositions)
+    assert isinstance(graphic.text, LabelsText)
+    assert isinstance(graphic.font_sizes, VertexPointSizes)
+    assert isinstance(graphic.colors, VertexColors)
+
+    assert isinstance(graphic.world_object, pygfx.MultiText)
+    assert len(graphic.world_object._text_blocks) == 20
+    assert graphic.world_object.get_text_block(3)._input[1] == "label 3"
+
+    npt.assert_almost_equal(graphic.positions[:, 0], np.arange(20))
+    npt.assert_almost_equal(graphic.font_sizes.value, np.arange(20) + 1)
+    npt.assert_almost_equal(graphic.colors.value, np.repeat([[1, 0, 0, 1]], 20, 0))
+    assert graphic.text[5] == "label 5"
+    assert len(graphic.text) == 20
+
+    # buffers used by the shader
+    assert graphic.world_object.geometry.positions is graphic.positions.buffer
+    assert graphic.world_object.geometry.sizes is graphic.font_sizes.buffer
+    assert graphic.world_object.geometry.colors is graphic.colors.buffer
+    assert graphic.visible_labels.all()
+
+    with pytest.raises(ValueError):
+        fpl.LabelsGraphic(np.zeros((3, 2)), ["a", "b"])
+
+    with pytest.raises(ValueError):
+        fpl.LabelsGraphic(np.zeros(3), ["a", "b", "c"])
+
+
+@pytest.mark.parametrize(
+    "key", [slice(5, 10), 3, np.array([1, 7, 8]), np.arange(20) > 15]
+)
+def test_set_partial(key):
+    graphic = make_labels()
+
+    events = list()
+    graphic.add_event_handler(
+        lambda ev: events.append(ev), "positions", "text", "font_sizes", "colors"
+    )
+
+    graphic.positions[key, 1] = 5.0
+    graphic.font_sizes[key] = 30
+    graphic.colors[key] = "g"
+    graphic.text[key] = "changed"
+
+    expected_y = np.zeros(20)
+    expected_y[key] = 5.0
+    npt.assert_almost_equal(graphic.positions[:, 1], expected_y)
+
+    expected_sizes = np.full(20, 14.0)
+    expected_sizes[key] = 30
+    npt.assert_almost_equal(graphic.font_sizes.value, expected_sizes)
+
+    indices = np.arange(20)[key].reshape(-1)
+    npt.assert_almost_equal(
+        graphic.colors.value[indices], [[0, 1, 0, 1]] * indices.size
+    )
+
+    for i in range(20):
+        expected = "changed" if i in indices else f"label {i}"
+        assert graphic.text[i] == expected
+        assert graphic.world_object.get_text_block(i)._input[1] == expected
+
+    assert [ev.type for ev in events] == ["positions", "font_sizes", "colors", "text"]
+    assert all(ev.info["key"] is key for ev in events[1:])
+    assert list(events[-1].info["value"]) == ["changed"] * indices.size
+
+
+def test_set_text():
+    graphic = make_labels(n=3)
+
+    graphic.text = ["a", "bb", "a much longer label"]
+    assert list(graphic.text.value) == ["a", "bb", "a much longer label"]
+    npt.assert_equal(graphic.text._n_chars, [1, 2, 19])
+
+    with pytest.raises(ValueError):
+        graphic.text = ["a", "b"]
+
+
+def make_plot_area(graphic, size=(300, 300)):
+    camera = pygfx.OrthographicCamera(size[0], size[1])
+    camera.local.position = (size[0] / 2, size[1] / 2, 10)
+
+    graphic._plot_area = SimpleNamespace(
+        camera=camera, viewport=SimpleNamespace(logical_size=size)
+    )
+
+
+def test_culling():
+    positions = np.array(
+        [
+            [102, 102, 0],  # visible
+            [103, 103, 0],  # same grid cell as 0
+            [-500, 100, 0],  # offscreen
+            [250, 200, 0],  # visible
+        ],
+        dtype=np.float32,
+    )
+
+    graphic = fpl.LabelsGraphic(positions, ["a", "b", "c", "d"], culling="offscreen")
+    make_plot_area(graphic)
+
+    graphic._update_culling()
+    npt.assert_equal(graphic.visible_labels, [True, True, False, True])
+
+    graphic.culling = "overlap"
+    graphic._update_culling()
+    npt.assert_equal(graphic.visible_labels, [True, False, False, True])
+
+    # moving a label is picked up on the next update
+    graphic.positions[1] = [200, 50, 0]
+    graphic._update_culling()
+    npt.assert_equal(graphic.visible_labels, [True, True, False, True])
+
+    graphic.culling = None
+    assert graphic.visible_labels.all()
+
+    with pytest.raises(ValueError):
+        graphic.culling = "bah"
+
+
+def test_shader_patches():
+    from fastplotlib.graphics.labels import LabelsMultiTextShader, _patch_wgsl
+    from fastplotlib.utils.gpu import SUPPORTED_PYGFX_VERSION
+
+    # the shader patches and private imports are only known to work with this version
+    assert pygfx.__version__ == SUPPORTED_PYGFX_VERSION
+
+    graphic = make_labels()
+    code = LabelsMultiTextShader(graphic.world_object).get_code()
+
+    # every patch applied
+    assert "block_scale" in code
+    assert "load_s_colors(block_index)" in code
+    assert "let base_srgb = varyings.color;" in code
+
+    with pytest.raises(RuntimeError, match="pygfx"):
+        _patch_wgsl(code, "not in the shader", "")
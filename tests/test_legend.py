@@ -0,0 +1,119 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+
+
+def make_legend(n: int = 12, max_rows: int = 5):
+    fig = fpl.Figure(canvas="offscreen")
+    lines = [
+        fig[0, 0].add_line(np.random.rand(10, 2), colors="r", name=f"line {i}")
+        for i in range(n)
+    ]
+    legend = fpl.Legend(fig[0, 0], max_rows=max_rows)
+
+    return fig, lines, legend
+
+
+def item_positions(legend):
+    return np.array(
+        [
+            (item.world_object.local.x, item.world_object.local.y)
+            for item in legend._items.values()
+        ]
+    )
+
+
+def check_layout(legend, max_rows):
+    # items fill columns of max_rows, each column is to the right of the widest item in the previous column
+    items = list(legend._items.values())
+    positions = item_positions(legend)
+
+    for i, (item, (x, y)) in enumerate(zip(items, positions)):
+        col, row = divmod(i, max_rows)
+        assert y == row * -10
+
+        if col == 0:
+            assert x == 0
+        else:
+            prev_column = items[(col - 1) * max_rows : col * max_rows]
+            prev_x = positions[(col - 1) * max_rows, 0]
+            assert x == prev_x + max(it.width for it in prev_column) + 15
+
+
+def test_add_graphics():
+    fig, lines, legend = make_legend()
+
+    legend.add_graphic(lines[0], label="first")
+    legend.add_graphics(lines[1:])
+
+    assert legend.graphics() == tuple(lines)
+    assert [item.label for item in legend._items.values()] == [
+        "first",
+        *[f"line {i}" for i in range(1, 12)],
+    ]
+    check_layout(legend, 5)
+
+    # cached extents are the same as the bounding boxes
+    for item in legend._items.values():
+        bbox = item.world_object.get_world_bounding_box()
+        npt.assert_almost_equal(item.width, np.ptp(bbox[:, 0]), decimal=4)
+
+    with pytest.raises(KeyError):
+        legend.add_graphic(lines[0])
+
+    line = fig[0, 0].add_line(np.random.rand(10, 2), colors="r")
+    with pytest.raises(ValueError):
+        legend.add_graphic(line, label="line 3")
+
+    with pytest.raises(ValueError):
+        legend.add_graphics([line], labels=["a", "b"])
+
+
+def test_remove_reorder():
+    fig, lines, legend = make_legend()
+    legend.add_graphics(lines)
+
+    legend.remove_graphic(lines[2])
+    legend.remove_graphic(lines[7])
+
+    assert lines[2] not in legend.graphics()
+    assert len(legend._items) == 10
+    check_layout(legend, 5)
+
+    # label can be reused after the graphic is removed
+    legend.add_graphic(lines[2], label="line 7")
+    check_layout(legend, 5)
+
+    labels = [item.label for item in legend._items.values()]
+    legend.reorder(labels[::-1])
+    assert [item.label for item in legend._items.values()] == labels[::-1]
+    check_layout(legend, 5)
+
+    with pytest.raises(ValueError):
+        legend.reorder(labels[:-1])
+
+    # deleting the graphic removes it from the legend
+    fig[0, 0].delete_graphic(lines[0])
+    assert len(legend._items) == 10
+    check_layout(legend, 5)
+
+
+def test_set_label():
+    fig, lines, legend = make_legend()
+    legend.add_graphics(lines)
+
+    item = legend[lines[1]]
+    width = item.width
+
+    item.label = "a much longer label for this line"
+    assert item.label == "a much longer label for this line"
+    assert item.width > width
+    check_layout(legend, 5)
+
+    with pytest.raises(ValueError):
+        legend[lines[2]].label = "line 3"
+
+    # old label is free
+    legend[lines[2]].label = "line 1"
@@ -5,7 +5,11 @@ import pytest
 import fastplotlib as fpl
 import pygfx
 from fastplotlib.graphics.features import GraphicFeatureEvent, VertexMarkers
-from fastplotlib.graphics.features._scatter import marker_names, vectorized_user_markers_to_std_markers
+from fastplotlib.graphics.features._scatter import (
+    marker_names,
+    marker_int_to_name,
+    user_markers_to_int_array,
+)
 
 from .utils import (
     generate_slice_indices,
@@ -16,6 +20,11 @@ from .utils import (
 EVENT_RETURN_VALUE: GraphicFeatureEvent = None
 
 
+def to_std_markers(markers):
+    # standard marker names, decoded from the marker ints
+    return marker_int_to_name[user_markers_to_int_array(markers)]
+
+
 def event_handler(ev):
     global EVENT_RETURN_VALUE
     EVENT_RETURN_VALUE = ev
@@ -134,10 +143,69 @@ def test_slice(test_graphic, slice_method):
             assert EVENT_RETURN_VALUE.info["key"] == s
             assert (EVENT_RETURN_VALUE.info["value"] == np.asarray(MARKERS2)[s]).all()
 
-    assert (vertex_markers.value[s] == vectorized_user_markers_to_std_markers(MARKERS2)[s]).all()
+    assert (vertex_markers.value[s] == to_std_markers(MARKERS2)[s]).all()
     # these are int32 so assert equal should be fine
     npt.assert_equal(vertex_markers.value_int[s], MARKERS2_INT[s])
 
     # make sure other points aren't affected
-    assert (vertex_markers.value[others] == vectorized_user_markers_to_std_markers(np.asarray(MARKERS1)[others])).all()
+    assert (vertex_markers.value[others] == to_std_markers(np.asarray(MARKERS1)[others])).all()
     npt.assert_equal(vertex_markers.value_int[others], MARKERS1_INT[others])
+
+
+@pytest.mark.parametrize("test_graphic", [True, False])
+def test_int_markers(test_graphic):
+    data = generate_positions_spiral_data("xyz")
+
+    if test_graphic:
+        fig = fpl.Figure()
+
+        scatter = fig[0, 0].add_scatter(data, markers=MARKERS1_INT)
+        vertex_markers = scatter.markers
+    else:
+        vertex_markers = VertexMarkers(MARKERS1_INT, len(data))
+
+    marker_values_str = np.asarray(list(map(marker_names.get, MARKERS1)))
+
+    # names are decoded from the int buffer
+    assert (vertex_markers.value == marker_values_str).all()
+    npt.assert_equal(vertex_markers.value_int, MARKERS1_INT)
+
+    # enum and int codes
+    vertex_markers[0] = pygfx.MarkerInt.heart
+    assert vertex_markers.value[0] == "heart"
+
+    vertex_markers[1:3] = np.array([pygfx.MarkerInt.ring, pygfx.MarkerInt.pin])
+    assert (vertex_markers.value[1:3] == ["ring", "pin"]).all()
+
+    vertex_markers[:] = MARKERS2_INT
+    npt.assert_equal(vertex_markers.value_int, MARKERS2_INT)
+
+    # single int for all markers, and standard names
+    vertex_markers[:] = pygfx.MarkerInt.square
+    assert (vertex_markers.value == "square").all()
+
+    vertex_markers[:2] = ["circle", "o"]
+    assert (vertex_markers.value[:2] == "circle").all()
+
+    for invalid in [0, -1, 100_000]:
+        with pytest.raises(ValueError):
+            vertex_markers[0] = invalid
+
+        with pytest.raises(ValueError):
+            vertex_markers[:2] = [pygfx.MarkerInt.ring, invalid]
+
+    with pytest.raises(ValueError):
+        vertex_markers[:2] = ["o", "not a marker"]
+
+    # unchanged by the invalid values
+    assert (vertex_markers.value[:2] == "circle").all()
+
+    # bools are not marker codes
+    with pytest.raises(TypeError):
+        vertex_markers[0] = True
+
+    with pytest.raises(TypeError):
+        vertex_markers[:2] = np.array([True, False])
+
+    with pytest.raises(TypeError):
+        VertexMarkers(True, 10)
@@ -0,0 +1,103 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import fastplotlib as fpl
+
+
+def test_graphic_memory_usage():
+    fig = fpl.Figure(canvas="offscreen", size=(200, 200))
+
+    data = np.random.rand(1_000, 3).astype(np.float32)
+
+    # isolated buffer, the graphic owns a copy of the data
+    line = fig[0, 0].add_line(data)
+    usage = line.memory_usage()
+
+    assert usage["data"]["host"] == data.nbytes
+    assert usage["data"]["gpu"] == data.nbytes
+    assert usage["data"]["shared_host"] == 0
+    assert usage["colors"]["gpu"] == 1_000 * 4 * 4
+    assert "world_object" not in usage
+
+    for key in ["host", "gpu", "shared_host", "shared_gpu"]:
+        assert usage["total"][key] == sum(
+            v[key] for k, v in usage.items() if k != "total"
+        )
+
+    # the user's array is used as the buffer
+    line2 = fig[0, 0].add_line(data, isolated_buffer=False)
+    usage = line2.memory_usage()
+
+    assert usage["data"]["host"] == 0
+    assert usage["data"]["shared_host"] == data.nbytes
+    assert usage["data"]["gpu"] == data.nbytes
+
+    # buffers allocated by the feature are owned, even though they are not copied
+    scatter = fig[0, 0].add_scatter(data, markers=["o"] * 1_000)
+    usage = scatter.memory_usage()
+
+    assert usage["markers"]["host"] == 1_000 * 4
+    assert usage["markers"]["shared_host"] == 0
+
+    # the colormap texture is from the cache that is shared by all graphics
+    image = fig[0, 0].add_image(np.random.rand(100, 100))
+    usage = image.memory_usage()
+
+    assert usage["data"]["host"] >= 100 * 100 * 4
+    assert usage["data"]["gpu"] == 100 * 100 * 4
+    assert usage["cmap"]["gpu"] == 0
+    assert usage["cmap"]["shared_gpu"] > 0
+
+    # children are included
+    collection = fig[0, 0].add_line_collection([data[:10], data[:20]])
+    usage = collection.memory_usage()
+
+    assert usage["data"]["gpu"] == 30 * 3 * 4
+
+
+def test_figure_memory_report():
+    fig = fpl.Figure(shape=(1, 2), canvas="offscreen", size=(200, 200))
+
+    data = np.random.rand(100, 3).astype(np.float32)
+
+    line = fig[0, 0].add_line(data, isolated_buffer=False, name="line")
+    line2 = fig[0, 1].add_line(data, isolated_buffer=False, name="line2")
+    image = fig[0, 1].add_image(np.random.rand(10, 10), name="image")
+
+    report = fig.memory_report()
+
+    graphics = report["subplots"]["(0, 0)"]["graphics"]
+    assert set(graphics.keys()) == {"line"}
+    assert graphics["line"]["data"]["shared_host"] == data.nbytes
+
+    # the user's array is only counted by the first graphic that uses it
+    graphics = report["subplots"]["(0, 1)"]["graphics"]
+    assert set(graphics.keys()) == {"line2", "image"}
+    assert graphics["line2"]["data"]["shared_host"] == 0
+    assert graphics["line2"]["data"]["gpu"] == data.nbytes
+
+    assert report["total"] == {
+        key: sum(s["total"][key] for s in report["subplots"].values())
+        for key in ["host", "gpu", "shared_host", "shared_gpu"]
+    }
+
+    n_bytes = report["total"]["gpu"] + report["total"]["shared_gpu"]
+
+    assert fig.check_memory_budget()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fig.set_memory_budget(gpu=n_bytes + 10_000)
+
+    assert fig.memory_budget == {"gpu": n_bytes + 10_000, "host": None}
+
+    with pytest.warns(RuntimeWarning, match="gpu memory usage"):
+        fig[0, 0].add_image(np.random.rand(100, 100))
+
+    with pytest.raises(ValueError):
+        fig.set_memory_budget(host=-1)
+
+    fig.set_memory_budget()
+    assert fig.check_memory_budget()
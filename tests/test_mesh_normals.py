@@ -0,0 +1,133 @@
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import VertexNormals, compute_vertex_normals
+
+
+def make_sphere(n: int = 20):
+    theta, phi = np.meshgrid(np.linspace(0, np.pi, n), np.linspace(0, 2 * np.pi, n))
+    positions = np.column_stack(
+        [
+            (np.sin(theta) * np.cos(phi)).ravel(),
+            (np.sin(theta) * np.sin(phi)).ravel(),
+            np.cos(theta).ravel(),
+        ]
+    ).astype(np.float32)
+
+    i, j = np.meshgrid(np.arange(n - 1), np.arange(n - 1))
+    start = (i * n + j).ravel()
+    indices = np.concatenate(
+        [
+            np.column_stack([start, start + 1, start + n]),
+            np.column_stack([start + 1, start + n + 1, start + n]),
+        ]
+    ).astype(np.int32)
+
+    return positions, indices
+
+
+def test_compute_vertex_normals():
+    # flat square of 2 triangles and 1 quad
+    positions = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32)
+    for indices in [np.array([[0, 1, 2], [0, 2, 3]]), np.array([[0, 1, 2, 3]])]:
+        npt.assert_almost_equal(
+            compute_vertex_normals(positions, indices), np.tile([0, 0, 1], (4, 1))
+        )
+
+    # sphere normals point outwards, except at the poles where all faces are degenerate
+    positions, indices = make_sphere()
+    normals = compute_vertex_normals(positions, indices)
+    poles = np.abs(positions[:, 2]) == 1
+    npt.assert_almost_equal(np.linalg.norm(normals[~poles], axis=1), 1, decimal=5)
+    assert ((normals[~poles] * positions[~poles]).sum(axis=1) > 0.9).all()
+
+
+def test_mesh_normals():
+    positions, indices = make_sphere()
+    graphic = fpl.MeshGraphic(positions, indices, mode="phong")
+
+    assert isinstance(graphic._normals, VertexNormals)
+    assert graphic.world_object.geometry.normals is graphic._normals.buffer
+    npt.assert_almost_equal(graphic.normals, compute_vertex_normals(positions, indices))
+
+    # not used for lighting in basic mode
+    assert fpl.MeshGraphic(positions, indices, mode="basic").normals is None
+
+
+def test_partial_update():
+    positions, indices = make_sphere()
+    graphic = fpl.MeshGraphic(positions, indices, mode="phong")
+    buffer = graphic.world_object.geometry.normals
+
+    # clear chunks from creation
+    buffer._gfx_get_chunk_descriptions()
+
+    graphic.positions[50:60] = positions[50:60] * 2
+
+    npt.assert_almost_equal(
+        graphic.normals, compute_vertex_normals(graphic.positions.value, indices)
+    )
+
+    # only the normals around the moved vertices are uploaded
+    chunks = buffer._gfx_get_chunk_descriptions()
+    assert sum(c[1] for c in chunks) < buffer.nitems
+
+    # all positions
+    graphic.positions = positions * [1, 1, 3]
+    npt.assert_almost_equal(
+        graphic.normals, compute_vertex_normals(graphic.positions.value, indices)
+    )
+
+    # changed topology
+    graphic.indices = indices[:, ::-1]
+    npt.assert_almost_equal(
+        graphic.normals,
+        compute_vertex_normals(graphic.positions.value, indices[:, ::-1]),
+    )
+
+
+def test_surface_normals():
+    y, x = np.mgrid[:30, :40]
+    z = np.sin(x / 5).astype(np.float32) * np.cos(y / 5).astype(np.float32)
+    graphic = fpl.SurfaceGraphic(z)
+
+    z[10:12] = 3
+    graphic.data = z
+
+    npt.assert_almost_equal(
+        graphic.normals,
+        compute_vertex_normals(graphic.positions.value, graphic.indices.value),
+    )
+
+
+def test_worker_thread(monkeypatch):
+    monkeypatch.setattr(VertexNormals, "worker_threshold", 0)
+
+    positions, indices = make_sphere()
+    graphic = fpl.MeshGraphic(positions, indices, mode="phong")
+
+    # enabled when the graphic is added to a plot area, which applies the normals before rendering
+    graphic._normals._use_worker = True
+
+    graphic.positions[50:60] = positions[50:60] * 2
+    graphic.positions[:] = positions * 3
+
+    assert len(graphic._normals._pending) == 2
+
+    npt.assert_almost_equal(
+        graphic.normals, compute_vertex_normals(graphic.positions.value, indices)
+    )
+    assert len(graphic._normals._pending) == 0
+
+    # the worker thread of the graphic is stopped when the graphic is deleted
+    fig = fpl.Figure(canvas="offscreen", size=(200, 200))
+    fig[0, 0].add_graphic(graphic)
+
+    executor = graphic._normals._executor
+    graphic.positions[:] = positions
+    fig[0, 0].delete_graphic(graphic)
+
+    assert graphic._normals._executor is None
+    assert len(graphic._normals._pending) == 0
+    assert executor._shutdown
@@ -0,0 +1,192 @@
+import numpy as np
+from numpy import testing as npt
+import pygfx
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import PolygonColors, PolygonVisibility
+from fastplotlib.utils.triangulation import (
+    triangulate_polygons,
+    faces_are_valid,
+)
+
+
+def make_polygons(n: int = 50):
+    rng = np.random.default_rng(0)
+    polygons = list()
+    for i in range(n):
+        n_vertices = rng.integers(3, 40)
+        theta = np.sort(rng.uniform(0, 2 * np.pi, n_vertices))
+        if i % 3 == 0:
+            # convex
+            r = np.ones(n_vertices)
+        else:
+            r = rng.uniform(0.5, 1, n_vertices)
+
+        polygon = np.column_stack([r * np.cos(theta), r * np.sin(theta)]) + i * 3
+        if i % 2 == 0:
+            # clockwise
+            polygon = polygon[::-1]
+
+        polygons.append(polygon.astype(np.float32))
+
+    return polygons
+
+
+def check_faces(polygons, faces, face_offsets):
+    vertex_offsets = np.cumsum([0, *[len(p) for p in polygons]])
+    for i, polygon in enumerate(polygons):
+        polygon_faces = faces[face_offsets[i] : face_offsets[i + 1]] - vertex_offsets[i]
+        assert polygon_faces.min() >= 0
+        assert faces_are_valid(polygon, polygon_faces)
+
+
+def test_triangulate_polygons():
+    polygons = make_polygons()
+    faces, face_offsets = triangulate_polygons(polygons)
+
+    assert face_offsets.size == len(polygons) + 1
+    check_faces(polygons, faces, face_offsets)
+
+    # self-intersecting and too small polygons
+    polygons.insert(3, np.array([[0, 0], [1, 1], [1, 0], [0, 1]], dtype=np.float32))
+    polygons.insert(5, np.array([[0, 0], [1, 1]], dtype=np.float32))
+
+    faces, face_offsets = triangulate_polygons(polygons)
+    n_faces = np.diff(face_offsets)
+
+    assert n_faces[3] > 0
+    assert n_faces[5] == 0
+    assert faces.max() < sum(len(p) for p in polygons)
+
+
+def test_create_polygons():
+    polygons = make_polygons()
+    graphic = fpl.PolygonsGraphic(polygons, colors="r")
+
+    assert isinstance(graphic.colors, PolygonColors)
+    assert isinstance(graphic.visibility, PolygonVisibility)
+    assert graphic.n_polygons == len(polygons)
+
+    for polygon, data in zip(polygons, graphic.data):
+        npt.assert_almost_equal(data[:, :2], polygon)
+
+    geometry = graphic.world_object.geometry
+    check_faces(polygons, geometry.indices.data, graphic.face_offsets)
+
+    npt.assert_almost_equal(graphic.colors.value, np.tile([1, 0, 0, 1], (50, 1)))
+    npt.assert_almost_equal(
+        geometry.colors.data, np.tile([1, 0, 0, 1], (geometry.colors.nitems, 1))
+    )
+    assert graphic.visibility.value.all()
+
+    with pytest.raises(ValueError):
+        fpl.PolygonsGraphic([np.zeros((5, 4))])
+
+    for i in [0, 17, 49]:
+        face = graphic.face_offsets[i]
+        assert graphic.get_polygon_index(face) == i
+
+
+@pytest.mark.parametrize(
+    "key", [slice(10, 30), 5, np.array([3, 40, 41]), np.arange(50) > 40]
+)
+def test_set_colors(key):
+    polygons = make_polygons()
+    graphic = fpl.PolygonsGraphic(polygons)
+    buffer = graphic.world_object.geometry.colors
+
+    events = list()
+    graphic.add_event_handler(lambda ev: events.append(ev), "colors")
+
+    # clear chunks from creation
+    buffer._gfx_get_chunk_descriptions()
+
+    graphic.colors[key] = "b"
+
+    expected = np.ones((50, 4), dtype=np.float32)
+    expected[key] = [0, 0, 1, 1]
+    npt.assert_almost_equal(graphic.colors.value, expected)
+
+    # vertex colors
+    vertex_offsets = graphic.vertex_offsets
+    npt.assert_almost_equal(
+        buffer.data, np.repeat(expected, np.diff(vertex_offsets), axis=0)
+    )
+
+    # only the range of vertices of the modified polygons is uploaded
+    indices = np.arange(50)[key]
+    chunks = buffer._gfx_get_chunk_descriptions()
+    assert sum(c[1] for c in chunks) < buffer.nitems
+    assert chunks[0][0] <= vertex_offsets[indices.min()]
+
+    assert events[0].info["key"] is key
+
+    # set RGBA components directly
+    graphic.colors[key, 3] = 0.5
+    npt.assert_almost_equal(graphic.colors[key][..., 3], 0.5)
+
+
+def test_set_visibility():
+    polygons = make_polygons()
+    graphic = fpl.PolygonsGraphic(polygons)
+    indices = graphic.world_object.geometry.indices
+
+    faces = indices.data.copy()
+    face_offsets = graphic.face_offsets
+
+    graphic.visibility[[2, 10]] = False
+
+    hidden = np.zeros(len(faces), dtype=bool)
+    for i in [2, 10]:
+        hidden[face_offsets[i] : face_offsets[i + 1]] = True
+
+    # hidden polygons have degenerate faces
+    assert (indices.data[hidden] == 0).all()
+    npt.assert_equal(indices.data[~hidden], faces[~hidden])
+
+    graphic.visibility = True
+    npt.assert_equal(indices.data, faces)
+
+    graphic.visibility = np.arange(50) % 2 == 0
+    npt.assert_equal(graphic.visibility.value, np.arange(50) % 2 == 0)
+
+
+def test_outline():
+    polygons = make_polygons()
+    graphic = fpl.PolygonsGraphic(polygons, outline_thickness=2, outline_color="g")
+
+    outline = graphic.world_object.children[0]
+    assert isinstance(outline, pygfx.Line)
+    assert outline.material.thickness == 2
+
+    # all outlines in one buffer, each polygon is closed and followed by a NaN separator
+    positions = outline.geometry.positions
+    assert positions.nitems == sum(len(p) + 2 for p in polygons)
+
+    outline_offsets = np.cumsum([0, *[len(p) + 2 for p in polygons]])
+    for i, polygon in enumerate(polygons):
+        data = positions.data[outline_offsets[i] : outline_offsets[i + 1]]
+        npt.assert_almost_equal(data[:-2, :2], polygon)
+        npt.assert_almost_equal(data[-2, :2], polygon[0])
+        assert np.isnan(data[-1]).all()
+
+    # hidden polygons have no outline
+    positions._gfx_get_chunk_descriptions()
+    graphic.visibility[[2, 3]] = False
+    assert np.isnan(positions.data[outline_offsets[2] : outline_offsets[4]]).all()
+    assert not np.isnan(
+        positions.data[outline_offsets[4] : outline_offsets[5] - 1]
+    ).any()
+    assert sum(c[1] for c in positions._gfx_get_chunk_descriptions()) < positions.nitems
+
+    graphic.visibility = True
+    npt.assert_almost_equal(
+        positions.data[outline_offsets[2] : outline_offsets[3] - 2, :2], polygons[2]
+    )
+
+    graphic.alpha = 0.5
+    assert outline.material.opacity == 0.5
+
+    # no outline by default
+    assert len(fpl.PolygonsGraphic(polygons).world_object.children) == 0
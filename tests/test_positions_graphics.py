@@ -9,6 +9,7 @@ from fastplotlib.graphics.features import (
     VertexPositions,
     VertexColors,
     VertexCmap,
+    VertexCmapTexture,
     UniformColor,
     UniformSize,
     VertexPointSizes,
@@ -441,3 +442,91 @@ def test_size_space(graphic_type, size_space):
 
 if __name__ == "__main__":
     test_cmap("scatter", None, False, "jet", None)
+
+
+@pytest.mark.parametrize("graphic_type", [fpl.LineGraphic, fpl.ScatterGraphic])
+@pytest.mark.parametrize(
+    "cmap_transform", [None, [3, 5, 2, 1, 0, 6, 9, 7, 4, 8], np.random.rand(10)]
+)
+def test_cmap_texture_mode(graphic_type, cmap_transform):
+    data = generate_positions_spiral_data("xy")
+
+    graphic = graphic_type(
+        data, cmap="jet", cmap_transform=cmap_transform, cmap_mode="texture"
+    )
+
+    assert graphic.cmap_mode == "texture"
+    assert isinstance(graphic._cmap, VertexCmapTexture)
+    assert graphic.colors is None
+
+    # one float32 per vertex
+    assert graphic.cmap.buffer.data.dtype == np.float32
+    assert graphic.cmap.buffer.data.shape == (10,)
+    assert graphic.world_object.geometry.texcoords is graphic.cmap.buffer
+    assert graphic.world_object.material.color_mode == "vertex_map"
+    assert graphic.world_object.material.map is graphic.cmap.texture_map
+
+    def sampled_indices():
+        # texel index that the shader samples with nearest filtering, using the transform in the uniform
+        # buffer of the TextureMap, which is what the shader uses, the texcoords are 1D
+        texture_map = graphic.cmap.texture_map
+        transform = texture_map.uniform_buffer.data["transform"]
+        uv = graphic.cmap.value * transform[0, 0] + transform[2, 0]
+        return np.floor(uv * texture_map.texture.size[0]).astype(int)
+
+    if cmap_transform is None:
+        cmap_transform = np.arange(10)
+
+    # should match the colors computed on the CPU, up to rounding to the nearest LUT color
+    expected = (fpl.utils.normalize_min_max(np.asarray(cmap_transform)) * 255).astype(
+        int
+    )
+    assert np.abs(sampled_indices() - expected).max() <= 1
+
+    # changing the cmap only swaps the shared texture
+    buffer_rev = graphic.cmap.buffer._rev
+    graphic.cmap = "viridis"
+    assert graphic.cmap.name == "viridis"
+    assert graphic.cmap.texture_map.texture is fpl.utils.get_cmap_texture("viridis")
+    assert graphic.cmap.buffer._rev == buffer_rev
+
+    # changing the transform
+    new_transform = np.random.rand(10) * 100 - 50
+    graphic.cmap.transform = new_transform
+    npt.assert_almost_equal(graphic.cmap.transform, new_transform, decimal=5)
+    expected = (fpl.utils.normalize_min_max(new_transform) * 255).astype(int)
+    assert np.abs(sampled_indices() - expected).max() <= 1
+
+    # qualitative cmaps use the transform values as indices
+    graphic.cmap.transform = np.arange(10)
+    graphic.cmap = "tab10"
+    npt.assert_equal(sampled_indices(), np.arange(10))
+
+    with pytest.raises(AttributeError):
+        graphic.colors = "r"
+
+    with pytest.raises(TypeError):
+        graphic.cmap[2:5] = "jet"
+
+
+@pytest.mark.parametrize("graphic_type", [fpl.LineGraphic, fpl.ScatterGraphic])
+def test_cmap_texture_mode_args(graphic_type):
+    data = generate_positions_spiral_data("xy")
+
+    with pytest.raises(TypeError):
+        graphic_type(data, cmap_mode="texture")
+
+    with pytest.raises(TypeError):
+        graphic_type(data, cmap="jet", uniform_color=True, cmap_mode="texture")
+
+    with pytest.raises(ValueError):
+        graphic_type(data, cmap="jet", cmap_mode="gpu")
+
+    with pytest.raises(ValueError):
+        graphic_type(data, cmap="jet", cmap_transform=[0, 1], cmap_mode="texture")
+
+    # qualitative cmaps require int transforms
+    with pytest.raises(TypeError):
+        graphic_type(
+            data, cmap="tab10", cmap_transform=np.random.rand(10), cmap_mode="texture"
+        )
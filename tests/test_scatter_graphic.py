@@ -70,6 +70,37 @@ def test_uniform_markers(marker):
     check_event(scatter, "markers", pygfx.MarkerShape.circle)
 
 
+@pytest.mark.parametrize(
+    "marker,marker_name",
+    [(pygfx.MarkerInt.heart, "heart"), (np.int32(pygfx.MarkerInt.ring), "ring")],
+)
+def test_uniform_marker_int(marker, marker_name):
+    fig = fpl.Figure()
+
+    data = generate_positions_spiral_data("xyz")
+
+    scatter = fig[0, 0].add_scatter(data, markers=marker, uniform_marker=True)
+
+    assert isinstance(scatter._markers, UniformMarker)
+    assert scatter.markers == marker_name
+    assert scatter.world_object.material.marker == marker_name
+
+    # test changes and event
+    scatter.add_event_handler(event_handler, "markers")
+    scatter.markers = pygfx.MarkerInt.square
+    assert scatter.markers == pygfx.MarkerShape.square
+    assert scatter.world_object.material.marker == pygfx.MarkerShape.square
+
+    check_event(scatter, "markers", pygfx.MarkerShape.square)
+
+    # bool is not a marker code
+    with pytest.raises(TypeError):
+        scatter.markers = True
+
+    with pytest.raises(TypeError):
+        fig[0, 0].add_scatter(data, markers=True, uniform_marker=True)
+
+
 @pytest.mark.parametrize("to_type", [list, tuple, np.array])
 @pytest.mark.parametrize("uniform_marker", [True, False])
 def test_incompatible_marker_args(to_type, uniform_marker):
@@ -0,0 +1,70 @@
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+
+
+def make_surface(shape=(30, 40)):
+    y, x = np.mgrid[: shape[0], : shape[1]]
+    return (np.sin(x / 5) * np.cos(y / 5)).astype(np.float32)
+
+
+def test_set_data_same_shape():
+    z = make_surface()
+    graphic = fpl.SurfaceGraphic(z, mode="basic", cmap="viridis", clim=(-1, 1))
+
+    positions = graphic.world_object.geometry.positions
+    indices_buffer = graphic.world_object.geometry.indices
+    indices = graphic.indices.value.copy()
+    mapcoords = graphic._mapcoords
+
+    # clear chunks from creation
+    positions._gfx_get_chunk_descriptions()
+    mapcoords._gfx_get_chunk_descriptions()
+
+    new_z = z.copy()
+    new_z[10:13] = 0.5
+
+    events = list()
+    graphic.add_event_handler(lambda ev: events.append(ev), "data")
+
+    graphic.data = new_z
+
+    npt.assert_almost_equal(graphic.data, new_z)
+    npt.assert_almost_equal(positions.data[:, 2], new_z.ravel())
+    npt.assert_almost_equal(mapcoords.data, (new_z.ravel() + 1) / 2)
+
+    # indices are not touched
+    assert graphic.world_object.geometry.indices is indices_buffer
+    npt.assert_equal(graphic.indices.value, indices)
+
+    # only the changed rows are uploaded
+    for buffer in [positions, mapcoords]:
+        chunks = buffer._gfx_get_chunk_descriptions()
+        assert chunks[0][0] <= 10 * 40
+        assert sum(c[1] for c in chunks) < buffer.nitems
+
+    assert len(events) == 1
+
+    # unchanged data, nothing is uploaded
+    graphic.data = new_z.copy()
+    assert len(positions._gfx_get_chunk_descriptions()) == 0
+
+    # data modified in place
+    graphic.data[0] = -1
+    graphic.data = graphic.data
+    npt.assert_almost_equal(positions.data[:40, 2], -1)
+
+
+def test_set_data_xyz():
+    z = make_surface()
+    y, x = np.mgrid[:30, :40]
+    data = np.dstack([x, y, z]).astype(np.float32)
+
+    graphic = fpl.SurfaceGraphic(data)
+
+    new_data = data.copy()
+    new_data[5, 5] = [100, 200, 300]
+    graphic.data = new_data
+
+    npt.assert_almost_equal(graphic.positions.value, new_data.reshape(-1, 3))
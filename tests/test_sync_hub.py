@@ -0,0 +1,145 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+
+
+def make_figure():
+    fig = fpl.Figure(shape=(2, 2), canvas="offscreen", size=(400, 400))
+
+    images = list()
+    for subplot in fig:
+        images.append(subplot.add_image(np.random.rand(10, 10)))
+
+    return fig, images
+
+
+def test_feature_links():
+    fig, images = make_figure()
+    hub = fpl.SyncHub()
+
+    # chain with a diamond: 0 -> 1 -> 3, 0 -> 2 -> 3
+    hub.link((images[0], "vmin"), (images[1], "vmin"), transform=lambda v: v + 1)
+    hub.link((images[0], "vmin"), (images[2], "vmin"))
+    hub.link((images[1], "vmin"), (images[3], "vmin"))
+    hub.link((images[2], "vmin"), (images[3], "vmin"))
+
+    # the flush is added to the figure's render cycle
+    assert hub.flush in fig.animations["pre"]
+
+    events = {i: list() for i in range(4)}
+    for i, image in enumerate(images):
+        image.add_event_handler(
+            lambda ev, i=i: events[i].append(ev.info["value"]), "vmin"
+        )
+
+    # changes are deferred and coalesced until the flush
+    images[0].vmin = 0.1
+    images[0].vmin = 0.2
+    assert images[1].vmin != 1.2
+    hub.flush()
+
+    npt.assert_almost_equal(images[1].vmin, 1.2)
+    npt.assert_almost_equal(images[2].vmin, 0.2)
+
+    # updated once, after both of its sources, in topological order
+    assert len(events[3]) == 1
+    npt.assert_almost_equal(images[3].vmin, 0.2)
+
+    # nothing pending
+    hub.flush()
+    assert len(events[3]) == 1
+
+    # a changed target is not overwritten in the same frame
+    images[0].vmin = 0.3
+    images[2].vmin = 0.5
+    hub.flush()
+    npt.assert_almost_equal(images[1].vmin, 1.3)
+    npt.assert_almost_equal(images[2].vmin, 0.5)
+
+    with pytest.raises(KeyError):
+        hub.link((images[0], "not_a_feature"), (images[1], "vmin"))
+
+    with pytest.raises(TypeError):
+        hub.link(images[0], images[1])
+
+
+def test_bidirectional():
+    fig, images = make_figure()
+    hub = fpl.SyncHub()
+
+    # cycle 0 -> 1 -> 2 -> 0, and 0 <-> 3
+    hub.link((images[0], "vmax"), (images[1], "vmax"))
+    hub.link((images[1], "vmax"), (images[2], "vmax"))
+    hub.link((images[2], "vmax"), (images[0], "vmax"))
+    hub.link(
+        (images[0], "vmax"),
+        (images[3], "vmax"),
+        transform=lambda v: v * 2,
+        bidirectional=True,
+        inverse=lambda v: v / 2,
+    )
+
+    n_events = list()
+    images[0].add_event_handler(lambda ev: n_events.append(ev), "vmax")
+
+    images[3].vmax = 4
+    hub.flush()
+
+    for image in images[:3]:
+        npt.assert_almost_equal(image.vmax, 2)
+
+    # updated once, the cycle does not ping pong
+    assert len(n_events) == 1
+    hub.flush()
+    assert len(n_events) == 1
+
+    with pytest.raises(ValueError):
+        hub.link(
+            (images[1], "vmin"),
+            (images[2], "vmin"),
+            transform=lambda v: v,
+            bidirectional=True,
+        )
+
+    hub.unlink((images[0], "vmax"), (images[3], "vmax"), bidirectional=True)
+    images[3].vmax = 10
+    hub.flush()
+    npt.assert_almost_equal(images[0].vmax, 2)
+
+    hub.remove((images[0], "vmax"))
+    assert hub.links == [(images[1], images[2])]
+
+    hub.clear()
+    assert hub.links == []
+    assert hub.flush not in fig.animations["pre"]
+
+
+def test_cameras_and_selectors():
+    fig, images = make_figure()
+    hub = fpl.SyncHub()
+
+    hub.link(fig[0, 0], fig[0, 1], bidirectional=True)
+
+    fig[0, 1].camera.world.x = 5
+    hub.flush()
+    npt.assert_almost_equal(fig[0, 0].camera.world.x, 5)
+
+    fig[0, 0].camera.zoom = 2
+    hub.flush()
+    npt.assert_almost_equal(fig[0, 1].camera.zoom, 2)
+
+    # no change, nothing is polled as changed
+    hub.flush()
+    assert len(hub._dirty) == 0
+
+    selector = images[0].add_linear_selector(axis="x")
+    selector2 = images[1].add_linear_selector(axis="x")
+    hub.link(selector, selector2, transform=lambda x: x + 1)
+    hub.link(selector, (images[2], "vmax"))
+
+    selector.selection = 3
+    hub.flush()
+    assert selector2.selection == 4
+    assert images[2].vmax == 3
@@ -0,0 +1,63 @@
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+
+
+def check_background(textbox: fpl.TextBox):
+    # background and outline fit the text with padding
+    text_bbox = textbox._text.get_world_bounding_box()
+    padding = textbox.padding
+
+    expected = text_bbox[:, :2] + [-padding, padding]
+
+    # pygfx caches the bounding box of a geometry until it is uploaded, use the buffer data
+    offset = textbox._fpl_world_object.local.position[:2]
+    for world_object in [textbox._plane, textbox._line]:
+        positions = world_object.geometry.positions.data[:, :2]
+        npt.assert_almost_equal(
+            np.stack([positions.min(axis=0), positions.max(axis=0)]) + offset,
+            expected,
+            decimal=4,
+        )
+
+
+def test_display():
+    textbox = fpl.TextBox(padding=(4, 6))
+    npt.assert_equal(textbox.padding, [4, 6])
+
+    set_text_calls = list()
+    set_text = textbox._text.set_text
+    textbox._text.set_text = lambda text: (set_text_calls.append(text), set_text(text))
+
+    textbox.display((100, 50), "some info")
+    assert textbox.visible
+    npt.assert_equal(textbox.position, [100, 50])
+    check_background(textbox)
+
+    # text is at the top right of the position, y is flipped
+    npt.assert_almost_equal(textbox._fpl_world_object.local.position, [108, -42, 0])
+
+    # only the position changes, no new text layout
+    textbox.display((200, 10), "some info")
+    check_background(textbox)
+    assert set_text_calls == ["some info"]
+
+    textbox.clear()
+    assert not textbox.visible
+    textbox.display((200, 10), "some info")
+    assert set_text_calls == ["some info"]
+
+    # new text
+    textbox.display((200, 10), "some other\ninfo")
+    check_background(textbox)
+    assert set_text_calls == ["some info", "some other\ninfo"]
+
+    # font size and padding change the layout
+    width = np.ptp(textbox._plane.geometry.positions.data[:, 0])
+    textbox.font_size = 24
+    check_background(textbox)
+    assert np.ptp(textbox._plane.geometry.positions.data[:, 0]) > width
+
+    textbox.padding = (10, 10)
+    check_background(textbox)
@@ -8,7 +8,6 @@ import fastplotlib as fpl
 from fastplotlib.graphics.features import TextureArrayVolume
 from fastplotlib.graphics.image_volume import _VolumeTile
 
-
 MAX_TEXTURE_SIZE_3D = 128
 
 
@@ -204,3 +203,173 @@ def test_high_cols(test_graphic):
         check_image_graphic(ta, graphic)
 
     check_set_slice(data, ta, slice(2, 7), slice(60, 90), slice(100, 180))
+
+
+def make_sparse_data() -> np.ndarray:
+    # background of 0 with 2 blobs
+    data = np.zeros((40, 50, 60), dtype=np.float32)
+    data[2:10, 5:12, 3:9] = 1
+    data[34:40, 40:48, 50:55] = 3
+    return data
+
+
+def test_bricks():
+    data = make_sparse_data()
+    ta = TextureArrayVolume(data, brick_size=16, empty_threshold=0)
+
+    assert ta.brick_size == 16
+    assert ta.buffer.shape == (3, 4, 4)
+    npt.assert_array_equal(ta.row_indices, [0, 16, 32, 48])
+
+    for texture, chunk_index, data_slice in ta:
+        chunk = data[data_slice]
+        assert ta.brick_min[chunk_index] == chunk.min()
+        assert ta.brick_max[chunk_index] == chunk.max()
+
+        # only bricks that contain the blobs are uploaded
+        if chunk.max() > 0:
+            assert isinstance(texture, pygfx.Texture)
+            npt.assert_almost_equal(texture.data, data[ta.texture_slice(data_slice)])
+        else:
+            assert texture is None
+
+    assert (~ta.empty).sum() == 2
+
+    # brick becomes non-empty
+    ta[20, 20, 20] = 2
+    assert isinstance(ta.buffer[1, 1, 1], pygfx.Texture)
+    assert ta.brick_max[1, 1, 1] == 2
+    assert (~ta.empty).sum() == 3
+
+    # bricks larger than the texture limit are chunked at the limit
+    ta = TextureArrayVolume(make_data(10, 20, 300), brick_size=1000)
+    assert ta.buffer.shape == (1, 1, 3)
+
+
+def test_bricks_ellipsis_and_masks():
+    data = np.ones((10, 40, 40), dtype=np.float32)
+    ta = TextureArrayVolume(data, brick_size=16)
+    assert ta.buffer.shape == (1, 3, 3)
+
+    # the ellipsis expands to the first two dims
+    for k, v in [(0, 5), (39, 6)]:
+        ta[..., k] = v
+
+        chunk_col = k // 16
+        npt.assert_array_equal(ta.brick_max[:, :, chunk_col], v)
+
+        for texture, chunk_index, data_slice in ta:
+            npt.assert_almost_equal(
+                texture.data, ta.value[ta.texture_slice(data_slice)]
+            )
+
+    npt.assert_array_equal(ta.brick_max[:, :, 1], 1)
+
+    # bool mask
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[5, 20, 20] = True
+    ta[mask] = 7
+    assert ta.brick_max[0, 1, 1] == 7
+
+    for texture, chunk_index, data_slice in ta:
+        npt.assert_almost_equal(texture.data, ta.value[ta.texture_slice(data_slice)])
+
+
+def test_brick_apron():
+    data = make_data(10, 40, 40)
+    ta = TextureArrayVolume(data, brick_size=16)
+
+    # the textures overlap their neighbors by one voxel
+    assert ta.apron == 1
+    assert ta.texture_slice((slice(0, 10), slice(16, 32), slice(32, 40))) == (
+        slice(0, 10),
+        slice(15, 33),
+        slice(31, 40),
+    )
+    assert ta.buffer[0, 1, 2].size == (9, 18, 10)
+
+    # setting the last row of a brick updates the apron of the next brick
+    ta[:, 15] = -1
+    npt.assert_almost_equal(ta.buffer[0, 1, 0].data[:, 0], -1)
+    assert ta.brick_min[0, 1, 0] == data[:, 16:32, :16].min()
+
+    for texture, chunk_index, data_slice in ta:
+        npt.assert_almost_equal(texture.data, ta.value[ta.texture_slice(data_slice)])
+
+    # only bricked volumes have an apron
+    ta = TextureArrayVolume(data)
+    assert ta.apron == 0
+    assert ta.texture_slice((slice(0, 10), slice(0, 40), slice(0, 40))) == (
+        slice(0, 10),
+        slice(0, 40),
+        slice(0, 40),
+    )
+
+
+def test_bricked_mip_blending():
+    data = make_sparse_data()
+
+    fig = fpl.Figure(cameras="3d")
+    graphic = fig[0, 0].add_image_volume(data, brick_size=16)
+
+    # each brick only ray-marches its own texture, the tiles are composed with max blending
+    material = graphic._material
+    assert graphic.mode == "mip"
+    assert material.alpha_config["method"] == "blended"
+    assert material.alpha_config["color_op"] == "max"
+    assert material.alpha_config["alpha_op"] == "max"
+    assert material.depth_write is False
+
+    # tiles are placed at the start of their texture, including the apron
+    for tile in graphic.world_object.children:
+        z, row, col = tile.data_slice
+        npt.assert_almost_equal(tile.world.position, (col.start, row.start, z.start))
+        assert tile.geometry.grid.size == (
+            col.stop - col.start,
+            row.stop - row.start,
+            z.stop - z.start,
+        )
+
+    # other modes use the default blending
+    graphic.mode = "iso"
+    assert graphic._material.alpha_mode == "auto"
+    assert graphic._material.depth_write
+
+    graphic.mode = "mip"
+    assert graphic._material.alpha_config["color_op"] == "max"
+    assert graphic._material.depth_write is False
+
+    # volumes that are not bricked are a single tile
+    graphic = fig[0, 0].add_image_volume(data)
+    assert graphic._material.alpha_mode == "auto"
+    assert graphic._material.depth_write
+
+
+def test_brick_culling():
+    data = make_sparse_data()
+
+    fig = fpl.Figure(cameras="3d")
+    graphic = fig[0, 0].add_image_volume(
+        data, mode="iso", threshold=2, brick_size=16, empty_threshold=0
+    )
+
+    # no tiles for the empty bricks
+    assert len(graphic.world_object.children) == 2
+    visible = [tile.visible for tile in graphic.world_object.children]
+    assert sum(visible) == 1
+    assert graphic.visible_bricks.sum() == 1
+
+    graphic.threshold = 0.5
+    assert all(tile.visible for tile in graphic.world_object.children)
+
+    graphic.mode = "mip"
+    graphic.vmin = 1
+    assert graphic.visible_bricks.sum() == 1
+
+    # new tile for a brick that is no longer empty
+    graphic.data[20, 20, 20] = 2
+    assert len(graphic.world_object.children) == 3
+    assert graphic.visible_bricks.sum() == 2
+
+    for tile in graphic.world_object.children:
+        assert tile.material is graphic._material
@@ -0,0 +1,104 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.utils.triangulation import triangulate, faces_are_valid
+
+
+def star(n: int, lobes: int = 7, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    r = 1 + 0.3 * np.sin(lobes * t) + 0.1 * rng.random(n)
+    return np.column_stack([r * np.cos(t), r * np.sin(t)]).astype(np.float32)
+
+
+def comb(n_teeth: int = 5) -> np.ndarray:
+    # non-convex polygon with collinear vertices
+    top = list()
+    for i in range(n_teeth, 0, -1):
+        top += [[2 * i, 3], [2 * i, 1], [2 * i - 1, 1], [2 * i - 1, 3]]
+    return np.array([[0, 0], [2 * n_teeth + 1, 0], [2 * n_teeth + 1, 3], *top, [0, 3]])
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        star(10),
+        star(500),
+        star(3000, lobes=50),
+        star(200)[::-1],  # clockwise
+        np.array([[0, 0], [1, 0], [2, 0], [2, 2], [1, 2], [0, 2], [0, 1]]),
+        comb(),
+        # convex
+        np.column_stack(
+            [np.cos(np.linspace(0, 6, 100)), np.sin(np.linspace(0, 6, 100))]
+        ),
+    ],
+)
+def test_triangulate(polygon):
+    faces = triangulate(polygon)
+
+    assert faces.shape == (len(polygon) - 2, 3)
+    assert faces.dtype == np.int32
+    assert faces_are_valid(polygon, faces)
+
+    # same as mapbox earcut
+    assert faces_are_valid(polygon, triangulate(polygon, method="earcut"))
+
+
+def test_faces_are_valid():
+    polygon = star(100)
+    faces = triangulate(polygon)
+
+    # overlapping faces
+    assert not faces_are_valid(polygon, np.roll(faces, 1, axis=0)[::-1] % 50)
+    assert not faces_are_valid(polygon, faces[:-1])
+
+    # overlapping faces with the orientation of the polygon whose areas sum to the polygon area
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    assert faces_are_valid(square, [[0, 1, 2], [0, 2, 3]])
+    assert faces_are_valid(square, [[0, 2, 1], [0, 3, 2]])
+    assert not faces_are_valid(square, [[0, 1, 2], [0, 1, 2]])
+    assert not faces_are_valid(square, [[0, 1, 3], [0, 1, 2]])
+
+    # moving vertices slightly keeps the triangulation valid
+    moved = polygon * 1.1 + 0.01
+    assert faces_are_valid(moved, faces)
+    assert triangulate(moved, reuse=faces) is faces
+
+    # mirrored polygon
+    assert faces_are_valid(polygon * [-1, 1], faces)
+
+    # folding a lobe over breaks it
+    folded = polygon.copy()
+    folded[10] = -folded[10] * 3
+    assert not faces_are_valid(folded, faces)
+    new_faces = triangulate(folded, reuse=faces)
+    assert new_faces is not faces
+
+
+def test_polygon_graphic_reuse():
+    data = star(200)
+    polygon = fpl.PolygonGraphic(data)
+
+    geometry = polygon.world_object.geometry
+    npt.assert_almost_equal(polygon.data[:, :2], data)
+
+    polygon.data = data * 2
+    indices = polygon._data._indices
+    npt.assert_almost_equal(polygon.data[:, :2], data * 2)
+    npt.assert_equal(geometry.positions.data[:200, :2], data * 2)
+    assert faces_are_valid(data, geometry.indices.data[:198])
+
+    # same topology, indices are reused and not uploaded
+    geometry.indices._gfx_get_chunk_descriptions()
+    polygon.data = data * 3
+    assert polygon._data._indices is indices
+    assert len(geometry.indices._gfx_get_chunk_descriptions()) == 0
+
+    # different number of vertices
+    polygon.data = star(50)
+    assert geometry.positions.draw_range == (0, 50)
+    assert geometry.indices.draw_range == (0, 48)
+    assert faces_are_valid(star(50), geometry.indices.data[:48])
@@ -0,0 +1,110 @@
+import numpy as np
+from numpy import testing as npt
+import pylinalg as la
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import VectorPositions, VectorDirections
+
+
+def make_vectors(n: int = 100):
+    rng = np.random.default_rng(0)
+    positions = rng.normal(size=(n, 3)).astype(np.float32)
+    directions = rng.normal(size=(n, 3)).astype(np.float32)
+
+    # parallel, anti-parallel and zero length directions
+    directions[0] = [0, 0, 2]
+    directions[1] = [0, 0, -1]
+    directions[2] = 0
+
+    return positions, directions
+
+
+def expected_transforms(positions, directions):
+    transforms = list()
+    for p, d in zip(positions, directions):
+        rotation = la.quat_from_vecs(VectorDirections.init_direction, d)
+        transforms.append(la.mat_compose(p, rotation, np.linalg.norm(d)).T)
+
+    return np.stack(transforms)
+
+
+def check_transforms(graphic: fpl.VectorsGraphic):
+    npt.assert_almost_equal(
+        graphic.world_object.instance_buffer.data["matrix"],
+        expected_transforms(graphic.positions.value, graphic.directions.value),
+        decimal=5,
+    )
+
+
+def test_create_vectors():
+    positions, directions = make_vectors()
+    graphic = fpl.VectorsGraphic(positions, directions)
+
+    assert isinstance(graphic.positions, VectorPositions)
+    assert isinstance(graphic.directions, VectorDirections)
+
+    npt.assert_almost_equal(graphic.positions.value, positions)
+    npt.assert_almost_equal(graphic.directions.value, directions)
+    check_transforms(graphic)
+
+
+def test_set_all():
+    positions, directions = make_vectors()
+    graphic = fpl.VectorsGraphic(positions, directions)
+
+    events = list()
+    graphic.add_event_handler(lambda ev: events.append(ev), "positions", "directions")
+
+    graphic.positions = positions + 1
+    graphic.directions = directions * 2
+
+    npt.assert_almost_equal(graphic.positions.value, positions + 1)
+    npt.assert_almost_equal(graphic.directions.value, directions * 2)
+    check_transforms(graphic)
+
+    assert [ev.type for ev in events] == ["positions", "directions"]
+    assert events[0].info["key"] == slice(None)
+
+    # 2D sets x and y
+    graphic.positions = positions[:, :2]
+    npt.assert_almost_equal(graphic.positions[:, :2], positions[:, :2])
+    npt.assert_almost_equal(graphic.positions[:, 2], positions[:, 2] + 1)
+    check_transforms(graphic)
+
+    with pytest.raises(ValueError):
+        graphic.directions = directions[:10]
+
+
+@pytest.mark.parametrize(
+    "key", [slice(10, 30), 5, np.array([3, 40, 41]), np.arange(100) > 80]
+)
+def test_set_partial(key):
+    positions, directions = make_vectors()
+    graphic = fpl.VectorsGraphic(positions, directions)
+    buffer = graphic.world_object.instance_buffer
+
+    # clear chunks from creation
+    buffer._gfx_get_chunk_descriptions()
+
+    n = np.arange(100)[key].size
+    new_directions = np.full((n, 3), 0.5, dtype=np.float32).squeeze()
+    new_positions = np.full((n, 2), 2.0, dtype=np.float32).squeeze()
+
+    graphic.directions[key] = new_directions
+    graphic.positions[key] = new_positions
+
+    npt.assert_almost_equal(graphic.directions[key], new_directions)
+    npt.assert_almost_equal(graphic.positions[key][..., :2], new_positions)
+    check_transforms(graphic)
+
+    # only the modified range is uploaded
+    chunks = buffer._gfx_get_chunk_descriptions()
+    indices = np.arange(100)[key]
+    assert chunks[0][0] <= indices.min()
+    assert sum(c[1] for c in chunks) < 100
+
+    # set a single component
+    graphic.positions[key, 2] = 5.0
+    npt.assert_almost_equal(graphic.positions[key][..., 2], 5.0)
+    check_transforms(graphic)